@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for class AdmissionController, class for capping the jobs in flight per media agent or storage policy.
+
+AdmissionController is the only class defined in this file.
+
+AdmissionController: Represents the slots of the backup targets (media agents or storage policies) of a fan-out.
+The jobs are queued per target & a job is started on the executor only when its target has a free slot, so no
+thread is held waiting for a full target while the jobs of the other targets can start. The slots of a full target
+are freed by polling the status of its jobs, so the submissions go out as the jobs of the target finish instead of
+queueing on the media agent.
+
+AdmissionController:
+    __init__()      --  Initializes the controller with the maximum number of jobs in flight per target.
+    submit()        --  Queues the start of a job on its target, without waiting for a free slot.
+    drain()         --  Waits until every queued job is started, polling the jobs of the full targets.
+    _dispatch()     --  Starts the queued jobs of the targets with a free slot on the executor.
+    _start()        --  Starts a job & frees the next slot of its target when the start fails.
+    _refresh()      --  Frees the slots of the finished jobs of the target.
+
+"""
+
+import threading
+from collections import (
+    defaultdict,
+    deque
+)
+from concurrent.futures import Future
+from time import monotonic
+
+ADMISSION_POLL_INTERVAL = 30
+
+
+class AdmissionController:
+    """Class representing the slots of the backup targets of a fan-out."""
+
+    def __init__(self, job_manager, limit, executor, poll_interval=ADMISSION_POLL_INTERVAL):
+        """Initializes the controller with the maximum number of jobs in flight per target.
+
+            Args:
+                job_manager     (object)    --  JobManager of the Commcell, used to poll the jobs in flight.
+
+                limit           (int)       --  Maximum number of jobs in flight per target.
+
+                executor        (object)    --  Executor the jobs are started on.
+
+                poll_interval   (int)       --  Seconds between the polls of the jobs of a full target.
+                    default :   ADMISSION_POLL_INTERVAL
+
+        """
+        self.job_manager = job_manager
+        self.limit = max(1, limit)
+        self.executor = executor
+        self.poll_interval = poll_interval
+        self._queues = defaultdict(deque)
+        self._jobs = defaultdict(set)
+        self._starting = defaultdict(int)
+        self._pending = 0
+        self._refreshed = {}
+        self._condition = threading.Condition()
+
+    def submit(self, target, start):
+        """Queues the start of a job on its target & returns at once, the job is started on the executor once its
+        target has a free slot.
+
+            Args:
+                target  (str)       --  Name of the target of the job, e.g. the storage policy of the subclient.
+
+                start   (callable)  --  Starts the job & returns its ID.
+
+            Returns:
+                Future - resolved with the ID of the job, or the exception raised by start.
+
+        """
+        future = Future()
+        with self._condition:
+            self._queues[target].append((start, future))
+            self._pending += 1
+
+        self._dispatch()
+        return future
+
+    def drain(self):
+        """Waits until every queued job is started, the jobs of the targets with queued jobs are polled once per
+        interval to free their slots. Only the calling thread waits, the executor threads only start jobs.
+
+        """
+        while True:
+            with self._condition:
+                if not self._pending:
+                    return
+                waiting = [target for target, queue in self._queues.items() if queue]
+
+            for target in waiting:
+                self._refresh(target)
+            self._dispatch()
+
+            with self._condition:
+                if self._pending:
+                    self._condition.wait(self.poll_interval)
+
+    def _dispatch(self):
+        """Starts the queued jobs of the targets with a free slot on the executor, in the order they were queued."""
+        ready = []
+        with self._condition:
+            for target, queue in self._queues.items():
+                while queue and len(self._jobs[target]) + self._starting[target] < self.limit:
+                    self._starting[target] += 1
+                    ready.append((target,) + queue.popleft())
+
+        for target, start, future in ready:
+            self.executor.submit(self._start, target, start, future)
+
+    def _start(self, target, start, future):
+        """Starts a job, the slot of a job which failed to start goes to the next job queued on the target."""
+        try:
+            job_id = start()
+        except BaseException as e:
+            with self._condition:
+                self._starting[target] -= 1
+                self._pending -= 1
+                self._condition.notify_all()
+            future.set_exception(e)
+            self._dispatch()
+            return
+
+        with self._condition:
+            self._starting[target] -= 1
+            self._jobs[target].add(int(job_id))
+            self._pending -= 1
+            self._condition.notify_all()
+        future.set_result(job_id)
+
+    def _refresh(self, target):
+        """Frees the slots of the finished jobs of the target, the jobs of a target are polled once per interval.
+        A job which can't be queried no longer holds its slot.
+
+        """
+        with self._condition:
+            if not self._jobs[target] or monotonic() - self._refreshed.get(target, float('-inf')) < self.poll_interval:
+                return
+
+            self._refreshed[target] = monotonic()
+            job_ids = list(self._jobs[target])
+
+        statuses, _ = self.job_manager.get_statuses(job_ids, incomplete_only=True)
+
+        with self._condition:
+            self._jobs[target] -= set(job_ids) - set(statuses)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Helper file for the atomic writes & the locks of the files shared by the tasks of a user.
+
+    atomic_write()  --  Context manager writing a file atomically, readers never see a partially written file.
+    locked()        --  Context manager holding an exclusive lock on a lock file.
+
+"""
+
+import fcntl
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_write(path, mode=None):
+    """Context manager yielding a file opened for writing, renamed over the given path once the block completes.
+
+        The file is a temporary file in the directory of the path, readable & writable by the owner only unless a
+        mode is given. If the block raises, the temporary file is removed & the path is left untouched.
+
+        Args:
+            path    (str)   --  Path of the file written.
+
+            mode    (int)   --  Permissions of the file, e.g. stat.S_IRWXU.
+                default :   None
+
+        Yields:
+            file - text file the content is written to.
+
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=f".{name}.", dir=directory)
+    try:
+        if mode is not None:
+            os.fchmod(fd, mode)
+        with os.fdopen(fd, 'w') as fh:
+            yield fh
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+@contextmanager
+def locked(lock_path):
+    """Context manager holding an exclusive fcntl lock on the given lock file, created if needed.
+
+        Args:
+            lock_path   (str)   --  Path of the lock file.
+
+    """
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, stat.S_IRUSR | stat.S_IWUSR)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for class BackupBrowser, class for streaming the backed up tree of a subclient.
+
+BackupBrowser is the only class defined in this file.
+
+BackupBrowser: Represents the browse of the backed up content of a subclient at a point in time. The folders are
+browsed page by page & the items are yielded as they are received, the tree is never held in memory. The listing of
+a folder at a fixed point in time is cached on disk, repeated browses of the same point in time are served from the
+cache. The cached listings of the points in time not browsed within the cache TTL are removed when a browse starts.
+
+BackupBrowser:
+    __init__()        --  Initializes the browser for the given subclient & point in time.
+    walk()            --  Yields the items under the given path, down to the given depth.
+    list_folder()     --  Yields the items of a folder, from the cache or page by page from the server.
+    _browse_pages()   --  Yields the items of a folder page by page from the server.
+    _parse_item()     --  Returns the item of a browse result.
+    _cache_path()     --  Returns the path of the cached listing of a folder.
+    _read_cache()     --  Yields the items of the cached listing of a folder.
+    _evict_expired()  --  Removes the cached listings of the points in time not browsed within the cache TTL.
+
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+from time import time
+
+from .atomic_file import atomic_write
+from .login.session_registry import (
+    SESSION_DIR,
+    SessionRegistry
+)
+
+BROWSE_CACHE_DIR = os.path.join(SESSION_DIR, "browse")
+BROWSE_CACHE_TTL = 3600
+BROWSE_PAGE_SIZE = 1000
+
+
+class BackupBrowser:
+    """Class representing the browse of the backed up content of a subclient at a point in time."""
+
+    def __init__(self, subclient, from_time=0, to_time=0, page_size=BROWSE_PAGE_SIZE, cache_ttl=BROWSE_CACHE_TTL,
+                 cache_dir=BROWSE_CACHE_DIR):
+        """Initializes the browser for the given subclient & point in time.
+
+            Args:
+                subclient   (object)    --  Subclient object.
+
+                from_time   (int/str)   --  Start of the time range, Epoch time or %Y-%m-%d %H:%M:%S timestamp.
+                    default :   0
+
+                to_time     (int/str)   --  Point in time browsed, Epoch time or %Y-%m-%d %H:%M:%S timestamp, 0
+                browses the latest backup & is never cached.
+                    default :   0
+
+                page_size   (int)       --  Number of items requested per browse request.
+                    default :   BROWSE_PAGE_SIZE
+
+                cache_ttl   (int)       --  Seconds a cached listing is served, 0 disables the cache.
+                    default :   BROWSE_CACHE_TTL
+
+                cache_dir   (str)       --  Directory of the cached listings.
+                    default :   BROWSE_CACHE_DIR
+
+            Raises:
+                SDKException if a time is not in a supported format.
+
+        """
+        backupset = subclient._backupset_object
+        self.subclient = subclient
+        self.from_time = backupset._get_epoch_time(from_time or 0)
+        self.to_time = backupset._get_epoch_time(to_time or 0)
+        self.page_size = max(1, page_size)
+        self.cache_ttl = cache_ttl if self.to_time else 0
+        self.cache_dir = cache_dir
+        self.requests = 0
+        self.cached_folders = 0
+
+        # The listings of a point in time are kept together, keyed by the subclient & the time range.
+        key = '/'.join(str(part) for part in (
+            subclient._commcell_object.webconsole_hostname, subclient.subclient_id, self.from_time, self.to_time
+        ))
+        self.cache_key = hashlib.sha1(key.encode()).hexdigest()
+
+    def walk(self, path='\\', depth=1):
+        """Yields the items under the given path, the sub folders are browsed depth first down to the given depth.
+
+            Args:
+                path    (str)   --  Path of the folder the browse starts from.
+                    default :   '\\'
+
+                depth   (int)   --  Number of folder levels browsed, 1 yields the items of the folder only & 0 browses
+                the whole tree.
+                    default :   1
+
+            Yields:
+                dict - {'path', 'name', 'type', 'size', 'modified_time', 'backup_time', 'depth'}
+
+        """
+        self._evict_expired()
+
+        folders = [(path, 1)]
+        while folders:
+            folder, level = folders.pop()
+            sub_folders = []
+            for item in self.list_folder(folder):
+                item['depth'] = level
+                yield item
+                if item['type'] == 'Folder' and (depth <= 0 or level < depth):
+                    sub_folders.append((item['path'], level + 1))
+
+            # Reversed so that the folders are browsed in the order they were listed.
+            folders.extend(reversed(sub_folders))
+
+    def list_folder(self, path):
+        """Yields the items of a folder, from the cache or page by page from the server.
+
+            A listing received in full is written to the cache, a browse stopped midway caches nothing.
+
+            Args:
+                path    (str)   --  Path of the folder.
+
+            Yields:
+                dict - {'path', 'name', 'type', 'size', 'modified_time', 'backup_time'}
+
+        """
+        cache_path = self._cache_path(path)
+        if cache_path:
+            try:
+                if time() - os.stat(cache_path).st_mtime < self.cache_ttl:
+                    self.cached_folders += 1
+                    yield from self._read_cache(cache_path)
+                    return
+            except OSError:
+                pass
+
+        if not cache_path:
+            yield from self._browse_pages(path)
+            return
+
+        if os.path.dirname(self.cache_dir) == SESSION_DIR:
+            SessionRegistry().prepare()
+        for directory in (self.cache_dir, os.path.dirname(cache_path)):
+            os.makedirs(directory, stat.S_IRWXU, exist_ok=True)
+        with atomic_write(cache_path) as fh:
+            for item in self._browse_pages(path):
+                fh.write(json.dumps(item) + '\n')
+                yield item
+
+    def _browse_pages(self, path):
+        """Yields the items of a folder page by page from the server.
+
+            Raises:
+                SDKException if the browse fails.
+
+        """
+        from cvpysdk.exception import SDKException
+
+        skip_node = 0
+        while True:
+            _, response = self.subclient.browse(
+                path=path, from_time=self.from_time, to_time=self.to_time, page_size=self.page_size,
+                skip_node=skip_node, _raw_response=True
+            )
+            self.requests += 1
+
+            browse_result = None
+            for browse_response in response.get('browseResponses', []):
+                if 'browseResult' in browse_response:
+                    browse_result = browse_response['browseResult']
+                    if 'dataResultSet' in browse_result:
+                        break
+
+            if browse_result is None:
+                messages = (response.get('browseResponses') or [{}])[0].get('messages') or [{}]
+                if 'errorMessage' in messages[0]:
+                    raise SDKException('Subclient', '102', f"Failed to browse {path}: {messages[0]['errorMessage']}")
+                return
+
+            result_set = browse_result.get('dataResultSet') or []
+            if not isinstance(result_set, list):
+                result_set = [result_set]
+
+            for result in result_set:
+                yield self._parse_item(path, result)
+
+            skip_node += len(result_set)
+            total = int(browse_result.get('totalItemsFound', 0) or 0)
+            if len(result_set) < self.page_size or (total and skip_node >= total):
+                return
+
+    @staticmethod
+    def _parse_item(folder, result):
+        """Returns the item of a browse result, the times are Epoch times & 0 if not known."""
+        flags = result.get('flags', {})
+        name = result.get('displayName')
+        return {
+            'path': result.get('path') or '\\'.join([folder.rstrip('\\/'), name]),
+            'name': name,
+            'type': 'File' if flags.get('file') in (True, '1') else 'Folder',
+            'size': int(result.get('size', 0) or 0),
+            'modified_time': int(result.get('modificationTime', 0) or 0),
+            'backup_time': int(result.get('advancedData', {}).get('backupTime', 0) or 0)
+        }
+
+    def _cache_path(self, path):
+        """Returns the path of the cached listing of a folder, None if the cache is disabled."""
+        if self.cache_ttl <= 0:
+            return None
+
+        return os.path.join(self.cache_dir, self.cache_key, hashlib.sha1(path.encode()).hexdigest() + '.jsonl')
+
+    @staticmethod
+    def _read_cache(cache_path):
+        """Yields the items of the cached listing of a folder."""
+        with open(cache_path) as fh:
+            for line in fh:
+                yield json.loads(line)
+
+    def _evict_expired(self):
+        """Removes the cached listings of the points in time not browsed within the cache TTL, the listings written
+        by the browses with a longer cache TTL are kept for that TTL."""
+        ttl = max(self.cache_ttl, BROWSE_CACHE_TTL)
+        try:
+            entries = list(os.scandir(self.cache_dir))
+        except OSError:
+            return
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False) and time() - entry.stat().st_mtime >= ttl:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+            except OSError:
+                pass
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for class BackupHistory, class for the recent backup & restore jobs of a subclient.
+
+BackupHistory is the only class defined in this file.
+
+BackupHistory: Represents the finished backup & restore jobs of a subclient, read with a single request, older
+pages are read only to find the last full backup behind a long incremental chain. The statistics of the last jobs
+give the estimates of a backup or restore, reported in check mode without starting a job, & the backup level chosen
+by backup_level auto.
+
+BackupHistory:
+    __init__()          --  Initializes the history of the given subclient.
+    get_level()         --  Returns the backup level of a job summary.
+    backups()           --  Returns the successful backups, newest first, optionally of the given levels only.
+    restores()          --  Returns the successful restores, newest first.
+    estimate_backup()   --  Returns the estimated size, file count & duration of a backup of the given level.
+    estimate_restore()  --  Returns the estimated size, file count & duration of a restore of the subclient content.
+    choose_level()      --  Returns the backup level keeping the incremental chain short, from the age & change rate.
+    _last_full()        --  Returns the last successful full backup, reading older pages of the history if needed.
+    _read_page()        --  Reads the next page of the history.
+
+"""
+
+from time import time
+
+from .job_manager import JobManager
+
+HISTORY_JOB_TYPES = ['Backup', 'SYNTHFULL', 'Restore']
+HISTORY_LOOKUP_TIME = 24 * 30
+HISTORY_JOB_LIMIT = 100
+FULL_LEVELS = ('full', 'synthetic_full')
+
+# Thresholds of backup_level auto, ages in days & change rate as a fraction of the size of the last full backup.
+AUTO_FULL_AGE = 7
+AUTO_DIFFERENTIAL_AGE = 2
+AUTO_CHANGE_RATE = 0.5
+
+
+class BackupHistory:
+    """Class representing the recent backup & restore jobs of a subclient."""
+
+    def __init__(self, job_manager, subclient, lookup_time=HISTORY_LOOKUP_TIME, limit=HISTORY_JOB_LIMIT):
+        """Initializes the history of the given subclient, the first page of the jobs is read with a single request.
+
+            Args:
+                job_manager (object)    --  JobManager of the Commcell.
+
+                subclient   (object)    --  Subclient object.
+
+                lookup_time (int)       --  Hours the finished jobs are looked up for.
+                    default :   HISTORY_LOOKUP_TIME
+
+                limit       (int)       --  Number of jobs read per request.
+                    default :   HISTORY_JOB_LIMIT
+
+            Raises:
+                Exception if the jobs can't be read.
+
+        """
+        self.job_manager = job_manager
+        self.subclient = subclient
+        self.lookup_time = lookup_time
+        self.limit = max(1, limit)
+        self.jobs = []
+        self.read = 0
+        self.complete = False
+        self._read_page()
+
+    @staticmethod
+    def get_level(summary):
+        """Returns the backup level of a job summary in the form of the backup_level option, e.g. synthetic_full."""
+        return str(summary.get('backupLevelName') or '').strip().lower().replace(' ', '_')
+
+    def backups(self, levels=None):
+        """Returns the successful backups, newest first.
+
+            Args:
+                levels  (list)  --  Backup levels of the backups, all the levels if not given.
+                    default :   None
+
+            Returns:
+                list - summaries of the backups.
+
+        """
+        return [
+            summary for summary in self.jobs
+            if str(summary.get('jobType', '')).lower() != 'restore' and (not levels or self.get_level(summary) in levels)
+        ]
+
+    def restores(self):
+        """Returns the successful restores, newest first.
+
+            Returns:
+                list - summaries of the restores.
+
+        """
+        return [summary for summary in self.jobs if str(summary.get('jobType', '')).lower() == 'restore']
+
+    def estimate_backup(self, backup_level):
+        """Returns the estimated size, file count & duration of a backup of the given level, those of the last
+        backup of that level, or of the last backup of any level if there is none.
+
+            Args:
+                backup_level    (str)   --  Backup level, e.g. incremental.
+
+            Returns:
+                dict - {'backup_level': str, 'size': int, 'files': int, 'duration': int, 'job_id': int}, the values are
+                None if the subclient has no successful backup.
+
+        """
+        backups = self.backups([backup_level.lower()]) or self.backups()
+        estimate = {'backup_level': backup_level, 'size': None, 'files': None, 'duration': None, 'job_id': None}
+        if backups:
+            last = backups[0]
+            estimate.update(
+                size=int(last.get('sizeOfApplication') or 0),
+                files=int(last.get('totalNumOfFiles') or 0),
+                duration=JobManager.get_state(last)['duration'],
+                job_id=int(last['jobId'])
+            )
+
+        return estimate
+
+    def estimate_restore(self):
+        """Returns the estimated size, file count & duration of a restore of the subclient content.
+
+            The size & file count are those of the last full backup, an upper bound for the restore of a part of the
+            content. The duration is the size over the throughput of the last restore, or of that backup if the
+            subclient was never restored.
+
+            Returns:
+                dict - {'size': int, 'files': int, 'duration': int, 'job_id': int}, the values are None if the
+                subclient has no successful backup.
+
+        """
+        last = self._last_full() or next(iter(self.backups()), None)
+        estimate = {'size': None, 'files': None, 'duration': None, 'job_id': None}
+        if last is None:
+            return estimate
+
+        restores = self.restores()
+        throughput = JobManager.get_throughput(restores[:1] or [last])['throughput']
+        size = int(last.get('sizeOfApplication') or 0)
+        estimate.update(
+            size=size,
+            files=int(last.get('totalNumOfFiles') or 0),
+            duration=round(size / throughput) if throughput else None,
+            job_id=int(last['jobId'])
+        )
+        return estimate
+
+    def choose_level(self, full_age=AUTO_FULL_AGE, differential_age=AUTO_DIFFERENTIAL_AGE,
+                     change_rate=AUTO_CHANGE_RATE):
+        """Returns the backup level keeping the incremental chain short, from the age of the last full & differential
+        backups & the data backed up since the last full backup.
+
+            - full if the subclient has no successful backup in the history.
+            - synthetic_full if the last full backup is older than full_age, or is not in the history, or the data
+              backed up since, as a fraction of its size, reached change_rate.
+            - differential if the last full or differential backup is older than differential_age.
+            - incremental otherwise.
+
+            Args:
+                full_age            (float) --  Days after which a full backup is due.
+                    default :   AUTO_FULL_AGE
+
+                differential_age    (float) --  Days after which a differential backup is due.
+                    default :   AUTO_DIFFERENTIAL_AGE
+
+                change_rate         (float) --  Data backed up since the last full backup, as a fraction of its size,
+                at which a full backup is due.
+                    default :   AUTO_CHANGE_RATE
+
+            Returns:
+                str - one of full, synthetic_full, differential & incremental.
+
+        """
+        last_full = self._last_full()
+        backups = self.backups()
+        if not backups:
+            return 'full'
+
+        # No full backup in the whole lookup time, which covers full_age, the last one is older than full_age.
+        if last_full is None:
+            return 'synthetic_full'
+
+        now = time()
+        if now - int(last_full.get('jobStartTime') or 0) >= full_age * 86400:
+            return 'synthetic_full'
+
+        chain = backups[:backups.index(last_full)]
+
+        # The restore of the chain reads the last differential & the incrementals run after it.
+        changed = 0
+        for summary in chain:
+            changed += int(summary.get('sizeOfApplication') or 0)
+            if self.get_level(summary) == 'differential':
+                break
+        full_size = int(last_full.get('sizeOfApplication') or 0)
+        if full_size and changed / full_size >= change_rate:
+            return 'synthetic_full'
+
+        last_base = next((summary for summary in chain if self.get_level(summary) == 'differential'), last_full)
+        if now - int(last_base.get('jobStartTime') or 0) >= differential_age * 86400:
+            return 'differential'
+
+        return 'incremental'
+
+    def _last_full(self):
+        """Returns the last successful full or synthetic full backup, None if there is none in the lookup time.
+
+            The older pages of the history are read until a full backup is found, a long incremental chain can fill
+            the first page.
+
+        """
+        while True:
+            backups = self.backups(FULL_LEVELS)
+            if backups or self.complete:
+                return backups[0] if backups else None
+
+            self._read_page()
+
+    def _read_page(self):
+        """Reads the next page of the history, a page shorter than the limit is the last one."""
+        page = self.job_manager.get_subclient_jobs(
+            self.subclient, HISTORY_JOB_TYPES, self.lookup_time, self.limit, self.read
+        )
+        self.read += len(page)
+        self.complete = len(page) < self.limit
+        self.jobs.extend(summary for summary in page if JobManager.is_successful(summary.get('status')))
+        self.jobs.sort(key=lambda summary: int(summary['jobId']), reverse=True)
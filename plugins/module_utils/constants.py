@@ -19,3 +19,29 @@
 """Helper file for maintaining of all Commvault's Ansible Collection Constants."""
 
 ANSIBLE_METADATA = {'metadata_version': '1.1', 'status': ['preview'], 'supported_by': 'community'}
+
+# Names of the members of the enums in cvpysdk.deployment.deploymentconstants, used as the choices of the deployment
+# modules without importing CVPySDK before the arguments are validated, checked against CVPySDK by
+# tests/unit/plugins/module_utils/test_constants.py.
+DOWNLOAD_OPTIONS = [
+    'LATEST_SERVICEPACK', 'LATEST_HOTFIXES', 'SERVICEPACK_AND_HOTFIXES'
+]
+
+DOWNLOAD_PACKAGES = [
+    'WINDOWS_32', 'WINDOWS_64', 'UNIX_AIX', 'UNIX_AIX32', 'UNIX_MAC', 'UNIX_FREEBSD86', 'UNIX_FREEBSD64', 'UNIX_HP',
+    'UNIX_LINUX86', 'UNIX_LINUX64', 'UNIX_S390', 'UNIX_S390_31', 'UNIX_PPC64', 'UNIX_SOLARIS86', 'UNIX_SOLARIS64',
+    'UNIX_SOLARIS_SPARC', 'UNIX_SOLARIS_SPARC86', 'UNIX_LINUX64LE'
+]
+
+WINDOWS_DOWNLOAD_FEATURES = [
+    'COMMSERVE', 'ACTIVE_DIRECTORY', 'CLOUD_APPS', 'DOMINO_DATABASE', 'EXCHANGE', 'FILE_SYSTEM', 'FILE_SYSTEM_CORE',
+    'MEDIA_AGENT', 'SHAREPOINT', 'ORACLE', 'POSTGRESQL', 'SQLSERVER', 'VIRTUAL_SERVER', 'VSS_PROVIDER',
+    'VSS_HARDWARE_PROVIDER', 'WEB_CONSOLE', 'TEST_AUTOMATION', 'PYTHON_SDK', 'COMMSERVE_LITE', 'CONTENT_ANALYZER',
+    'INDEX_STORE', 'INDEX_GATEWAY', 'CONTENT_EXTRACTOR', 'DB2_AGENT', 'INFORMIX', 'SYBASE', 'WEB_SERVER'
+]
+
+UNIX_DOWNLOAD_FEATURES = [
+    'COMMSERVE', 'CASSANDRA', 'CLOUD_APPS', 'DOMINO_DATABASE', 'FILE_SYSTEM', 'FILE_SYSTEM_CORE',
+    'FILE_SYSTEM_FOR_IBMI', 'FILE_SYSTEM_FOR_OPEN_VMS', 'MEDIA_AGENT', 'ORACLE', 'POSTGRESQL', 'SAPHANA', 'SQLSERVER',
+    'VIRTUAL_SERVER', 'TEST_AUTOMATION', 'PYTHON_SDK', 'CONTENT_ANALYZER', 'DB2_AGENT', 'INFORMIX', 'SYBASE'
+]
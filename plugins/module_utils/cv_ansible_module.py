@@ -24,20 +24,28 @@ CVAnsibleModule: Derived class from AnsibleModule Base class, representing a Com
 
 CVAnsibleModule:
     __init__()  --  Initializes a Commvault Ansible Module.
-    __del__()   --  Called when the instance is about to be destroyed, saves the Commcell object to the session file.
+    __del__()   --  Called when the instance is about to be destroyed, saves the session record if it has changed.
     _login()    --  Logs in to Commcell.
+    _resume()   --  Resumes the session stored in the session record.
     exit_json() --  Handles module exit.
 
 """
 
-import pickle
-import os
-import stat
+from copy import deepcopy
 
+from .startup_profile import StartupProfile
 from .login.pre_login import (
     FILE_PATH,
     SESSION_ID
 )
+from .login.session import SessionFile
+from .login.session_pool import SessionPool
+from .login.session_registry import (
+    SESSION_TTL,
+    SessionRegistry
+)
+from .login.commcell_handle import CommcellHandle
+from .login.token_renewal import TokenRenewal
 from ansible.module_utils.basic import AnsibleModule
 
 
@@ -56,9 +64,15 @@ class CVAnsibleModule(AnsibleModule):
 
         """
 
+        self.profile = StartupProfile()
         self.argument_spec = argument_spec
         self.commcell = None
+        self.session_id = None
         self.session_file_path = None
+        self.session = None
+        self.saved_session = None
+        self.session_pool = None
+        self.session_pool_index = None
         self.result = {}
         self.login_args = {
             'webserver_hostname': dict(type=str, required=False),
@@ -70,6 +84,7 @@ class CVAnsibleModule(AnsibleModule):
             'session_id': dict(type=str, required=False),
             'force_https': dict(type=bool, required=False, default=False),
             'certificate_path': dict(type=str, required=False),
+            'session_ttl': dict(type=int, required=False, default=SESSION_TTL),
         }
 
         # By default we will always try to create a Commcell object.
@@ -81,7 +96,8 @@ class CVAnsibleModule(AnsibleModule):
                 if key not in self.argument_spec:
                     self.argument_spec.update({key: value})
 
-            super().__init__(argument_spec=self.argument_spec, supports_check_mode=True, **kwargs)
+            with self.profile.phase('argument_parsing'):
+                super().__init__(argument_spec=self.argument_spec, supports_check_mode=True, **kwargs)
 
             # Verifying credentials & auth_token manually instead of built in mutually_exclusive, required_by etc.
             creds = all([self.params.get(key) for key in ['webserver_hostname', 'commcell_username', 'commcell_password']]) \
@@ -89,8 +105,8 @@ class CVAnsibleModule(AnsibleModule):
             auth_token = all([self.params[key] for key in ['webserver_hostname', 'auth_token']])
 
             # Figure out the session ID
-            session_id = SESSION_ID if not self.params.get('session_id') else self.params.get('session_id')
-            self.session_file_path = FILE_PATH.format(SESSION_ID=session_id)
+            self.session_id = str(SESSION_ID if not self.params.get('session_id') else self.params.get('session_id'))
+            self.session_file_path = FILE_PATH.format(SESSION_ID=self.session_id)
 
             if creds and auth_token:
                 result = {"msg": "Both auth_token & commcell_username\\commcell_password provided."}
@@ -98,25 +114,86 @@ class CVAnsibleModule(AnsibleModule):
 
             # 1st priority --> is for module level arguments
             if creds or auth_token:
-                self.commcell = self._login(**self.params)
-
-            # 2nd priority  --> is for session file.
+                with self.profile.phase('login'):
+                    self.commcell = self._login(**self.params)
+                self.session = SessionFile.create_record(
+                    self.params, self.commcell.auth_token, self.commcell._web_service
+                )
+                self.profile.watch_first_request(getattr(self.commcell, '_cvpysdk_object', None))
+
+            # 2nd priority  --> is for session file, the Commcell is rebuilt from the token in the session record.
             else:
-                with open(self.session_file_path, "rb") as fh:
-                    self.commcell = pickle.load(fh)
+                self.resume_session(self.session_file_path)
 
         except FileNotFoundError:
             result = {"msg": f"Failed to open session file {self.session_file_path}, it might not exist."}
             self.fail_json(**result)
 
+        except ValueError as e:
+            result = {"msg": str(e)}
+            self.fail_json(**result)
+
     def __del__(self):
-        """Called when the instance is about to be destroyed, saves the Commcell object to the session file."""
+        """Called when the instance is about to be destroyed, saves the session record if it has changed.
+
+            Most tasks only read the session, the session file is rewritten only after a login or a token renewal.
+            A new session is registered in the index of the session directory with its TTL.
+            A renewed pool token is merged into the latest record on disk, as other forks may have renewed theirs.
+
+        """
 
         # Avoiding exceptions in __del__ as they will be logged to stderr.
-        if self.session_file_path:
-            with open(self.session_file_path, 'wb') as fh:
-                pickle.dump(self.commcell, fh)
-        os.chmod(self.session_file_path, stat.S_IRWXU)  # SET READ, WRITE & EXECUTE PERMISSIONS FOR OWNER
+        if self.session_file_path and self.session and self.commcell:
+            auth_token = getattr(self.commcell, '_headers', {}).get('Authtoken')
+            if self.session_pool:
+                self.session_pool.release()
+                index = self.session_pool_index
+                if auth_token and auth_token != self.saved_session['pool'][index]:
+                    SessionFile(self.session_file_path).update(lambda record: record['pool'].__setitem__(index, auth_token))
+            elif auth_token:
+                self.session['auth_token'] = auth_token
+                if self.saved_session is None:
+                    # New session --> recorded in the index of the session directory, for its eviction after the TTL.
+                    registry = SessionRegistry()
+                    registry.prepare()
+                    SessionFile(self.session_file_path).save(self.session)
+                    registry.register(self.session_id, self.params.get('session_ttl') or SESSION_TTL)
+                elif auth_token != self.saved_session.get('auth_token'):
+                    # Renewed token --> merged into the latest record on disk, concurrent tasks may have changed it.
+                    SessionFile(self.session_file_path).update(
+                        lambda record: record.__setitem__('auth_token', auth_token)
+                    )
+
+    def resume_session(self, session_file_path):
+        """Resumes the session saved in the given session file, the token renewed by the task is saved to it on exit.
+
+            A pooled login leases one of its tokens, so that parallel forks don't share a single token.
+
+            Args:
+                session_file_path   (str)   --  Path of the session file.
+
+            Returns:
+                object - Commcell handle of the session.
+
+            Raises:
+                FileNotFoundError if the session file does not exist.
+
+        """
+        self.session_file_path = session_file_path
+        with self.profile.phase('session_load'):
+            self.session = SessionFile(session_file_path).load()
+        self.saved_session = deepcopy(self.session)
+
+        if self.session.get('pool'):
+            self.session_pool = SessionPool(session_file_path, len(self.session['pool']))
+            self.session_pool_index = self.session_pool.claim()
+            self.session['auth_token'] = self.session['pool'][self.session_pool_index]
+
+        with self.profile.phase('resume'):
+            self.commcell = self._resume(**self.session)
+
+        self.profile.watch_first_request(getattr(self.commcell, '_cvpysdk_object', None))
+        return self.commcell
 
     def _login(self, *args, **kwargs):
         """Login to Commcell and return object of Commcell.
@@ -131,17 +208,25 @@ class CVAnsibleModule(AnsibleModule):
 
                     commcell_password  (str)   --  Plain-text password for log in to the console.
 
-                    authtoken           (str)   --  QSDK/SAML token for log in to the console.
+                    auth_token          (str)   --  QSDK/SAML token for log in to the console.
+
+                    force_https         (bool)  --  Connect to the Web Server only via HTTPS.
+
+                    verify_ssl          (bool)  --  Verify the SSL certificate of the Web Server.
+
+                    certificate_path    (str)   --  Path of the CA_BUNDLE or directory with certificates of trusted CAs.
 
         """
         try:
-            from cvpysdk.commcell import Commcell, SDKException
+            from cvpysdk.commcell import Commcell
+            from cvpysdk.exception import SDKException
 
             return Commcell(
                 webconsole_hostname=kwargs['webserver_hostname'],
                 commcell_username=kwargs.get('commcell_username') or kwargs.get('webserver_username'),
                 commcell_password=kwargs.get('commcell_password') or kwargs.get('webserver_password'),
                 authtoken=kwargs.get('auth_token'),
+                force_https=bool(kwargs.get('force_https')),
                 verify_ssl=kwargs.get('verify_ssl'),
                 certificate_path=kwargs.get('certificate_path'),
             )
@@ -154,7 +239,43 @@ class CVAnsibleModule(AnsibleModule):
             result = {"changed": False, "msg": str(e)}
             self.fail_json(**result)
 
+    def _resume(self, **kwargs):
+        """Returns a lazy Commcell handle for the session record, no request is made to the server.
+
+            Modules which only need the authenticated HTTP channel (e.g. job control or request) never pay for
+            the CommServ details and entity collections loaded by the full Commcell object. If the session holds a
+            renewal credential, a request failing on an expired token logs in again & is replayed, the new token is
+            saved to the session file on exit.
+
+            **kwargs    (dict)  --  Session record, as returned by SessionFile.load().
+
+        """
+        if not kwargs.get('web_service'):
+            return self._login(**kwargs)
+
+        try:
+            commcell = CommcellHandle(**kwargs)
+
+            # Renewal credential stored at login --> an expired token is replaced by a fresh login, once.
+            if kwargs.get('renewal'):
+                TokenRenewal(commcell, **kwargs['renewal']).install()
+
+            return commcell
+
+        except (ModuleNotFoundError, ImportError):
+            result = {"changed": False, "msg": "Unable to import CVPySDK, please ensure it is installed on the node"}
+            self.fail_json(**result)
+
     def exit_json(self, *args, **kwargs):
-        """Ensures that return variables 'changed' and 'failed' have been set."""
+        """Ensures that return variables 'changed' and 'failed' have been set, adds the start-up profile if enabled."""
         assert "changed" in kwargs, "Module developed is missing return variable(s)."
+        if self.profile.enabled:
+            kwargs['startup_profile'] = self.profile.report()
         super().exit_json(*args, **kwargs)
+
+    def fail_json(self, *args, **kwargs):
+        """Adds the start-up profile to the result of a failed task if enabled, e.g. a task failing on the reply of
+        its first API call still reports the timings of its start-up."""
+        if self.profile.enabled:
+            kwargs['startup_profile'] = self.profile.report()
+        super().fail_json(*args, **kwargs)
@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for class EntityIndex, class for resolving entity names to IDs without listing the entity collections.
+
+EntityIndex is the only class defined in this file.
+
+EntityIndex: Represents an on-disk index, shared by all the tasks of the user, mapping the name path of a
+backupset or subclient (client, agent, backupset, subclient) to the IDs of every entity of the path. On a hit the
+entities are created directly from their IDs, the clients, agents, instances, backupsets & subclients collections
+are never listed.
+
+EntityIndex:
+    __init__()          --  Initializes the index for the given Commcell.
+    get_backupset()     --  Returns the Backupset object for the given name path.
+    get_subclient()     --  Returns the Subclient object for the given name path.
+    invalidate()        --  Removes the entry of the given name path from the index.
+    _resolve()          --  Returns the entities of the name path, from the index or by walking the collections.
+    _walk()             --  Gets the entities of the name path from the entity collections.
+    _build()            --  Creates the entities of an index entry directly from their IDs.
+    _key()              --  Returns the key of the name path in the index.
+    _lookup()           --  Returns the entry of the key if it has not expired.
+    _store()            --  Saves the entry of the key in the index.
+    _lock()             --  Context manager holding an exclusive lock on the index file.
+    _load()             --  Reads the index file.
+
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from time import time
+
+from .atomic_file import (
+    atomic_write,
+    locked
+)
+from .login.session_registry import (
+    SESSION_DIR,
+    SessionRegistry
+)
+
+ENTITY_INDEX_PATH = os.path.join(SESSION_DIR, "entities.json")
+ENTITY_INDEX_TTL = 3600
+
+# Serializes the first access of the clients collection, which lists all the clients of the Commcell.
+_COLLECTION_LOCK = threading.Lock()
+
+
+class _ClientTypeLookup:
+    """Stand-in for the clients collection of the Commcell while a client is created from the index.
+
+    The Client constructor checks the clients collection only to tell visible & hidden clients apart, the answer
+    is recorded in the index so the collection is never listed.
+    """
+
+    def __init__(self, commcell_object, hidden):
+        """Initializes the stand-in with the client type recorded in the index."""
+        self._commcell_object = commcell_object
+        self._hidden = hidden
+
+    def __getattr__(self, attribute):
+        """Delegates every other attribute to the Commcell."""
+        return getattr(self._commcell_object, attribute)
+
+    @property
+    def clients(self):
+        """Returns the stand-in itself, in place of the clients collection."""
+        return self
+
+    def has_client(self, client_name):
+        """Returns True for a visible client, False for a hidden client."""
+        return not self._hidden
+
+
+class EntityIndex:
+    """Class representing the on-disk name to ID index of the backupsets & subclients."""
+
+    def __init__(self, commcell, path=ENTITY_INDEX_PATH, ttl=ENTITY_INDEX_TTL):
+        """Initializes the index for the given Commcell.
+
+            Args:
+                commcell    (object)    --  Commcell object, or the Commcell handle resumed from the session.
+
+                path        (str)       --  Path of the index file.
+                    default :   ENTITY_INDEX_PATH
+
+                ttl         (int)       --  Seconds an entry stays valid, 0 always walks the entity collections
+                and refreshes the entry.
+                    default :   ENTITY_INDEX_TTL
+
+        """
+        self.commcell = commcell
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self.ttl = ttl
+
+    def get_backupset(self, client_name, agent_name='File System', backupset_name=None):
+        """Returns the Backupset object for the given name path.
+
+            Args:
+                client_name     (str)   --  Name of the client.
+
+                agent_name      (str)   --  Name of the agent.
+                    default :   'File System'
+
+                backupset_name  (str)   --  Name of the backupset, the default backupset if not given.
+                    default :   None
+
+            Returns:
+                object - Backupset object.
+
+        """
+        return self._resolve(client_name, agent_name, backupset_name)['backupset']
+
+    def get_subclient(self, client_name, agent_name='File System', backupset_name=None, subclient_name=None):
+        """Returns the Subclient object for the given name path.
+
+            Args:
+                client_name     (str)   --  Name of the client.
+
+                agent_name      (str)   --  Name of the agent.
+                    default :   'File System'
+
+                backupset_name  (str)   --  Name of the backupset, the default backupset if not given.
+                    default :   None
+
+                subclient_name  (str)   --  Name of the subclient, the default subclient if not given.
+                    default :   None
+
+            Returns:
+                object - Subclient object.
+
+        """
+        return self._resolve(client_name, agent_name, backupset_name, subclient_name, True)['subclient']
+
+    def invalidate(self, client_name, agent_name='File System', backupset_name=None, subclient_name=None,
+                   with_subclient=False):
+        """Removes the entry of the given name path from the index, e.g. after the entity was renamed or deleted.
+
+            Args:
+                client_name     (str)   --  Name of the client.
+
+                agent_name      (str)   --  Name of the agent.
+                    default :   'File System'
+
+                backupset_name  (str)   --  Name of the backupset.
+                    default :   None
+
+                subclient_name  (str)   --  Name of the subclient.
+                    default :   None
+
+                with_subclient  (bool)  --  The entry of a subclient, instead of its backupset.
+                    default :   False
+
+        """
+        key = self._key(client_name, agent_name, backupset_name, subclient_name, with_subclient)
+        self._store(key, None)
+
+    def _resolve(self, client_name, agent_name, backupset_name=None, subclient_name=None, with_subclient=False):
+        """Returns the entities of the name path, from the index or by walking the entity collections.
+
+            An entry which no longer resolves on the server is dropped & the collections are walked again.
+
+            Returns:
+                dict - {'client': object, 'agent': object, 'backupset': object, 'subclient': object}
+
+        """
+        from cvpysdk.exception import SDKException
+
+        key = self._key(client_name, agent_name, backupset_name, subclient_name, with_subclient)
+        entry = self._lookup(key)
+
+        if entry:
+            try:
+                return self._build(entry)
+            except SDKException:
+                pass
+
+        entities = self._walk(client_name, agent_name, backupset_name, subclient_name, with_subclient)
+        backupset = entities['backupset']
+        instance = backupset._instance_object
+        entry = {
+            'cached': int(time()),
+            'client': [entities['client'].client_name, entities['client'].client_id,
+                       entities['client']._client_type_id != 0],
+            'agent': [entities['agent'].agent_name, entities['agent'].agent_id],
+            'instance': [instance.instance_name, instance.instance_id],
+            'backupset': [backupset.backupset_name, backupset.backupset_id],
+        }
+        if with_subclient:
+            entry['subclient'] = [entities['subclient'].subclient_name, entities['subclient'].subclient_id]
+
+        self._store(key, entry)
+        return entities
+
+    def _walk(self, client_name, agent_name, backupset_name, subclient_name, with_subclient):
+        """Gets the entities of the name path from the entity collections, listing each collection on the way.
+
+            The clients collection is shared by the threads resolving name paths concurrently, it is listed once.
+
+        """
+        with _COLLECTION_LOCK:
+            clients = self.commcell.clients
+
+        client = clients.get(client_name)
+        agent = client.agents.get(agent_name)
+        backupset = agent.backupsets.get(backupset_name if backupset_name else agent.backupsets.default_backup_set)
+        entities = {'client': client, 'agent': agent, 'backupset': backupset}
+
+        if with_subclient:
+            entities['subclient'] = backupset.subclients.get(
+                subclient_name if subclient_name else backupset.subclients.default_subclient
+            )
+
+        return entities
+
+    def _build(self, entry):
+        """Creates the entities of an index entry directly from their IDs, no entity collection is listed."""
+        from cvpysdk.agent import Agent
+        from cvpysdk.backupset import Backupset
+        from cvpysdk.client import Client
+        from cvpysdk.instance import Instance
+        from cvpysdk.subclient import Subclient
+
+        client_name, client_id, hidden = entry['client']
+        client = Client(_ClientTypeLookup(self.commcell, hidden), client_name, client_id)
+        client._commcell_object = self.commcell
+
+        agent = Agent(client, *entry['agent'])
+        instance = Instance(agent, *entry['instance'])
+        backupset = Backupset(instance, *entry['backupset'])
+        entities = {'client': client, 'agent': agent, 'backupset': backupset}
+
+        if 'subclient' in entry:
+            entities['subclient'] = Subclient(backupset, *entry['subclient'])
+
+        return entities
+
+    def _key(self, client_name, agent_name, backupset_name, subclient_name, with_subclient):
+        """Returns the key of the name path in the index, unique across Web Servers, empty names are defaults."""
+        names = [self.commcell.webconsole_hostname, client_name, agent_name, backupset_name or '']
+        if with_subclient:
+            names.append(subclient_name or '')
+
+        return '/'.join(str(name).lower() for name in names)
+
+    def _lookup(self, key):
+        """Returns the entry of the key if it exists & has not expired, the index file is read without a lock."""
+        if self.ttl <= 0:
+            return None
+
+        entry = self._load().get(key)
+        if entry and int(time()) - entry.get('cached', 0) < self.ttl:
+            return entry
+
+        return None
+
+    def _store(self, key, entry):
+        """Saves the entry of the key in the index, or removes the key if the entry is None.
+
+            The latest index is updated under the lock & atomically replaced, expired entries are dropped on the way.
+
+        """
+        now = int(time())
+        max_age = max(self.ttl, ENTITY_INDEX_TTL)
+        with self._lock():
+            index = {
+                name: value for name, value in self._load().items() if now - value.get('cached', 0) < max_age
+            }
+            if entry is None:
+                index.pop(key, None)
+            else:
+                index[key] = entry
+
+            with atomic_write(self.path) as fh:
+                json.dump(index, fh)
+
+    @contextmanager
+    def _lock(self):
+        """Context manager holding an exclusive lock on the index file while it is updated."""
+        if os.path.dirname(self.path) == SESSION_DIR:
+            SessionRegistry().prepare()
+
+        with locked(self.lock_path):
+            yield
+
+    def _load(self):
+        """Reads the index file, a missing or unreadable index is treated as empty."""
+        try:
+            with open(self.path) as fh:
+                index = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+
+        return index if isinstance(index, dict) else {}
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for class JobAnalytics, class for aggregating the duration, size & failures of jobs in a single pass.
+
+JobAnalytics is the only class defined in this file.
+
+JobAnalytics: Represents the aggregates of a stream of job summaries, grouped by client, media agent, storage policy
+or job type. Only the counters & a compact array of durations are kept per group, the summaries are never held.
+
+JobAnalytics:
+    __init__()      --  Initializes the aggregates for the given groupings.
+    add()           --  Adds a job summary to the aggregates of its groups.
+    report()        --  Returns the aggregates of every group.
+    _new_group()    --  Returns the empty aggregates of a group.
+    _summarize()    --  Returns the metrics of the aggregates of a group.
+    _percentile()   --  Returns the nearest-rank percentile of sorted values.
+
+"""
+
+from array import array
+
+from .job_manager import JobManager
+
+# Field of the job summary each grouping is keyed on, a field of a nested object is given by its dotted path.
+GROUP_FIELDS = {
+    'client': 'subclient.clientName',
+    'media_agent': 'mediaAgent.mediaAgentName',
+    'storage_policy': 'storagePolicy.storagePolicyName',
+    'job_type': 'jobType'
+}
+UNKNOWN_GROUP = 'unknown'
+
+
+class JobAnalytics:
+    """Class representing the aggregates of a stream of job summaries."""
+
+    def __init__(self, group_by=('client', 'media_agent')):
+        """Initializes the aggregates for the given groupings.
+
+            Args:
+                group_by    (list)  --  Groupings of the jobs, keys of GROUP_FIELDS.
+                    default :   ('client', 'media_agent')
+
+        """
+        self.group_by = list(group_by)
+        self.groups = {grouping: {} for grouping in self.group_by}
+        self.overall = self._new_group()
+
+    def add(self, summary):
+        """Adds a job summary to the overall aggregates & to the aggregates of its groups, a job not yet finished
+        is skipped.
+
+            Args:
+                summary (dict)  --  Summary of a finished job.
+
+        """
+        state = JobManager.get_state(summary)
+        if not state['finished']:
+            return
+
+        projection = JobManager.project(summary, [GROUP_FIELDS[grouping] for grouping in self.group_by])
+
+        targets = [self.overall]
+        for grouping in self.group_by:
+            name = str(projection[GROUP_FIELDS[grouping]] or UNKNOWN_GROUP)
+            targets.append(self.groups[grouping].setdefault(name, self._new_group()))
+
+        for group in targets:
+            group['jobs'] += 1
+            group['failed'] += 0 if state['successful'] else 1
+            group['bytes'] += int(summary.get('sizeOfApplication') or 0)
+            group['bytes_on_media'] += int(summary.get('sizeOfMediaOnDisk') or 0)
+            if state['duration'] is not None:
+                group['durations'].append(max(0, int(state['duration'])))
+
+    def report(self):
+        """Returns the metrics of the overall aggregates & of the aggregates of every group.
+
+            Returns:
+                dict - {'overall': metrics, grouping: {name: metrics}}
+
+        """
+        report = {'overall': self._summarize(self.overall)}
+        for grouping, groups in self.groups.items():
+            report[grouping] = {name: self._summarize(group) for name, group in sorted(groups.items())}
+
+        return report
+
+    @staticmethod
+    def _new_group():
+        """Returns the empty aggregates of a group, the durations are kept as a compact array of seconds."""
+        return {'jobs': 0, 'failed': 0, 'bytes': 0, 'bytes_on_media': 0, 'durations': array('q')}
+
+    def _summarize(self, group):
+        """Returns the metrics of the aggregates of a group.
+
+            Args:
+                group   (dict)  --  Aggregates of the group.
+
+            Returns:
+                dict - jobs, failed & failure rate, duration percentiles in seconds, bytes & throughput in bytes/sec.
+
+        """
+        durations = sorted(group['durations'])
+        total_duration = sum(durations)
+        return {
+            'jobs': group['jobs'],
+            'failed': group['failed'],
+            'failure_rate': round(group['failed'] / group['jobs'], 4) if group['jobs'] else 0,
+            'duration_p50': self._percentile(durations, 50),
+            'duration_p95': self._percentile(durations, 95),
+            'duration_p99': self._percentile(durations, 99),
+            'total_duration': total_duration,
+            'total_bytes': group['bytes'],
+            'total_bytes_on_media': group['bytes_on_media'],
+            'throughput': round(group['bytes'] / total_duration, 2) if total_duration else None
+        }
+
+    @staticmethod
+    def _percentile(values, percent):
+        """Returns the nearest-rank percentile of sorted values, None if there are no values.
+
+            Args:
+                values  (list)  --  Sorted values.
+
+                percent (int)   --  Percentile, between 0 & 100.
+
+        """
+        if not values:
+            return None
+
+        rank = max(1, -(-percent * len(values) // 100))
+        return values[rank - 1]
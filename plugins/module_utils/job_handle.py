@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for class JobHandle, class for the job handle file written by the modules which start long running jobs.
+
+JobHandle is the only class defined in this file.
+
+JobHandle: Represents a compact JSON file naming a job & the session file it was started with. A module started with
+Ansible's async & poll: 0 writes the handle & returns right away, the job is then polled by job.poll with a single
+request, without logging in again.
+
+JobHandle:
+    __init__()  --  Initializes the job handle for the given path.
+    save()      --  Atomically writes the job handle.
+    load()      --  Reads the job handle.
+
+"""
+
+import json
+import os
+from time import time
+
+from .atomic_file import atomic_write
+
+JOB_HANDLE_VERSION = 1
+
+
+class JobHandle:
+    """Class representing the job handle file of a job started by a module."""
+
+    def __init__(self, path):
+        """Initializes the job handle for the given path.
+
+            Args:
+                path    (str)   --  Path of the job handle file.
+
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+
+    def save(self, job_id, session_file_path, operation):
+        """Atomically writes the job handle, readable only by the owner.
+
+            The handle holds no token, the poller resumes the session from the session file.
+
+            Args:
+                job_id              (int)   --  ID of the job.
+
+                session_file_path   (str)   --  Path of the session file of the module which started the job.
+
+                operation           (str)   --  Name of the module which started the job.
+
+        """
+        handle = {
+            'version': JOB_HANDLE_VERSION,
+            'job_id': int(job_id),
+            'session_file': session_file_path,
+            'operation': operation,
+            'submitted': int(time())
+        }
+
+        with atomic_write(self.path) as fh:
+            json.dump(handle, fh)
+
+    def load(self):
+        """Reads the job handle.
+
+            Returns:
+                dict - {'job_id': int, 'session_file': str, 'operation': str, 'submitted': int}
+
+            Raises:
+                FileNotFoundError if the job handle does not exist.
+
+                ValueError if the file is not a job handle.
+
+        """
+        with open(self.path) as fh:
+            try:
+                handle = json.load(fh)
+            except ValueError:
+                handle = None
+
+        if not isinstance(handle, dict) or handle.get('version') != JOB_HANDLE_VERSION:
+            raise ValueError(f"{self.path} is not a job handle.")
+
+        return handle
@@ -0,0 +1,636 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for class JobManager, class for querying many jobs with as few requests as possible.
+
+JobManager is the only class defined in this file.
+
+JobManager: Represents a set of jobs of the Commcell, their summaries are fetched with a single GET request per job,
+run concurrently, instead of the several requests made by the initialization of a CVPySDK Job object.
+
+JobManager:
+    __init__()              --  Initializes the manager for the given Commcell.
+    is_finished()           --  Checks if a job status is a final status.
+    is_successful()         --  Checks if a final job status is a successful status.
+    get_summary()           --  Returns the summary of a job.
+    get_summaries()         --  Returns the summaries of the given jobs, fetched concurrently.
+    get_statuses()          --  Returns the status of the given jobs, optionally only of the jobs not yet finished.
+    get_delay_reason()      --  Returns the reason of the delay of a job, from the job details.
+    get_state()             --  Returns the state of a job, built from its summary.
+    get_throughput()        --  Returns the bytes moved by the given jobs over the time they ran together.
+    wait()                  --  Waits for the given jobs to finish, polling the jobs not yet finished with a backoff.
+    select()                --  Returns the IDs of the active jobs matching the given clients, job types & statuses.
+    iter_jobs()             --  Yields the summaries of the jobs matching the given filters, one page at a time.
+    get_subclient_jobs()    --  Returns a page of the finished jobs of a subclient, read with a single request.
+    _list_jobs()            --  Returns a page of the jobs matching the given filters.
+    project()               --  Returns the given fields of a job summary.
+    control()               --  Kills, suspends or resumes a job.
+    control_all()           --  Kills, suspends or resumes the given jobs concurrently, optionally waiting for them.
+
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from time import (
+    monotonic,
+    sleep
+)
+
+JOB_QUERY_WORKERS = 8
+
+# Same rule as Job.is_finished() of CVPySDK, a status containing any of these is final.
+FINISHED_STATUSES = ('completed', 'killed', 'committed', 'failed')
+
+# Same rule as Job.wait_for_completion() of CVPySDK, a finished job with any other status was successful.
+FAILED_STATUSES = ('failed', 'killed', 'failed to start')
+
+POLL_INTERVAL = 10
+MAX_POLL_INTERVAL = 120
+POLL_BACKOFF = 1.5
+
+# Polls in a row a job can't be queried in before it is no longer waited for, its status is then reported unknown.
+MAX_POLL_ERRORS = 3
+UNKNOWN_STATUS = 'Unknown'
+
+# Service & status reached for each job control action, as in Job.kill(), Job.pause() & Job.resume() of CVPySDK.
+CONTROL_ACTIONS = {
+    'kill': ('KILL_JOB', 'Killed'),
+    'suspend': ('SUSPEND_JOB', 'Suspended'),
+    'resume': ('RESUME_JOB', 'Running')
+}
+
+# Same limit as Job._wait_for_status() of CVPySDK.
+CONTROL_WAIT_TIMEOUT = 360
+SELECT_PAGE_SIZE = 500
+
+# Job list categories of the Jobs API, as in JobController of CVPySDK.
+JOB_CATEGORIES = {'ALL': 0, 'ACTIVE': 1, 'FINISHED': 2}
+
+
+class JobManager:
+    """Class representing a set of jobs of the Commcell."""
+
+    def __init__(self, commcell, max_workers=JOB_QUERY_WORKERS):
+        """Initializes the manager for the given Commcell.
+
+            Args:
+                commcell    (object)    --  Commcell object, or the Commcell handle resumed from the session.
+
+                max_workers (int)       --  Maximum number of concurrent requests.
+                    default :   JOB_QUERY_WORKERS
+
+        """
+        self.commcell = commcell
+        self.max_workers = max_workers
+
+    @staticmethod
+    def is_finished(status):
+        """Checks if a job status is a final status.
+
+            Args:
+                status  (str)   --  Status of the job, as in the job summary.
+
+            Returns:
+                bool - True if the job has finished.
+
+        """
+        return any(final in str(status).lower() for final in FINISHED_STATUSES)
+
+    @staticmethod
+    def is_successful(status):
+        """Checks if a final job status is a successful status.
+
+            Args:
+                status  (str)   --  Status of the job, as in the job summary.
+
+            Returns:
+                bool - True if the job did not fail & was not killed.
+
+        """
+        return str(status).lower() not in FAILED_STATUSES
+
+    def get_summary(self, job_id, attempts=3):
+        """Returns the summary of a job, with a single GET request.
+
+            A job which was just started may not be listed yet, the request is retried after a second.
+
+            Args:
+                job_id      (int)   --  ID of the job.
+
+                attempts    (int)   --  Number of requests made before the job is reported as missing.
+                    default :   3
+
+            Returns:
+                dict - summary of the job.
+
+            Raises:
+                Exception if the job does not exist or the request failed.
+
+        """
+        for attempt in range(attempts):
+            flag, response = self.commcell._cvpysdk_object.make_request(
+                'GET', self.commcell._services['JOB'] % job_id
+            )
+            if not flag:
+                raise Exception(
+                    f"Failed to get the summary of job {job_id}: {self.commcell._update_response_(response.text)}"
+                )
+
+            jobs = (response.json() or {}).get('jobs')
+            if jobs:
+                return jobs[0]['jobSummary']
+
+            if attempt < attempts - 1:
+                sleep(1)
+
+        raise Exception(f"No job exists with ID {job_id}")
+
+    def get_summaries(self, job_ids):
+        """Returns the summaries of the given jobs, fetched concurrently.
+
+            Args:
+                job_ids     (list)  --  IDs of the jobs.
+
+            Returns:
+                tuple - ({job_id: summary}, {job_id: error message}) for the jobs which could & couldn't be queried.
+
+        """
+        job_ids = list(dict.fromkeys(int(job_id) for job_id in job_ids))
+        summaries, errors = {}, {}
+
+        def query(job_id):
+            try:
+                summaries[job_id] = self.get_summary(job_id)
+            except Exception as e:
+                errors[job_id] = str(e)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(job_ids)))) as executor:
+            list(executor.map(query, job_ids))
+
+        return summaries, errors
+
+    def get_statuses(self, job_ids, incomplete_only=False):
+        """Returns the status of the given jobs.
+
+            Args:
+                job_ids         (list)  --  IDs of the jobs.
+
+                incomplete_only (bool)  --  Only return the jobs which have not finished yet.
+                    default :   False
+
+            Returns:
+                tuple - ({job_id: status}, {job_id: error message})
+
+        """
+        summaries, errors = self.get_summaries(job_ids)
+        statuses = {
+            job_id: summary['status'] for job_id, summary in summaries.items()
+            if not (incomplete_only and self.is_finished(summary['status']))
+        }
+        return statuses, errors
+
+    def get_delay_reason(self, job_id):
+        """Returns the reason of the delay of a job, from the job details.
+
+            Args:
+                job_id  (int)   --  ID of the job.
+
+            Returns:
+                str - reason of the delay or failure of the job, None if the job has none.
+
+            Raises:
+                Exception if the request failed.
+
+        """
+        flag, response = self.commcell._cvpysdk_object.make_request(
+            'POST', self.commcell._services['JOB_DETAILS'], {'jobId': int(job_id), 'showAttempt': True}
+        )
+        if not flag:
+            raise Exception(
+                f"Failed to get the details of job {job_id}: {self.commcell._update_response_(response.text)}"
+            )
+
+        details = (response.json() or {}).get('job', {}).get('jobDetail', {})
+        return details.get('progressInfo', {}).get('reasonForJobDelay') or None
+
+    @staticmethod
+    def get_state(summary):
+        """Returns the state of a job, built from its summary.
+
+            Args:
+                summary (dict)  --  Summary of the job.
+
+            Returns:
+                dict - {'status': str, 'finished': bool, 'successful': bool, 'duration': int, 'delay_reason': str}
+
+        """
+        status = summary.get('status')
+        finished = JobManager.is_finished(status)
+        duration = summary.get('jobElapsedTime')
+        if duration is None and summary.get('jobStartTime'):
+            duration = (summary.get('jobEndTime') or summary.get('lastUpdateTime', 0)) - summary['jobStartTime']
+
+        return {
+            'status': status,
+            'finished': finished,
+            'successful': finished and JobManager.is_successful(status),
+            'duration': duration,
+            'delay_reason': summary.get('pendingReason') or None
+        }
+
+    @staticmethod
+    def get_throughput(summaries):
+        """Returns the bytes moved by the given jobs over the time they ran together, from their first start to
+        their last end, so that concurrent jobs are not counted twice.
+
+            Args:
+                summaries   (list)  --  Summaries of the jobs.
+
+            Returns:
+                dict - {'bytes': int, 'duration': int, 'throughput': float}, the throughput in bytes/sec is None if
+                the duration is not known.
+
+        """
+        total_bytes, started, ended = 0, None, None
+        for summary in summaries:
+            total_bytes += int(summary.get('sizeOfApplication') or 0)
+            start_time = summary.get('jobStartTime')
+            if start_time:
+                end_time = summary.get('jobEndTime') or summary.get('lastUpdateTime') or start_time
+                started = start_time if started is None else min(started, start_time)
+                ended = end_time if ended is None else max(ended, end_time)
+
+        duration = ended - started if started is not None else 0
+        return {
+            'bytes': total_bytes,
+            'duration': duration,
+            'throughput': round(total_bytes / duration, 2) if duration else None
+        }
+
+    def wait(self, job_ids, timeout=None, fail_fast=False, poll_interval=POLL_INTERVAL,
+             max_poll_interval=MAX_POLL_INTERVAL, target_status=None, max_errors=MAX_POLL_ERRORS):
+        """Waits for the given jobs to finish, or to reach the target status.
+
+            Each poll queries only the jobs not yet finished, concurrently. The interval between polls grows by
+            POLL_BACKOFF while no job changes its status, up to max_poll_interval, & is reset on any change.
+            A job which can't be queried is polled again, until it fails max_errors polls in a row.
+
+            Args:
+                job_ids             (list)  --  IDs of the jobs.
+
+                timeout             (int)   --  Seconds after which the wait is given up, None to wait for all jobs.
+                    default :   None
+
+                fail_fast           (bool)  --  Stop waiting as soon as a job fails or is no longer queried.
+                    default :   False
+
+                poll_interval       (int)   --  Seconds between the first polls.
+                    default :   POLL_INTERVAL
+
+                max_poll_interval   (int)   --  Maximum seconds between polls.
+                    default :   MAX_POLL_INTERVAL
+
+                target_status       (str)   --  Status a job is no longer waited for once reached, e.g. Suspended.
+                    default :   None
+
+                max_errors          (int)   --  Polls in a row a job can't be queried in before it is given up.
+                    default :   MAX_POLL_ERRORS
+
+            Returns:
+                tuple - ({job_id: state}, {job_id: error message}, timed_out), the state of the unsuccessful jobs
+                which did not reach the target status has the reason of the failure from the job details. The jobs
+                which couldn't be queried on their last poll have the error & the status UNKNOWN_STATUS.
+
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        pending = list(dict.fromkeys(int(job_id) for job_id in job_ids))
+        states, errors, error_counts = {}, {}, {}
+        interval = poll_interval
+        timed_out = False
+
+        def reached(state):
+            return state['finished'] or str(state['status']).lower() == str(target_status).lower()
+
+        while pending:
+            summaries, poll_errors = self.get_summaries(pending)
+
+            changed = False
+            for job_id, summary in summaries.items():
+                state = self.get_state(summary)
+                changed = changed or states.get(job_id, {}).get('status') != state['status']
+                states[job_id] = state
+                errors.pop(job_id, None)
+                error_counts.pop(job_id, None)
+
+            for job_id, error in poll_errors.items():
+                errors[job_id] = error
+                error_counts[job_id] = error_counts.get(job_id, 0) + 1
+
+            # A job which can't be queried stays pending, a transient failure must not end the wait for it.
+            pending = [
+                job_id for job_id in pending
+                if (error_counts[job_id] < max_errors if job_id in poll_errors else not reached(states[job_id]))
+            ]
+            given_up = [job_id for job_id in poll_errors if error_counts[job_id] >= max_errors]
+
+            if fail_fast and (given_up or any(
+                    state['finished'] and not state['successful'] for state in states.values())):
+                break
+
+            if not pending:
+                break
+
+            if deadline is not None and monotonic() >= deadline:
+                timed_out = True
+                break
+
+            interval = poll_interval if changed else min(interval * POLL_BACKOFF, max_poll_interval)
+            sleep(interval if deadline is None else max(0, min(interval, deadline - monotonic())))
+
+        for job_id in errors:
+            states[job_id] = dict(
+                states.get(job_id, {'duration': None}), status=UNKNOWN_STATUS, finished=False, successful=False,
+                delay_reason=None
+            )
+
+        target = str(target_status).lower()
+        unsuccessful = [
+            job_id for job_id, state in states.items()
+            if state['finished'] and not state['successful'] and str(state['status']).lower() != target
+        ]
+
+        def add_delay_reason(job_id):
+            try:
+                states[job_id]['delay_reason'] = self.get_delay_reason(job_id) or states[job_id]['delay_reason']
+            except Exception:
+                pass
+
+        if unsuccessful:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(unsuccessful)))) as executor:
+                list(executor.map(add_delay_reason, unsuccessful))
+
+        return states, errors, timed_out
+
+    def select(self, clients=None, job_types=None, statuses=None):
+        """Returns the IDs of the active jobs matching the given clients, job types & statuses.
+
+            At least one filter is required, so that a selector left empty by mistake never selects every active job
+            of the Commcell.
+
+            Args:
+                clients     (list)  --  Names of the clients of the jobs.
+                    default :   None
+
+                job_types   (list)  --  Job types of the jobs, e.g. Backup, Restore.
+                    default :   None
+
+                statuses    (list)  --  Statuses of the jobs, e.g. Running, Waiting.
+                    default :   None
+
+            Returns:
+                list - IDs of the matching jobs.
+
+            Raises:
+                Exception if no filter is given, a client does not exist or the request failed.
+
+        """
+        if not any((clients, job_types, statuses)):
+            raise Exception("The selector needs at least one of clients, job_types or statuses")
+
+        return [
+            int(summary['jobId'])
+            for summary in self.iter_jobs(clients, job_types, statuses, category='ACTIVE', lookup_time=1)
+        ]
+
+    def iter_jobs(self, clients=None, job_types=None, statuses=None, category='ALL', lookup_time=24,
+                  page_size=SELECT_PAGE_SIZE):
+        """Yields the summaries of the jobs matching the given filters, one page of jobs at a time.
+
+            The jobs are filtered on the server by client, job type, category & lookup time, by status while
+            the pages are read. The next page is only requested once the jobs of the current page are consumed, so
+            stopping the iteration stops the listing.
+
+            Args:
+                clients     (list)  --  Names of the clients of the jobs.
+                    default :   None
+
+                job_types   (list)  --  Job types of the jobs, e.g. Backup, Restore.
+                    default :   None
+
+                statuses    (list)  --  Statuses of the jobs, e.g. Running, Failed.
+                    default :   None
+
+                category    (str)   --  One of ALL, ACTIVE & FINISHED.
+                    default :   'ALL'
+
+                lookup_time (int)   --  Hours the finished jobs are looked up for.
+                    default :   24
+
+                page_size   (int)   --  Number of jobs requested per page.
+                    default :   SELECT_PAGE_SIZE
+
+            Yields:
+                dict - summary of a job.
+
+            Raises:
+                Exception if a client does not exist or the request failed.
+
+        """
+        client_list = [{'clientId': int(self.commcell.clients.get(client).client_id)} for client in clients or []]
+        statuses = [str(status).lower() for status in statuses or []]
+        offset = 0
+
+        while True:
+            summaries, total = self._list_jobs(category, lookup_time, offset, page_size, client_list, job_types)
+            for summary in summaries:
+                if not statuses or str(summary.get('status', '')).lower() in statuses:
+                    yield summary
+
+            offset += page_size
+            if not summaries or offset >= total:
+                return
+
+    def get_subclient_jobs(self, subclient, job_types=None, lookup_time=24, limit=SELECT_PAGE_SIZE, offset=0):
+        """Returns a page of the finished jobs of a subclient, read with a single request.
+
+            The client of the subclient is filtered on by its ID, the clients of the Commcell are not listed.
+
+            Args:
+                subclient   (object)    --  Subclient object.
+
+                job_types   (list)      --  Job types of the jobs, e.g. Backup, SYNTHFULL, Restore.
+                    default :   None
+
+                lookup_time (int)       --  Hours the finished jobs are looked up for.
+                    default :   24
+
+                limit       (int)       --  Maximum number of jobs read.
+                    default :   SELECT_PAGE_SIZE
+
+                offset      (int)       --  Number of newer jobs skipped, to read the next page.
+                    default :   0
+
+            Returns:
+                list - summaries of the jobs, newest first.
+
+            Raises:
+                Exception if the request failed.
+
+        """
+        summaries, _ = self._list_jobs(
+            'FINISHED', lookup_time, offset, limit, [{'clientId': int(subclient._client_object.client_id)}], job_types,
+            entity={'subclientId': int(subclient.subclient_id)}
+        )
+        summaries = [
+            summary for summary in summaries
+            if int(summary.get('subclient', {}).get('subclientId', 0)) == int(subclient.subclient_id)
+        ]
+        return sorted(summaries, key=lambda summary: int(summary['jobId']), reverse=True)
+
+    def _list_jobs(self, category, lookup_time, offset, limit, client_list, job_types=None, entity=None):
+        """Returns a page of the jobs matching the given filters, as in JobController.all_jobs() of CVPySDK.
+
+            Returns:
+                tuple - (list of the summaries of the visible jobs of the page, total number of jobs)
+
+            Raises:
+                Exception if the request failed.
+
+        """
+        request_json = {
+            'scope': 1,
+            'category': JOB_CATEGORIES[category.upper()],
+            'pagingConfig': {'sortDirection': 1, 'offset': offset, 'sortField': 'jobId', 'limit': limit},
+            'jobFilter': {
+                'completedJobLookupTime': int(lookup_time * 60 * 60),
+                'showAgedJobs': False,
+                'hideAdminJobs': False,
+                'clientList': client_list,
+                'jobTypeList': list(job_types or [])
+            }
+        }
+        if entity:
+            request_json['jobFilter']['entity'] = entity
+
+        flag, response = self.commcell._cvpysdk_object.make_request(
+            'POST', self.commcell._services['ALL_JOBS'], request_json
+        )
+        if not flag:
+            raise Exception(f"Failed to get the jobs: {self.commcell._update_response_(response.text)}")
+
+        response_json = response.json() or {}
+        summaries = [
+            job['jobSummary'] for job in response_json.get('jobs') or []
+            if job.get('jobSummary') and job['jobSummary'].get('isVisible') is not False
+        ]
+        return summaries, response_json.get('totalRecordsWithoutPaging', 0)
+
+    @staticmethod
+    def project(summary, fields):
+        """Returns the given fields of a job summary, a field of a nested object is given by its dotted path.
+
+            Args:
+                summary (dict)  --  Summary of the job.
+
+                fields  (list)  --  Fields to keep, e.g. ['jobId', 'status', 'subclient.clientName'].
+
+            Returns:
+                dict - {field: value}, None for the fields missing from the summary.
+
+        """
+        projection = {}
+        for field in fields:
+            value = summary
+            for key in field.split('.'):
+                value = value.get(key) if isinstance(value, dict) else None
+            projection[field] = value
+
+        return projection
+
+    def control(self, job_id, action):
+        """Kills, suspends or resumes a job, with a single POST request.
+
+            Args:
+                job_id  (int)   --  ID of the job.
+
+                action  (str)   --  One of kill, suspend & resume.
+
+            Raises:
+                Exception if the request failed or the server refused the action.
+
+        """
+        flag, response = self.commcell._cvpysdk_object.make_request(
+            'POST', self.commcell._services[CONTROL_ACTIONS[action][0]] % job_id
+        )
+        if not flag:
+            raise Exception(f"Job {action} failed: {self.commcell._update_response_(response.text)}")
+
+        response_json = response.json() or {}
+        if 'errors' in response_json:
+            error = response_json['errors'][0]['errList'][0]
+            error_code, error_message = error['errorCode'], error['errLogMessage'].strip()
+        else:
+            error_code, error_message = response_json.get('errorCode', 0), response_json.get('errorMessage', 'nil')
+
+        if error_code != 0:
+            raise Exception(f'Job {action} failed\nError: "{error_message}"')
+
+    def control_all(self, job_ids, action, wait=False, timeout=CONTROL_WAIT_TIMEOUT):
+        """Kills, suspends or resumes the given jobs concurrently, optionally waiting for all of them together.
+
+            Args:
+                job_ids (list)  --  IDs of the jobs.
+
+                action  (str)   --  One of kill, suspend & resume.
+
+                wait    (bool)  --  Wait till the jobs reach the status of the action, or finish.
+                    default :   False
+
+                timeout (int)   --  Maximum seconds to wait for.
+                    default :   CONTROL_WAIT_TIMEOUT
+
+            Returns:
+                dict - {job_id: {'requested': bool, 'status': str, 'error': str}}, the status is only set when
+                waiting, the error only when the action failed.
+
+        """
+        job_ids = list(dict.fromkeys(int(job_id) for job_id in job_ids))
+        outcomes = {}
+
+        def request(job_id):
+            try:
+                self.control(job_id, action)
+                outcomes[job_id] = {'requested': True}
+            except Exception as e:
+                outcomes[job_id] = {'requested': False, 'error': str(e)}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(job_ids)))) as executor:
+            list(executor.map(request, job_ids))
+
+        requested = [job_id for job_id in job_ids if outcomes[job_id]['requested']]
+        if wait and requested:
+            states, errors, _ = self.wait(
+                requested, timeout=timeout, poll_interval=3, max_poll_interval=3,
+                target_status=CONTROL_ACTIONS[action][1]
+            )
+            for job_id in requested:
+                if job_id in errors:
+                    outcomes[job_id]['error'] = errors[job_id]
+                else:
+                    outcomes[job_id]['status'] = states[job_id]['status']
+
+        return {job_id: outcomes[job_id] for job_id in job_ids}
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for class CommcellHandle, a lazy stand-in for the CVPySDK Commcell object.
+
+CommcellHandle is the only class defined in this file.
+
+CommcellHandle: Represents an authenticated HTTP channel to the Web Server, built from a session record without any
+request to the server. The full Commcell object, along with its entity collections (clients, plans, workflows,
+storage_pools etc.), is only created when one of its attributes is first accessed.
+
+CommcellHandle:
+    __init__()              --  Initializes the handle from the session record.
+    __getattr__()           --  Creates the full Commcell object on first access & delegates to it.
+    _update_response_()     --  Returns only the relevant response from the response received from the server.
+    commcell_object         --  Returns the full Commcell object, creating it if required.
+    auth_token              --  Returns the auth token of the session.
+    webconsole_hostname     --  Returns the hostname of the Web Server.
+    device_id               --  Returns the device ID sent to the server on token renewal.
+    is_service_commcell     --  Returns False, service commcell sessions are never resumed from the session file.
+    master_saml_token       --  Returns None, service commcell sessions are never resumed from the session file.
+    logout()                --  Logs out of the Commcell.
+
+"""
+
+import socket
+import threading
+
+from .session_agent import SessionAgentClient
+
+
+class CommcellHandle:
+    """Class representing a lazy Commcell handle, resumed from the session record."""
+
+    def __init__(self, webserver_hostname, auth_token, web_service, verify_ssl=True, certificate_path=None,
+                 agent_socket=None, **kwargs):
+        """Initializes the handle from the session record, no request is made to the server.
+
+            Args:
+                webserver_hostname  (str)   --  Hostname of the Web Server.
+
+                auth_token          (str)   --  QSDK token of the logged in user.
+
+                web_service         (str)   --  URL of the web service, as resolved by the login.
+
+                verify_ssl          (bool)  --  Verify the SSL certificate of the Web Server.
+                    default :   True
+
+                certificate_path    (str)   --  Path of the CA_BUNDLE or directory with certificates of trusted CAs.
+                    default :   None
+
+                agent_socket        (str)   --  Path of the socket of the persistent session agent, when enabled at login
+                the requests are forwarded to the agent to reuse its warm connections.
+                    default :   None
+
+        """
+        from cvpysdk.cvpysdk import CVPySDK
+        from cvpysdk.services import get_services
+
+        self._commcell = None
+        self._commcell_lock = threading.Lock()
+        self._user = None
+        self._password = None
+        self._is_saml_login = auth_token.startswith('SAML ')
+        self._device_id = socket.getfqdn()
+        self._headers = {
+            'Host': webserver_hostname,
+            'Accept': 'application/json',
+            'Content-type': 'application/json',
+            'Authtoken': auth_token
+        }
+        self._verify_ssl = verify_ssl if verify_ssl is not None else True
+        self._certificate_path = certificate_path
+        self._web_service = web_service
+        self._services = get_services(web_service)
+        self._cvpysdk_object = CVPySDK(self, certificate_path, self._verify_ssl)
+
+        if agent_socket:
+            self._cvpysdk_object._request = SessionAgentClient(agent_socket, self._cvpysdk_object).request
+
+    def __getattr__(self, attribute):
+        """Creates the full Commcell object on first access of an attribute not held by the handle & delegates to it.
+
+            Args:
+                attribute   (str)   --  Name of the attribute.
+
+        """
+        if attribute.startswith('__') or attribute == '_commcell':
+            raise AttributeError(attribute)
+
+        return getattr(self.commcell_object, attribute)
+
+    @staticmethod
+    def _update_response_(input_string):
+        """Returns only the relevant response from the response received from the server.
+
+            Args:
+                input_string    (str)   --  input string to retrieve the relevant response from
+
+            Returns:
+                str     -   final response to be used
+
+        """
+        if '<title>' in input_string and '</title>' in input_string:
+            return input_string.split("<title>")[1].split("</title>")[0]
+
+        return input_string
+
+    @property
+    def commcell_object(self):
+        """Returns the full Commcell object, creating it from the auth token on first access.
+
+            The Commcell object shares the request headers & the CVPySDK object of the handle, so a renewed token
+            is seen by both and the requests of the entities created from it also go through the session agent.
+            Concurrent first accesses, e.g. from the threads of a fan-out, create a single Commcell object.
+
+        """
+        with self._commcell_lock:
+            if self._commcell is None:
+                from cvpysdk.commcell import Commcell
+
+                commcell = Commcell(
+                    webconsole_hostname=self._headers['Host'],
+                    authtoken=self._headers['Authtoken'],
+                    verify_ssl=self._verify_ssl,
+                    certificate_path=self._certificate_path,
+                    web_service_url=self._web_service.rstrip('/'),
+                )
+                commcell._headers = self._headers
+                commcell._cvpysdk_object = self._cvpysdk_object
+                self._commcell = commcell
+
+        return self._commcell
+
+    @property
+    def auth_token(self):
+        """Returns the auth token of the session."""
+        return self._headers['Authtoken']
+
+    @property
+    def webconsole_hostname(self):
+        """Returns the hostname of the Web Server."""
+        return self._headers['Host']
+
+    @property
+    def device_id(self):
+        """Returns the device ID sent to the server on token renewal."""
+        return self._device_id
+
+    @property
+    def is_service_commcell(self):
+        """Returns False, service commcell sessions are never resumed from the session file."""
+        return False
+
+    @property
+    def master_saml_token(self):
+        """Returns None, service commcell sessions are never resumed from the session file."""
+        return None
+
+    def logout(self):
+        """Logs out of the Commcell, without creating the full Commcell object."""
+        return self._cvpysdk_object._logout()
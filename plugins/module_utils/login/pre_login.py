@@ -23,17 +23,20 @@ PreLogin is the only class defined in this file.
 PreLogin: Represents pre login tasks, including deletion of old session files and creation of a new session file.
 
 PreLogin:
-    clean_up()              --  Logs in to Commcell.
+    clean_up()              --  Deletes the sessions past their expiry time.
     create_session_file()   --  Create a session file based on the UID of the user executing the script.
 
 """
 
 import os
-import glob
 import stat
-from time import time
 
-FILE_PATH = os.path.join(os.sep, "tmp", "CVANSIBLE_{SESSION_ID}")
+from .session_registry import (
+    SESSION_DIR,
+    SessionRegistry
+)
+
+FILE_PATH = os.path.join(SESSION_DIR, "{SESSION_ID}")
 SESSION_ID = os.getuid()
 
 
@@ -43,27 +46,23 @@ class PreLogin:
     @staticmethod
     def clean_up():
         """
-        Performs pre-login operations i.e clean up of old session file & creation of new file for current session.
-        Returns a file handle to the session file.
+        Performs pre-login operations i.e clean up of expired sessions & creation of the session directory.
+
+        The expired sessions are found from the index of the session directory, only their files are touched.
 
             Args:
                 N/A
 
             Returns:
-                N/A
+                list - IDs of the evicted sessions.
 
             Raises:
-                Exception in case the older session files can't be deleted.
+                PermissionError if the session directory is not owned by the current user.
 
         """
-        # STEP 1 : TRY TO CLEAN UP ALL STALE SESSION FILES.
-        all_session_files = glob.glob(FILE_PATH.format(SESSION_ID="*"))
-        for file in all_session_files:
-            try:
-                if int(time())-int(os.path.getatime(file)) > 86400:
-                    os.remove(file)
-            except OSError:
-                continue
+        registry = SessionRegistry()
+        registry.prepare()
+        return registry.evict_expired()
 
     @staticmethod
     def create_session_file():
@@ -81,6 +80,7 @@ class PreLogin:
 
         """
 
+        SessionRegistry().prepare()
         session_file_path = FILE_PATH.format(SESSION_ID=SESSION_ID)
         fh = open(session_file_path, 'wb')
         os.chmod(session_file_path, stat.S_IRWXU)  # SET READ, WRITE & EXECUTE PERMISSIONS FOR OWNER
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for class SessionFile, class for reading and writing the session file.
+
+SessionFile is the only class defined in this file.
+
+SessionFile: Represents the session file, a compact JSON record holding the hostname, web service URL, auth token &
+TLS settings required to rebuild a Commcell handle without logging in again.
+
+SessionFile:
+    __init__()      --  Initializes the session file for the given path.
+    create_record() --  Builds a session record from the login arguments & the auth token.
+    lock()          --  Context manager holding an exclusive lock on the session file.
+    load()          --  Reads the session record from the session file.
+    save()          --  Atomically writes the session record to the session file, under the lock.
+    update()        --  Applies changes to the latest session record on disk & saves it, under the lock.
+    _write()        --  Atomically writes the session record to the session file.
+
+"""
+
+import json
+import stat
+from time import time
+
+from ..atomic_file import (
+    atomic_write,
+    locked
+)
+
+SESSION_FORMAT_VERSION = 1
+SESSION_RECORD_KEYS = [
+    'webserver_hostname', 'web_service', 'auth_token', 'force_https', 'verify_ssl', 'certificate_path', 'agent_socket',
+    'pool', 'renewal'
+]
+
+
+class SessionFile:
+    """Class representing the session file of a Commvault Ansible session."""
+
+    def __init__(self, path):
+        """Initializes the session file for the given path.
+
+            Args:
+                path    (str)   --  Full path of the session file.
+
+        """
+        self.path = path
+        self.lock_path = f"{path}.lock"
+
+    @staticmethod
+    def create_record(login_args, auth_token, web_service):
+        """Builds a session record from the login arguments & the auth token.
+
+            Args:
+                login_args  (dict)  --  Login arguments, only the keys in SESSION_RECORD_KEYS are kept.
+
+                auth_token  (str)   --  QSDK token of the logged in user.
+
+                web_service (str)   --  URL of the web service, as resolved by the login.
+
+            Returns:
+                dict - session record with a small metadata header.
+
+        """
+        record = {key: login_args.get(key) for key in SESSION_RECORD_KEYS}
+        record['auth_token'] = auth_token
+        record['web_service'] = web_service
+        record['header'] = {'version': SESSION_FORMAT_VERSION, 'created': int(time())}
+        return record
+
+    def load(self):
+        """Reads the session record from the session file.
+
+            Returns:
+                dict - session record.
+
+            Raises:
+                FileNotFoundError if the session file does not exist.
+
+                ValueError if the session file is not a session record of a supported version.
+
+        """
+        with open(self.path, 'r') as fh:
+            try:
+                record = json.load(fh)
+            except (ValueError, UnicodeDecodeError):
+                raise ValueError(f"Session file {self.path} is not in a supported format, please login again.")
+
+        if not isinstance(record, dict) or record.get('header', {}).get('version') != SESSION_FORMAT_VERSION:
+            raise ValueError(f"Session file {self.path} is not in a supported format, please login again.")
+
+        return record
+
+    def lock(self):
+        """Context manager holding an exclusive fcntl lock on the session file, shared by all the forks of a play."""
+        return locked(self.lock_path)
+
+    def save(self, record):
+        """Atomically writes the session record to the session file, under the lock.
+
+            Args:
+                record  (dict)  --  session record to be saved.
+
+        """
+        with self.lock():
+            self._write(record)
+
+    def update(self, updater):
+        """Applies changes to the latest session record on disk & saves it, under the lock.
+
+            Used when several forks may change different parts of the same record, e.g. the tokens of a session pool.
+
+            Args:
+                updater (callable)  --  Called with the latest session record, changes it in place.
+
+        """
+        with self.lock():
+            record = self.load()
+            updater(record)
+            self._write(record)
+
+    def _write(self, record):
+        """Atomically writes the session record to the session file, with RWX permissions for owner.
+
+            The record is written to a temporary file in the same directory & renamed over the session file, readers
+            never see a partially written session file. Callers must hold the lock.
+
+            Args:
+                record  (dict)  --  session record to be saved.
+
+        """
+        with atomic_write(self.path, stat.S_IRWXU) as fh:  # SET READ, WRITE & EXECUTE PERMISSIONS FOR OWNER
+            json.dump(record, fh)
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for the persistent session agent, a local daemon keeping the connections to the Web Server warm across tasks.
+
+SessionAgent, AgentResponse & SessionAgentClient are the classes defined in this file.
+
+SessionAgent: Represents the daemon, it listens on a Unix socket next to the session file and forwards the requests
+of the modules over a single HTTP keep-alive session.
+
+AgentResponse: Represents a response forwarded by the daemon, exposes the subset of requests.Response used by CVPySDK.
+
+SessionAgentClient: Represents the module side of the daemon, a drop-in replacement for CVPySDK._request().
+
+SessionAgent:
+    start()     --  Starts the daemon for the given socket path, if it is not already running.
+    stop()      --  Stops the daemon listening on the given socket path.
+    _serve()    --  Serves the requests until the daemon is stopped or stays idle for too long.
+
+AgentResponse:
+    __init__()  --  Initializes the response from the message sent by the daemon.
+    ok          --  Returns True if the status code is less than 400.
+    text        --  Returns the body of the response as a string.
+    json()      --  Returns the body of the response parsed as JSON.
+
+SessionAgentClient:
+    __init__()  --  Initializes the client for the given socket path & TLS settings.
+    request()   --  Forwards the request to the daemon, falls back to a direct request if it can't be reached.
+
+"""
+
+import json
+import os
+import socket
+import socketserver
+from base64 import b64decode, b64encode
+from time import sleep, time
+
+AGENT_IDLE_TIMEOUT = 600
+
+
+def _connect(socket_path, timeout=None):
+    """Connects to the daemon listening on the socket path and returns the connected socket."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def _exchange(sock, message):
+    """Sends a message over the connected socket, closed afterwards, and returns the reply of the daemon."""
+    with sock, sock.makefile('rwb') as fh:
+        fh.write(json.dumps(message).encode() + b'\n')
+        fh.flush()
+        return json.loads(fh.readline())
+
+
+def _send_message(socket_path, message, timeout=None):
+    """Sends a message to the daemon listening on the socket path and returns its reply."""
+    return _exchange(_connect(socket_path, timeout), message)
+
+
+class _AgentRequestHandler(socketserver.StreamRequestHandler):
+    """Handles a single request forwarded by a module."""
+
+    def handle(self):
+        """Performs the request over the keep-alive session of the daemon and writes back the response."""
+        message = json.loads(self.rfile.readline())
+        self.server.last_activity = time()
+
+        if message.get('op') == 'shutdown':
+            self.server.stopped = True
+            reply = {'op': 'shutdown'}
+
+        elif message.get('op') == 'ping':
+            reply = {'op': 'ping'}
+
+        else:
+            try:
+                data = message.get('data')
+                response = self.server.http.request(
+                    method=message['method'],
+                    url=message['url'],
+                    headers=message.get('headers'),
+                    json=message.get('json'),
+                    data=b64decode(data) if data is not None else None,
+                    verify=message.get('verify', True),
+                    timeout=message.get('timeout'),
+                )
+                reply = {
+                    'status_code': response.status_code,
+                    'reason': response.reason,
+                    'headers': dict(response.headers),
+                    'content': b64encode(response.content).decode(),
+                }
+
+            except Exception as e:
+                reply = {'error': type(e).__name__, 'msg': str(e)}
+
+        self.wfile.write(json.dumps(reply).encode() + b'\n')
+
+
+class _AgentServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server holding the HTTP keep-alive session shared by all the tasks."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, idle_timeout):
+        """Binds the server to the socket path, readable & writable by the owner only."""
+        import requests
+
+        super().__init__(socket_path, _AgentRequestHandler)
+        self.http = requests.Session()
+        self.idle_timeout = idle_timeout
+        self.last_activity = time()
+        self.stopped = False
+        self.timeout = 1
+
+
+class SessionAgent:
+    """Class representing the persistent session agent."""
+
+    @staticmethod
+    def start(socket_path, idle_timeout=AGENT_IDLE_TIMEOUT):
+        """Starts the daemon for the given socket path, if it is not already running.
+
+            Args:
+                socket_path     (str)   --  Path of the Unix socket the daemon listens on.
+
+                idle_timeout    (int)   --  Seconds without any request after which the daemon exits.
+                    default :   AGENT_IDLE_TIMEOUT
+
+            Returns:
+                bool - True if the daemon is listening on the socket path.
+
+        """
+        try:
+            _send_message(socket_path, {'op': 'ping'}, timeout=5)
+            return True
+        except (OSError, ValueError):
+            pass
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+        pid = os.fork()
+        if pid == 0:
+            # Double fork so that the daemon is re-parented to init & never holds the module's stdout open.
+            os.setsid()
+            if os.fork() != 0:
+                os._exit(0)
+            SessionAgent._serve(socket_path, idle_timeout)
+            os._exit(0)
+
+        os.waitpid(pid, 0)
+        for _ in range(50):
+            if os.path.exists(socket_path):
+                return True
+            sleep(0.1)
+
+        return False
+
+    @staticmethod
+    def stop(socket_path):
+        """Stops the daemon listening on the given socket path, does nothing if it is not running.
+
+            Args:
+                socket_path     (str)   --  Path of the Unix socket the daemon listens on.
+
+        """
+        try:
+            _send_message(socket_path, {'op': 'shutdown'}, timeout=5)
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def _serve(socket_path, idle_timeout):
+        """Serves the requests until the daemon is stopped or stays idle for too long, runs in the daemon process."""
+        os.chdir(os.sep)
+        os.umask(0o077)
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in range(3):
+            os.dup2(devnull, fd)
+
+        server = _AgentServer(socket_path, idle_timeout)
+        try:
+            while not server.stopped and time() - server.last_activity < server.idle_timeout:
+                server.handle_request()
+        finally:
+            server.server_close()
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+
+
+class AgentResponse:
+    """Class representing a response forwarded by the session agent."""
+
+    def __init__(self, message):
+        """Initializes the response from the message sent by the daemon.
+
+            Args:
+                message     (dict)  --  Reply of the daemon.
+
+        """
+        from requests.structures import CaseInsensitiveDict
+
+        self.status_code = message['status_code']
+        self.reason = message.get('reason')
+        # Looked up case insensitively, as on the response of requests, e.g. headers['content-type'].
+        self.headers = CaseInsensitiveDict(message.get('headers') or {})
+        self.content = b64decode(message['content'])
+
+    @property
+    def ok(self):
+        """Returns True if the status code is less than 400."""
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        """Returns the body of the response as a string."""
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        """Returns the body of the response parsed as JSON."""
+        return json.loads(self.content)
+
+
+class SessionAgentClient:
+    """Class representing the module side of the session agent."""
+
+    def __init__(self, socket_path, cvpysdk_object):
+        """Initializes the client for the given socket path.
+
+            Args:
+                socket_path     (str)       --  Path of the Unix socket the daemon listens on.
+
+                cvpysdk_object  (object)    --  CVPySDK object whose requests are forwarded, its original _request() is
+                used when the daemon is not reachable or for requests which can't be forwarded (file uploads & streamed
+                downloads).
+
+        """
+        self.socket_path = socket_path
+        self.cvpysdk_object = cvpysdk_object
+        self.direct_request = cvpysdk_object._request
+        self.available = os.path.exists(socket_path)
+
+    def request(self, **kwargs):
+        """Forwards the request to the daemon, falls back to a direct request if it can't be reached.
+
+            Only a failed connection to the daemon falls back, once the request is sent the daemon may have
+            forwarded it & a job started by a POST would be started twice by a direct request.
+
+            Args:
+                **kwargs    (dict)      --  Same arguments as accepted by requests.request().
+
+            Returns:
+                object - AgentResponse, or requests.Response for a direct request.
+
+            Raises:
+                requests.exceptions.ConnectionError if the daemon failed to reach the Web Server, or failed to
+                reply once the request was sent.
+
+        """
+        if not self.available or kwargs.get('files') is not None or kwargs.get('stream'):
+            return self.direct_request(**kwargs)
+
+        data = kwargs.get('data')
+        if isinstance(data, str):
+            data = data.encode()
+
+        # SAME VERIFY RULES AS CVPySDK._request()
+        verify = self.cvpysdk_object._verify_ssl
+        if self.cvpysdk_object._certificate_path and kwargs['url'].startswith('https'):
+            verify = self.cvpysdk_object._certificate_path
+
+        message = {
+            'method': kwargs['method'],
+            'url': kwargs['url'],
+            'headers': kwargs.get('headers'),
+            'json': kwargs.get('json'),
+            'data': b64encode(data).decode() if data is not None else None,
+            'verify': verify,
+            'timeout': kwargs.get('timeout'),
+        }
+
+        from requests.exceptions import ConnectionError as RequestsConnectionError
+
+        try:
+            sock = _connect(self.socket_path)
+        except OSError:
+            self.available = False
+            return self.direct_request(**kwargs)
+
+        try:
+            reply = _exchange(sock, message)
+        except (OSError, ValueError) as e:
+            self.available = False
+            raise RequestsConnectionError(
+                f"The session agent failed to reply to {kwargs['method']} {kwargs['url']}, the request is not "
+                f"replayed as it may have reached the Web Server: {e}"
+            )
+
+        if 'error' in reply:
+            raise RequestsConnectionError(reply['msg'])
+
+        return AgentResponse(reply)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for class SessionPool, class for leasing one of the auth tokens created by a pooled login.
+
+SessionPool is the only class defined in this file.
+
+SessionPool: Represents the pool of auth tokens stored in the session record, each module instance leases one token
+so that parallel tasks don't queue on a single token at the CommServe.
+
+SessionPool:
+    __init__()      --  Initializes the pool for the given session file & pool size.
+    claim()         --  Leases a free slot of the pool, the lock of the pool is only taken to reclaim a stale lease.
+    release()       --  Releases the slot leased by claim().
+    _take()         --  Takes the lease of a slot, if the slot is free or its lease is stale.
+    _read_lease()   --  Returns the PID & the age of a lease file.
+    _is_stale()     --  Checks if the lease file belongs to a process which no longer exists.
+
+"""
+
+import os
+import tempfile
+from time import time
+
+from ..atomic_file import locked
+
+# Seconds after which a lease file without a PID is stale, its owner died before writing it.
+LEASE_EMPTY_TTL = 60
+
+
+class SessionPool:
+    """Class representing the pool of auth tokens of a session."""
+
+    def __init__(self, session_file_path, size):
+        """Initializes the pool for the given session file & pool size.
+
+            Args:
+                session_file_path   (str)   --  Full path of the session file.
+
+                size                (int)   --  Number of auth tokens in the pool.
+
+        """
+        self.session_file_path = session_file_path
+        self.size = size
+        self.lock_path = f"{session_file_path}.lease.lock"
+        self.lease_path = None
+
+    def claim(self):
+        """Leases a free slot of the pool, the lock of the pool is only taken to reclaim a stale lease.
+
+            A slot is leased by linking a file holding the PID to its lease file, the probe starts at a slot derived
+            from the PID so that concurrent forks spread over the pool. Leases left by dead processes are reclaimed.
+            When every slot is leased, the slot derived from the PID is shared without a lease.
+
+            Returns:
+                int - index of the leased slot.
+
+        """
+        start = os.getpid() % self.size
+
+        for offset in range(self.size):
+            index = (start + offset) % self.size
+            lease_path = f"{self.session_file_path}.lease.{index}"
+            if self._take(lease_path):
+                self.lease_path = lease_path
+                return index
+
+        return start
+
+    def release(self):
+        """Releases the slot leased by claim(), does nothing if no slot was leased or the lease was reclaimed."""
+        if self.lease_path:
+            if self._read_lease(self.lease_path)[0] == os.getpid():
+                try:
+                    os.remove(self.lease_path)
+                except FileNotFoundError:
+                    pass
+            self.lease_path = None
+
+    def _take(self, lease_path):
+        """Takes the lease of a slot, if the slot is free or its lease is stale.
+
+            The PID is written to a temporary file, linked to the lease file of a free slot so that a lease is never
+            seen without its PID. A stale lease is replaced by renaming the temporary file over it while holding the
+            lock of the pool, & its owner is read again afterwards, so that two forks can't both reclaim it.
+
+            Args:
+                lease_path  (str)   --  Path of the lease file.
+
+            Returns:
+                bool - True if the lease was taken.
+
+        """
+        pid = os.getpid()
+        fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(lease_path)}.", dir=os.path.dirname(lease_path))
+        try:
+            with os.fdopen(fd, 'w') as fh:
+                fh.write(str(pid))
+
+            try:
+                os.link(temp_path, lease_path)
+                return True
+            except FileExistsError:
+                pass
+
+            with locked(self.lock_path):
+                try:
+                    # Released meanwhile --> taken as a free slot, a fork linking it first keeps it.
+                    os.link(temp_path, lease_path)
+                    return True
+                except FileExistsError:
+                    if not self._is_stale(lease_path):
+                        return False
+
+                os.rename(temp_path, lease_path)
+                return self._read_lease(lease_path)[0] == pid
+
+        finally:
+            try:
+                os.remove(temp_path)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _read_lease(lease_path):
+        """Returns the PID & the age of a lease file.
+
+            Args:
+                lease_path  (str)   --  Path of the lease file.
+
+            Returns:
+                tuple - (PID, age in seconds), the PID is 0 if the file holds none, both are None if the file
+                can't be read.
+
+        """
+        try:
+            with open(lease_path) as fh:
+                content = fh.read().strip()
+                age = time() - os.fstat(fh.fileno()).st_mtime
+        except OSError:
+            return None, None
+
+        return int(content) if content.isdigit() else 0, age
+
+    @classmethod
+    def _is_stale(cls, lease_path):
+        """Checks if the lease file belongs to a process which no longer exists.
+
+            Args:
+                lease_path  (str)   --  Path of the lease file.
+
+            Returns:
+                bool - True if the owner of the lease is dead, or the lease holds no PID past LEASE_EMPTY_TTL.
+
+        """
+        pid, age = cls._read_lease(lease_path)
+        if pid is None:
+            return False
+
+        if not pid:
+            # LEASE FILE WITHOUT A PID, LEFT BY A PROCESS WHICH DIED BEFORE WRITING IT
+            return age >= LEASE_EMPTY_TTL
+
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+
+        return False
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for class SessionRegistry, class for the index of the sessions stored in the session directory.
+
+SessionRegistry is the only class defined in this file.
+
+SessionRegistry: Represents the session directory of the user & its index file, which records the creation & expiry
+time of every session so that stale sessions are evicted without scanning the directory.
+
+SessionRegistry:
+    __init__()          --  Initializes the registry for the given session directory.
+    prepare()           --  Creates the session directory, readable & writable by the owner only.
+    register()          --  Records a session in the index, with its expiry time.
+    remove()            --  Removes a session & all its files from the directory & the index.
+    evict_expired()     --  Removes all the sessions past their expiry time.
+    _lock()             --  Context manager holding an exclusive lock on the index.
+    _load()             --  Reads the index file.
+    _save()             --  Atomically writes the index file.
+    _delete_files()     --  Deletes the session file of a session along with its lock, lease & socket files.
+
+"""
+
+import glob
+import json
+import os
+import stat
+from contextlib import contextmanager
+from time import time
+
+from ..atomic_file import (
+    atomic_write,
+    locked
+)
+
+SESSION_DIR = os.path.join(os.sep, "tmp", f"CVANSIBLE_SESSIONS_{os.getuid()}")
+SESSION_TTL = 86400
+
+
+class SessionRegistry:
+    """Class representing the index of the sessions stored in the session directory."""
+
+    def __init__(self, directory=SESSION_DIR):
+        """Initializes the registry for the given session directory.
+
+            Args:
+                directory   (str)   --  Path of the session directory.
+                    default :   SESSION_DIR
+
+        """
+        self.directory = directory
+        self.index_path = os.path.join(directory, "index.json")
+        self.lock_path = os.path.join(directory, "index.lock")
+
+    def prepare(self):
+        """Creates the session directory, readable & writable by the owner only.
+
+            Raises:
+                PermissionError if the path exists & is not a directory owned by the current user.
+
+        """
+        try:
+            os.mkdir(self.directory, stat.S_IRWXU)
+        except FileExistsError:
+            pass
+
+        # The directory lives in a world writable location, never trust one created by someone else.
+        info = os.lstat(self.directory)
+        if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+            raise PermissionError(f"Session directory {self.directory} is not a directory owned by the current user.")
+
+        if stat.S_IMODE(info.st_mode) != stat.S_IRWXU:
+            os.chmod(self.directory, stat.S_IRWXU)
+
+    def register(self, session_id, ttl=SESSION_TTL):
+        """Records a session in the index, with its expiry time.
+
+            Args:
+                session_id  (str)   --  ID of the session, the name of its session file.
+
+                ttl         (int)   --  Seconds after which the session is evicted.
+                    default :   SESSION_TTL
+
+        """
+        created = int(time())
+        with self._lock():
+            index = self._load()
+            index[str(session_id)] = {'created': created, 'expires': created + ttl}
+            self._save(index)
+
+    def remove(self, session_id):
+        """Removes a session & all its files from the directory & the index.
+
+            Args:
+                session_id  (str)   --  ID of the session, the name of its session file.
+
+        """
+        with self._lock():
+            index = self._load()
+            if index.pop(str(session_id), None) is not None:
+                self._save(index)
+            self._delete_files(str(session_id))
+
+    def evict_expired(self):
+        """Removes all the sessions past their expiry time, only the files of the expired sessions are touched.
+
+            Returns:
+                list - IDs of the evicted sessions.
+
+        """
+        if not os.path.exists(self.index_path):
+            return []
+
+        now = int(time())
+        with self._lock():
+            index = self._load()
+            expired = [session_id for session_id, entry in index.items() if entry.get('expires', 0) <= now]
+            for session_id in expired:
+                del index[session_id]
+                self._delete_files(session_id)
+
+            if expired:
+                self._save(index)
+
+        return expired
+
+    @contextmanager
+    def _lock(self):
+        """Context manager holding an exclusive lock on the index while it is read & updated."""
+        self.prepare()
+        with locked(self.lock_path):
+            yield
+
+    def _load(self):
+        """Reads the index file, a missing or unreadable index is treated as empty.
+
+            Returns:
+                dict - {session_id: {'created': int, 'expires': int}}
+
+        """
+        try:
+            with open(self.index_path) as fh:
+                index = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+
+        return index if isinstance(index, dict) else {}
+
+    def _save(self, index):
+        """Atomically writes the index file, callers must hold the lock.
+
+            Args:
+                index   (dict)  --  {session_id: {'created': int, 'expires': int}}
+
+        """
+        with atomic_write(self.index_path) as fh:
+            json.dump(index, fh)
+
+    def _delete_files(self, session_id):
+        """Deletes the session file of a session along with its lock, lease & socket files.
+
+            Args:
+                session_id  (str)   --  ID of the session, the name of its session file.
+
+        """
+        session_file_path = os.path.join(self.directory, session_id)
+        paths = [session_file_path, f"{session_file_path}.lock", f"{session_file_path}.sock"]
+        paths.extend(glob.glob(f"{glob.escape(session_file_path)}.lease.*"))
+
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
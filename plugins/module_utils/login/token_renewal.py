@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for class TokenRenewal, class for renewing an expired auth token with the renewal credential of the session.
+
+TokenRenewal is the only class defined in this file.
+
+TokenRenewal: Represents the renewal of the auth token of a resumed session. CVPySDK renews the token on a 401
+response & replays the request, but the renewal of an expired token is refused by the server. TokenRenewal falls
+back to a fresh login with the renewal credential stored with the session, once per task.
+
+TokenRenewal:
+    __init__()          --  Initializes the renewal for the given Commcell handle & renewal credential.
+    create_credential() --  Builds the renewal credential stored in the session record.
+    install()           --  Replaces the token renewal of the CVPySDK object of the Commcell handle.
+    renew()             --  Renews the auth token, logs in again if the token can't be renewed.
+    _renew()            --  Renews the auth token with CVPySDK, or else logs in again with the renewal credential.
+
+"""
+
+import threading
+from base64 import b64encode
+
+
+class TokenRenewal:
+    """Class representing the renewal of the auth token of a resumed session."""
+
+    def __init__(self, commcell, username, password):
+        """Initializes the renewal for the given Commcell handle & renewal credential.
+
+            Args:
+                commcell    (object)    --  Commcell handle resumed from the session record.
+
+                username    (str)       --  Username for log in to the Commcell console.
+
+                password    (str)       --  Base64 encoded password, as sent by CVPySDK in the login request.
+
+        """
+        self.commcell = commcell
+        self.username = username
+        self.password = password
+        self.renewed = False
+        self.sdk_renew = None
+        self._lock = threading.RLock()
+        self._renewing = False
+
+    @staticmethod
+    def create_credential(username, password):
+        """Builds the renewal credential stored in the session record.
+
+            Args:
+                username    (str)   --  Username for log in to the Commcell console.
+
+                password    (str)   --  Plain-text password for log in to the console.
+
+            Returns:
+                dict - {'username': str, 'password': str}, the password is Base64 encoded like in the login request.
+
+        """
+        return {'username': username, 'password': b64encode(password.encode()).decode()}
+
+    def install(self):
+        """Replaces the token renewal of the CVPySDK object of the Commcell handle, the requests failing with
+        401 are replayed by CVPySDK with the token returned by renew().
+
+            Returns:
+                object - this TokenRenewal.
+
+        """
+        cvpysdk_object = self.commcell._cvpysdk_object
+        self.sdk_renew = cvpysdk_object._renew_login_token
+        cvpysdk_object._renew_login_token = self.renew
+        return self
+
+    def renew(self):
+        """Renews the auth token, logs in again with the renewal credential if the token can't be renewed.
+
+            The login is attempted once per task, a token which still fails is reported by CVPySDK. Concurrent
+            requests of the task renew the token one at a time. The renewal & login requests are themselves sent by
+            CVPySDK, which calls renew() again on the same thread when they get a 401, that renewal fails at once.
+
+            Returns:
+                str - new auth token.
+
+            Raises:
+                SDKException if the token can't be renewed & the login fails or was already attempted, or if a
+                renewal or login request got a 401.
+
+        """
+        from cvpysdk.exception import SDKException
+
+        failed_token = self.commcell._headers['Authtoken']
+        with self._lock:
+            if self._renewing:
+                raise SDKException('Response', '101', "The renewal of the auth token was refused with a 401")
+
+            # Already renewed by a concurrent request of the task.
+            if self.commcell._headers['Authtoken'] != failed_token:
+                return self.commcell._headers['Authtoken']
+
+            self._renewing = True
+            try:
+                return self._renew()
+            finally:
+                self._renewing = False
+
+    def _renew(self):
+        """Renews the auth token with CVPySDK, or else logs in again with the renewal credential, once per task."""
+        from cvpysdk.exception import SDKException
+
+        try:
+            return self.sdk_renew()
+
+        except SDKException:
+            if self.renewed:
+                raise
+
+        self.renewed = True
+        self.commcell._user = self.username
+        self.commcell._password = self.password
+        try:
+            return self.commcell._cvpysdk_object._login()
+        finally:
+            self.commcell._user = None
+            self.commcell._password = None
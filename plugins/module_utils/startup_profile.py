@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for class StartupProfile, class for timing the start-up phases of a Commvault Ansible Module.
+
+StartupProfile is the only class defined in this file.
+
+StartupProfile: Represents the timings of the start-up phases of a task (interpreter start, imports, argument parsing,
+session load, login or resume & first API call), reported in the module result when the CV_ANSIBLE_PROFILE
+environment variable is set.
+
+StartupProfile:
+    __init__()              --  Initializes the profile, enabled by the CV_ANSIBLE_PROFILE environment variable.
+    phase()                 --  Context manager timing a start-up phase.
+    watch_first_request()   --  Times the first API call made through the given CVPySDK object.
+    report()                --  Returns the timings of the start-up phases, in seconds.
+
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from time import perf_counter
+
+
+def _process_age():
+    """Returns the seconds elapsed since the start of the current process, None if it can't be found."""
+    try:
+        with open('/proc/self/stat') as fh:
+            start_ticks = int(fh.read().rsplit(')', 1)[1].split()[19])
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+# Taken when the module utils are first imported, the imports of the module are timed from here.
+IMPORT_STARTED = perf_counter()
+INTERPRETER_STARTUP = _process_age()
+PROFILE_ENV = 'CV_ANSIBLE_PROFILE'
+
+
+class StartupProfile:
+    """Class representing the timings of the start-up phases of a task."""
+
+    def __init__(self):
+        """Initializes the profile, enabled by the CV_ANSIBLE_PROFILE environment variable.
+
+            The interpreter phase ends when the module utils are first imported & the imports phase ends when the
+            profile is created.
+
+        """
+        self.enabled = bool(os.environ.get(PROFILE_ENV))
+        self.phases = {'imports': perf_counter() - IMPORT_STARTED}
+        if INTERPRETER_STARTUP is not None:
+            self.phases['interpreter'] = INTERPRETER_STARTUP
+
+    @contextmanager
+    def phase(self, name):
+        """Context manager timing a start-up phase, nothing is recorded if profiling is disabled.
+
+            Args:
+                name    (str)   --  Name of the phase.
+
+        """
+        if not self.enabled:
+            yield
+            return
+
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0) + perf_counter() - started
+
+    def watch_first_request(self, cvpysdk_object):
+        """Times the first API call made through the given CVPySDK object, i.e. the first call made by the module.
+
+            Args:
+                cvpysdk_object  (object)    --  CVPySDK object of the Commcell.
+
+        """
+        if not self.enabled or cvpysdk_object is None:
+            return
+
+        make_request = cvpysdk_object.make_request
+
+        def first_request(*args, **kwargs):
+            cvpysdk_object.make_request = make_request
+            with self.phase('first_request'):
+                return make_request(*args, **kwargs)
+
+        cvpysdk_object.make_request = first_request
+
+    def report(self):
+        """Returns the timings of the start-up phases, in seconds, with the total time since the imports started.
+
+            Returns:
+                dict - {phase: seconds}
+
+        """
+        report = {name: round(seconds, 6) for name, seconds in self.phases.items()}
+        report['total'] = round(perf_counter() - IMPORT_STARTED, 6)
+        return report
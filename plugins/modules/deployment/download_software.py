@@ -88,6 +88,13 @@ options:
         type: bool
         required: false
         default: True
+
+    job_handle:
+        description:
+            - Path of a job handle file written once the job is started, for polling the job with commvault.ansible.job.poll.
+            - Use with wait_for_job_completion set to False & Ansible's async/poll 0, the task then returns right away.
+        type: str
+        required: false
         
 notes:
     - Service_pack option required only with the Download Option : "SERVICEPACK_AND_HOTFIXES"
@@ -143,16 +150,17 @@ job_id:
 '''
 
 from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
-try:
-    from cvpysdk.deployment.deploymentconstants import DownloadPackages, DownloadOptions
-except ModuleNotFoundError:
-    pass
+from ansible_collections.commvault.ansible.plugins.module_utils.constants import (
+    DOWNLOAD_OPTIONS,
+    DOWNLOAD_PACKAGES
+)
+from ansible_collections.commvault.ansible.plugins.module_utils.job_handle import JobHandle
 
 
 def main():
     try:
-        download_option_choices = [e.name for e in DownloadOptions]
-        os_choices = [e.name for e in DownloadPackages]
+        download_option_choices = DOWNLOAD_OPTIONS
+        os_choices = DOWNLOAD_PACKAGES
 
         module_args = dict(
             download_option=dict(type=str, required=False, choices=download_option_choices, default=None),
@@ -160,11 +168,14 @@ def main():
             service_pack=dict(type=int, required=False, default=None), 
             cu_number=dict(type=int, required=False, default=0),
             sync_cache=dict(type=bool, required=False, default=True),
-            wait_for_job_completion=dict(type=bool, required=False, default=True)
+            wait_for_job_completion=dict(type=bool, required=False, default=True),
+            job_handle=dict(type=str, required=False)
         )
                         
         module = CVAnsibleModule(argument_spec=module_args)
 
+        from cvpysdk.deployment.deploymentconstants import DownloadPackages, DownloadOptions
+
         final_download_decision=os_to_download=None
 
         download_option= module.params['download_option']
@@ -210,6 +221,8 @@ def main():
         
         job_id = download_job.job_id
         module.result['job_id'] = str(job_id)
+        if module.params['job_handle']:
+            JobHandle(module.params['job_handle']).save(job_id, module.session_file_path, 'deployment.download_software')
 
         if wait_for_job_completion:
             if not download_job.wait_for_completion():
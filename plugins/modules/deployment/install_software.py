@@ -133,6 +133,13 @@ options:
         required: false
         default: True
 
+    job_handle:
+        description:
+            - Path of a job handle file written once the job is started, for polling the job with commvault.ansible.job.poll.
+            - Use with wait_for_job_completion set to False & Ansible's async/poll 0, the task then returns right away.
+        type: str
+        required: false
+
 notes:
     - windows_package option required only for Windows Client Installations & None for Unix Client Installations
     - unix_packages option required only for Unix Client Installations & None for Windows Client Installations
@@ -220,18 +227,20 @@ job_id:
 
 '''
 
+from base64 import b64encode
+
 from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
-try:
-    from base64 import b64encode
-    from cvpysdk.deployment.deploymentconstants import UnixDownloadFeatures, WindowsDownloadFeatures
-except ModuleNotFoundError:
-    pass
+from ansible_collections.commvault.ansible.plugins.module_utils.constants import (
+    UNIX_DOWNLOAD_FEATURES,
+    WINDOWS_DOWNLOAD_FEATURES
+)
+from ansible_collections.commvault.ansible.plugins.module_utils.job_handle import JobHandle
 
 
 def main():
     try:
-        windows_options = [e.name for e in WindowsDownloadFeatures]
-        unix_options = [e.name for e in UnixDownloadFeatures]
+        windows_options = WINDOWS_DOWNLOAD_FEATURES
+        unix_options = UNIX_DOWNLOAD_FEATURES
         operating_system_types = ["windows", "unix"]
 
         module_args = dict(
@@ -246,10 +255,14 @@ def main():
             storage_policy_name=dict(type=str, required=False, default=None),
             sw_cache_client=dict(type=str, required=False, default=None),
             wait_for_job_completion=dict(type=bool, required=False, default=True),
+            job_handle=dict(type=str, required=False),
             ma_index_cache_location=dict(type=str, required=False, default=None),
         )
                         
         module = CVAnsibleModule(argument_spec=module_args)
+
+        from cvpysdk.deployment.deploymentconstants import UnixDownloadFeatures, WindowsDownloadFeatures
+
         encoded_password=final_download_decision=os_to_download=None
 
         os_type=module.params['os_type']
@@ -311,6 +324,8 @@ def main():
         
         job_id = install_job.job_id
         module.result['job_id'] = str(job_id)
+        if module.params['job_handle']:
+            JobHandle(module.params['job_handle']).save(job_id, module.session_file_path, 'deployment.install_software')
 
         if wait_for_job_completion:
             if not install_job.wait_for_completion():
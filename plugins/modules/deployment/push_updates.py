@@ -98,6 +98,13 @@ options:
         type: bool
         required: false
         default: True
+
+    job_handle:
+        description:
+            - Path of a job handle file written once the job is started, for polling the job with commvault.ansible.job.poll.
+            - Use with wait_for_job_completion set to False & Ansible's async/poll 0, the task then returns right away.
+        type: str
+        required: false
 '''
 
 EXAMPLES = '''
@@ -157,6 +164,7 @@ job_id:
 '''
 
 from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
+from ansible_collections.commvault.ansible.plugins.module_utils.job_handle import JobHandle
 
 
 def main():
@@ -169,7 +177,8 @@ def main():
                             reboot_client=dict(type=bool, required=False, default=False),
                             run_db_maintenance=dict(type=bool, required=False, default=True),
                             install_maintenance_release_only=dict(type=bool, required=False, default=False),
-                            wait_for_job_completion=dict(type=bool, required=False, default=True)
+                            wait_for_job_completion=dict(type=bool, required=False, default=True),
+                            job_handle=dict(type=str, required=False)
                         )
                         
         module = CVAnsibleModule(argument_spec=module_args)
@@ -201,6 +210,8 @@ def main():
 
         job_id = push_job.job_id
         module.result['job_id'] = str(job_id)
+        if module.params['job_handle']:
+            JobHandle(module.params['job_handle']).save(job_id, module.session_file_path, 'deployment.push_updates')
 
         if wait_for_job_completion:
             if not push_job.wait_for_completion():
@@ -22,6 +22,8 @@ module: commvault.ansible.file_servers.backup
 short_description: To perform backup of a file server subclient.
 description:
     - commvault.ansible.file_servers.backup can be used to perform file server backup operation.
+    - In check mode no backup is started, the estimated size, file count & duration of each backup is returned, taken from the last backup of the subclient read with a single request.
+    - With backup_level auto the level of each backup is chosen from the recent backups of the subclient, read with a single request unless older pages are needed to find the last full backup, so that the incremental chain a restore reads stays short.
 options:
  webserver_hostname:
   description:
@@ -41,8 +43,50 @@ options:
  client:
   description:
   -  The name of the Client.
+  - Exactly one of client, clients or targets is required.
   type: str
-  required: true
+  required: false
+ clients:
+  description:
+  - Names of the clients to back up, the backups are started concurrently.
+  - The backupset, subclient, agent_type & backup_level options apply to every client.
+  type: list
+  elements: str
+  required: false
+ targets:
+  description:
+  - Subclients to back up, the backups are started concurrently.
+  - Each target is a dict with the key client & the optional keys backupset, subclient, agent_type & backup_level, the options of the module are used for the keys not given.
+  type: list
+  elements: dict
+  required: false
+ parallelism:
+  description:
+  - Maximum number of backups of clients or targets started at the same time.
+  type: int
+  required: false
+  default: 10
+ max_jobs_per_target:
+  description:
+  - Maximum number of backup jobs started by the task that run at the same time on a storage policy or media agent, 0 for no limit. Only used with clients or targets.
+  - The remaining backups are started as the jobs of their storage policy or media agent finish.
+  type: int
+  required: false
+  default: 0
+ admission_target:
+  description:
+  - What max_jobs_per_target applies to, read from the storage device properties of each subclient.
+  - The media agent of a subclient without one in its properties is the default data path of the primary copy of its storage policy, the backup of a subclient whose media agent can't be resolved fails.
+  type: str
+  required: false
+  default: storage_policy
+  choices: ["storage_policy", "media_agent"]
+ admission_poll_interval:
+  description:
+  - Seconds between the polls of the jobs of a storage policy or media agent with no free slot.
+  type: int
+  required: false
+  default: 30
  agent_type:
   description:
   - The agent type
@@ -63,9 +107,36 @@ options:
  backup_level:
   description:
   -  backup level    
+  - One of full, incremental, differential, synthetic_full or auto.
+  - auto runs a full backup if the subclient has no successful backup, a synthetic full if the last full backup is older than auto_full_age days or the data backed up since reached auto_change_rate of its size, a differential if the last full or differential backup is older than auto_differential_age days & an incremental otherwise.
   default: incremental
   type: str
   required: false
+ auto_full_age:
+  description:
+  - Days after the last full or synthetic full backup at which backup_level auto runs a synthetic full backup.
+  type: float
+  required: false
+  default: 7
+ auto_differential_age:
+  description:
+  - Days after the last full or differential backup at which backup_level auto runs a differential backup.
+  type: float
+  required: false
+  default: 2
+ auto_change_rate:
+  description:
+  - Data backed up since the last full backup, as a fraction of its size, at which backup_level auto runs a synthetic full backup.
+  type: float
+  required: false
+  default: 0.5
+ entity_index_ttl:
+  description:
+  - Seconds the IDs of the client, agent, backupset & subclient resolved by a task are reused by later tasks, instead of listing the entity collections again.
+  - 0 always lists the entity collections & refreshes the stored IDs.
+  type: int
+  required: false
+  default: 3600
 author:
 - Commvault Systems Inc        
 '''
@@ -107,43 +178,285 @@ EXAMPLES = '''
     subclient: "user_subclient"
     agent_type: "Linux File System"
 
+- name: Run a File System Backup for the default subclient of every client, 20 backups started at a time.
+  commvault.ansible.file_servers.backup:
+    clients: "{{ client_computers }}"
+    backup_level: "incremental"
+    parallelism: 20
+
+- name: Run a File System Backup for the given subclients.
+  commvault.ansible.file_servers.backup:
+    targets:
+      - client: "client_name1"
+        subclient: "user_subclient"
+        backup_level: "full"
+      - client: "client_name2"
+        backupset: "user_backupset"
+        subclient: "user_subclient"
+
+- name: Run a File System Backup of every client, with at most 4 jobs running at a time per storage policy.
+  commvault.ansible.file_servers.backup:
+    clients: "{{ client_computers }}"
+    backup_level: "incremental"
+    max_jobs_per_target: 4
+
+- name: Run a File System Backup of every client, the level of each backup chosen from its recent backups.
+  commvault.ansible.file_servers.backup:
+    clients: "{{ client_computers }}"
+    backup_level: "auto"
+    auto_full_age: 14
+    auto_differential_age: 3
+    auto_change_rate: 0.3
+
+- name: Estimate the size & duration of the backup of every client, without starting any backup.
+  commvault.ansible.file_servers.backup:
+    clients: "{{ client_computers }}"
+    backup_level: "incremental"
+    parallelism: 20
+  check_mode: true
+  register: backup_estimate
 '''
 
 RETURN = r'''
 job_id:
     description: Backup job ID
-    returned: On success
+    returned: On success, when client is provided
     type: str
     sample: '2016'
+jobs:
+    description: Backup job ID of each client of clients, or of each target keyed by client/backupset/subclient with the names given in the target
+    returned: When clients or targets is provided
+    type: dict
+    sample: {'client_name1': '2016', 'client_name2/user_backupset/user_subclient': '2017'}
+errors:
+    description: Error message of each client or target whose backup couldn't be started
+    returned: When the backup of any client or target couldn't be started
+    type: dict
+    sample: {'client_name3': 'No client exists with name: client_name3'}
+admission_targets:
+    description: Storage policy or media agent each client or target was admitted on
+    returned: When max_jobs_per_target is provided with clients or targets
+    type: dict
+    sample: {'client_name1': 'storage_policy1', 'client_name2': 'storage_policy1'}
+backup_level:
+    description: Backup level chosen by backup_level auto
+    returned: When client is provided with backup_level auto
+    type: str
+    sample: 'differential'
+backup_levels:
+    description: Backup level chosen by backup_level auto for each client of clients, or each target keyed by client/backupset/subclient
+    returned: When clients or targets is provided with backup_level auto
+    type: dict
+    sample: {'client_name1': 'incremental', 'client_name2': 'synthetic_full'}
+estimate:
+    description: Estimated size in bytes, file count & duration in seconds of the backup, from the last backup of the level, or of any level, with the ID of that job
+    returned: In check mode, when client is provided
+    type: dict
+    sample: {'backup_level': 'incremental', 'size': 1073741824, 'files': 5230, 'duration': 300, 'job_id': 2016}
+estimates:
+    description: Estimate of the backup of each client of clients, or of each target keyed by client/backupset/subclient
+    returned: In check mode, when clients or targets is provided
+    type: dict
+    sample: {'client_name1': {'backup_level': 'incremental', 'size': 1073741824, 'files': 5230, 'duration': 300, 'job_id': 2016}}
+estimate_total:
+    description: Total size & file count of the estimated backups, with the duration of the wave given parallelism, at least that of the longest backup
+    returned: In check mode, when clients or targets is provided
+    type: dict
+    sample: {'size': 2147483648, 'files': 10460, 'duration': 300}
 '''
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible_collections.commvault.ansible.plugins.module_utils.admission_control import (
+    ADMISSION_POLL_INTERVAL,
+    AdmissionController
+)
+from ansible_collections.commvault.ansible.plugins.module_utils.backup_history import (
+    AUTO_CHANGE_RATE,
+    AUTO_DIFFERENTIAL_AGE,
+    AUTO_FULL_AGE,
+    HISTORY_LOOKUP_TIME,
+    BackupHistory
+)
 from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
+from ansible_collections.commvault.ansible.plugins.module_utils.entity_index import (
+    ENTITY_INDEX_TTL,
+    EntityIndex
+)
+from ansible_collections.commvault.ansible.plugins.module_utils.job_manager import JobManager
+
+
+BACKUP_PARALLELISM = 10
 
 
 def main():
     """Main method for this module."""
 
     module_args = dict(
-        client=dict(type=str, required=True),
+        client=dict(type=str, required=False),
+        clients=dict(type=list, elements='str', required=False),
+        targets=dict(type='list', elements='dict', required=False, options=dict(
+            client=dict(type=str, required=True),
+            backupset=dict(type=str, required=False),
+            subclient=dict(type=str, required=False),
+            agent_type=dict(type=str, required=False),
+            backup_level=dict(type=str, required=False)
+        )),
         backupset=dict(type=str, required=False),
         subclient=dict(type=str, required=False),
         backup_level=dict(type=str, required=False),
-        agent_type=dict(type=str, required=False)
+        agent_type=dict(type=str, required=False),
+        auto_full_age=dict(type=float, required=False, default=AUTO_FULL_AGE),
+        auto_differential_age=dict(type=float, required=False, default=AUTO_DIFFERENTIAL_AGE),
+        auto_change_rate=dict(type=float, required=False, default=AUTO_CHANGE_RATE),
+        parallelism=dict(type=int, required=False, default=BACKUP_PARALLELISM),
+        max_jobs_per_target=dict(type=int, required=False, default=0),
+        admission_target=dict(type=str, required=False, default='storage_policy',
+                              choices=['storage_policy', 'media_agent']),
+        admission_poll_interval=dict(type=int, required=False, default=ADMISSION_POLL_INTERVAL),
+        entity_index_ttl=dict(type=int, required=False, default=ENTITY_INDEX_TTL)
     )
 
-    module = CVAnsibleModule(argument_spec=module_args)
+    module = CVAnsibleModule(argument_spec=module_args, required_one_of=[('client', 'clients', 'targets')],
+                             mutually_exclusive=[('client', 'clients', 'targets')])
     module.result['changed'] = False
 
     try:
-        client = module.commcell.clients.get(module.params.get('client'))
-        agent_type = module.params.get('agent_type', 'File System')
-        agent = client.agents.get(agent_type)
-        backupset = agent.backupsets.get(agent.backupsets.default_backup_set if not module.params.get('backupset') else module.params.get('backupset'))
-        subclient = backupset.subclients.get(backupset.subclients.default_subclient if not module.params.get('subclient') else module.params.get('subclient'))
-        backup_level = module.params.get('backup_level', 'incremental')
-        backup = subclient.backup(backup_level=backup_level)
-        module.result['job_id'] = str(backup.job_id)
-        module.result['changed'] = True
+        entity_index = EntityIndex(module.commcell, ttl=module.params.get('entity_index_ttl'))
+        job_manager = JobManager(module.commcell)
+        admission, admission_targets, backup_levels = None, {}, {}
+
+        # The history read by backup_level auto covers at least the age at which a full backup is due.
+        lookup_time = max(HISTORY_LOOKUP_TIME, int(module.params.get('auto_full_age') * 24) + 24)
+
+        media_agents, media_agents_lock = {}, threading.Lock()
+
+        def get_media_agent(subclient):
+            """Returns the media agent of the subclient, set in its storage device properties, or else the default
+            data path of the primary copy of its storage policy, read once per storage policy. None if not resolved.
+            """
+            if subclient.storage_ma:
+                return str(subclient.storage_ma)
+
+            storage_policy = subclient.storage_policy
+            if not storage_policy:
+                return None
+
+            with media_agents_lock:
+                if storage_policy not in media_agents:
+                    primary_copy = module.commcell.storage_policies.get(storage_policy).get_primary_copy()
+                    try:
+                        media_agents[storage_policy] = primary_copy.media_agent
+                    except AttributeError:
+                        media_agents[storage_policy] = None
+                return media_agents[storage_policy]
+
+        def backup(target, key=None):
+            """Starts the backup of the subclient of the target, the options of the module fill the missing keys.
+
+            With admission control the backup is queued on the storage policy or media agent of the subclient, read
+            from the subclient properties, & a future of the job ID is returned. In check mode the estimate of the
+            backup is returned.
+            With backup_level auto the level is chosen from the history of the subclient, reused by the estimate.
+            """
+            subclient = entity_index.get_subclient(
+                target['client'],
+                target.get('agent_type') or module.params.get('agent_type') or 'File System',
+                target.get('backupset') or module.params.get('backupset'),
+                target.get('subclient') or module.params.get('subclient')
+            )
+            backup_level = target.get('backup_level') or module.params.get('backup_level') or 'incremental'
+            history = None
+
+            if backup_level.lower() == 'auto':
+                history = BackupHistory(job_manager, subclient, lookup_time)
+                backup_level = backup_levels[key] = history.choose_level(
+                    module.params.get('auto_full_age'),
+                    module.params.get('auto_differential_age'),
+                    module.params.get('auto_change_rate')
+                )
+
+            if module.check_mode:
+                return (history or BackupHistory(job_manager, subclient)).estimate_backup(backup_level)
+
+            def start():
+                return str(subclient.backup(backup_level=backup_level).job_id)
+
+            if admission is None:
+                return start()
+
+            if module.params.get('admission_target') == 'media_agent':
+                media_agent = get_media_agent(subclient)
+                if not media_agent:
+                    raise Exception(
+                        f"The media agent of {key} couldn't be resolved from the subclient or the primary copy of "
+                        f"its storage policy, admission_target media_agent can't be applied"
+                    )
+                admission_targets[key] = media_agent
+            else:
+                # A subclient without a storage policy gets its own queue, it can't take the slots of the others.
+                admission_targets[key] = str(subclient.storage_policy or f"{key} (no storage policy)")
+            return admission.submit(admission_targets[key], start)
+
+        if module.params.get('client'):
+            client = module.params.get('client')
+            module.result['estimate' if module.check_mode else 'job_id'] = backup({'client': client}, client)
+            if client in backup_levels:
+                module.result['backup_level'] = backup_levels[client]
+            module.result['changed'] = True
+            module.exit_json(**module.result)
+
+        targets = module.params.get('targets') or [{'client': client} for client in module.params.get('clients')]
+        keys = ['/'.join(target[name] for name in ('client', 'backupset', 'subclient') if target.get(name))
+                for target in targets]
+        jobs, errors = {}, {}
+
+        def submit(key, target):
+            try:
+                jobs[key] = backup(target, key)
+            except Exception as e:
+                errors[key] = str(e)
+
+        parallelism = max(1, min(module.params.get('parallelism') or BACKUP_PARALLELISM, len(targets)))
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            if module.params.get('max_jobs_per_target') and not module.check_mode:
+                admission = AdmissionController(
+                    job_manager, module.params['max_jobs_per_target'], executor,
+                    max(1, module.params.get('admission_poll_interval') or ADMISSION_POLL_INTERVAL)
+                )
+
+            list(executor.map(submit, keys, targets))
+
+            # The backups queued on a full storage policy or media agent are started as its jobs finish.
+            if admission is not None:
+                admission.drain()
+                for key, future in list(jobs.items()):
+                    if future.exception():
+                        errors[key] = str(jobs.pop(key).exception())
+                    else:
+                        jobs[key] = future.result()
+
+        module.result['estimates' if module.check_mode else 'jobs'] = {key: jobs[key] for key in keys if key in jobs}
+        module.result['changed'] = bool(jobs)
+        if module.check_mode:
+            estimates = [estimate for estimate in jobs.values() if estimate['job_id'] is not None]
+            durations = [estimate['duration'] or 0 for estimate in estimates]
+            module.result['estimate_total'] = {
+                'size': sum(estimate['size'] for estimate in estimates),
+                'files': sum(estimate['files'] for estimate in estimates),
+                'duration': max([-(-sum(durations) // parallelism)] + durations)
+            }
+        if backup_levels:
+            module.result['backup_levels'] = {key: backup_levels[key] for key in keys if key in backup_levels}
+        if admission is not None:
+            module.result['admission_targets'] = {
+                key: admission_targets[key] for key in keys if key in admission_targets
+            }
+        if errors:
+            module.result['errors'] = {key: errors[key] for key in keys if key in errors}
+            module.result['msg'] = f"Failed to start the backup of {list(module.result['errors'])}"
+            module.fail_json(**module.result)
 
         module.exit_json(**module.result)
 
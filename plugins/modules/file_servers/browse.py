@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+DOCUMENTATION = '''
+---
+module: commvault.ansible.file_servers.browse
+short_description: To browse the backed up content of a file server subclient.
+description:
+    - commvault.ansible.file_servers.browse can be used to list the backed up files & folders of a subclient at a point in time.
+    - The folders are browsed page by page & the items are written to a JSON lines file as they are received, they are not returned in the task result.
+    - The listings of a point in time given by to_time are cached on the host running the module, repeated browses of the same point in time are served from the cache.
+options:
+ webserver_hostname:
+  description:
+  - Hostname of the Web Server.
+  type: str
+  required: false
+ commcell_username:
+  description:
+  - Commcell username
+  type: str
+  required: false
+ commcell_password:
+  description:
+  - Commcell password
+  type: str
+  required: false
+ client:
+  description:
+  - The name of the client.
+  type: str
+  required: true
+ agent_type:
+   description:
+   - The agent type
+   type: str
+   required: false
+ backupset:
+  description:
+  - The name of the backupset.
+  default: default backupset
+  type: str
+  required: false
+ subclient:
+  description:
+  - The name of the subclient.
+  default: subclient named 'default'.
+  type: str
+  required: false
+ path:
+  description:
+  - Path of the folder the browse starts from.
+  type: str
+  required: false
+  default: '\\'
+ depth:
+  description:
+  - Number of folder levels browsed, 1 lists the items of the folder only & 0 browses the whole tree under the path.
+  type: int
+  required: false
+  default: 1
+ from_time:
+  description:
+  - Start of the time range browsed, Epoch time or timestamp of the format %Y-%m-%d %H:%M:%S.
+  type: str
+  required: false
+ to_time:
+  description:
+  - Point in time browsed, Epoch time or timestamp of the format %Y-%m-%d %H:%M:%S. By default the latest backup is browsed & the cache is not used.
+  type: str
+  required: false
+ page_size:
+  description:
+  - Number of items requested per browse request.
+  type: int
+  required: false
+  default: 1000
+ dest:
+  description:
+  - Path of the file the items are written to, one JSON object per line.
+  type: str
+  required: true
+ cache_ttl:
+  description:
+  - Seconds the cached listings of a point in time are served, 0 always browses the server & caches nothing.
+  type: int
+  required: false
+  default: 3600
+ entity_index_ttl:
+  description:
+  - Seconds the IDs of the client, agent, backupset & subclient resolved by a task are reused by later tasks, instead of listing the entity collections again.
+  - 0 always lists the entity collections & refreshes the stored IDs.
+  type: int
+  required: false
+  default: 3600
+author:
+- Commvault Systems Inc
+'''
+
+EXAMPLES = r'''
+- name: List the backed up items of a folder of the default subclient, session file will be used.
+  commvault.ansible.file_servers.browse:
+    client: "client_name"
+    path: "C:\data"
+    dest: "/tmp/browse.jsonl"
+
+- name: List the whole backed up tree of subclient 'user_subclient' as of a point in time.
+  commvault.ansible.file_servers.browse:
+    client: "client_name"
+    backupset: "user_backupset"
+    subclient: "user_subclient"
+    agent_type: "Linux File System"
+    path: "/home"
+    depth: 0
+    to_time: "2024-05-01 00:00:00"
+    dest: "/tmp/home_tree.jsonl"
+
+'''
+
+RETURN = r'''
+dest:
+    description: Path of the file the items were written to
+    returned: On success
+    type: str
+    sample: '/tmp/browse.jsonl'
+count:
+    description: Number of items written to dest
+    returned: On success
+    type: int
+    sample: 1520
+browse_requests:
+    description: Number of browse requests sent to the server
+    returned: On success
+    type: int
+    sample: 4
+cached_folders:
+    description: Number of folders listed from the cache
+    returned: On success
+    type: int
+    sample: 0
+'''
+
+import json
+import os
+
+from ansible_collections.commvault.ansible.plugins.module_utils.atomic_file import atomic_write
+from ansible_collections.commvault.ansible.plugins.module_utils.backup_browser import (
+    BROWSE_CACHE_TTL,
+    BROWSE_PAGE_SIZE,
+    BackupBrowser
+)
+from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
+from ansible_collections.commvault.ansible.plugins.module_utils.entity_index import (
+    ENTITY_INDEX_TTL,
+    EntityIndex
+)
+
+
+def main():
+    """Main method for this module."""
+
+    module_args = dict(client=dict(type=str, required=True),
+                       backupset=dict(type=str, required=False),
+                       subclient=dict(type=str, required=False),
+                       agent_type=dict(type=str, required=False),
+                       path=dict(type=str, required=False, default='\\'),
+                       depth=dict(type=int, required=False, default=1),
+                       from_time=dict(type=str, required=False),
+                       to_time=dict(type=str, required=False),
+                       page_size=dict(type=int, required=False, default=BROWSE_PAGE_SIZE),
+                       dest=dict(type=str, required=True),
+                       cache_ttl=dict(type=int, required=False, default=BROWSE_CACHE_TTL),
+                       entity_index_ttl=dict(type=int, required=False, default=ENTITY_INDEX_TTL)
+                       )
+
+    module = CVAnsibleModule(argument_spec=module_args)
+    module.result['changed'] = False
+
+    try:
+        entity_index = EntityIndex(module.commcell, ttl=module.params.get('entity_index_ttl'))
+        subclient = entity_index.get_subclient(
+            module.params.get('client'),
+            module.params.get('agent_type') or 'File System',
+            module.params.get('backupset'),
+            module.params.get('subclient')
+        )
+        browser = BackupBrowser(
+            subclient,
+            from_time=module.params.get('from_time'),
+            to_time=module.params.get('to_time'),
+            page_size=module.params.get('page_size'),
+            cache_ttl=module.params.get('cache_ttl')
+        )
+
+        dest = os.path.abspath(os.path.expanduser(module.params.get('dest')))
+        count = 0
+        with atomic_write(dest) as fh:
+            for item in browser.walk(module.params.get('path'), module.params.get('depth')):
+                fh.write(json.dumps(item) + '\n')
+                count += 1
+
+        module.result['dest'] = dest
+        module.result['count'] = count
+        module.result['browse_requests'] = browser.requests
+        module.result['cached_folders'] = browser.cached_folders
+        module.result['changed'] = True
+        module.exit_json(**module.result)
+
+    except Exception as e:
+        module.result['msg'] = str(e)
+        module.fail_json(**module.result)
+
+
+if __name__ == "__main__":
+    main()
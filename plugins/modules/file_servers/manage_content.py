@@ -23,6 +23,7 @@ short_description: To update the properties of a file server at subclient level.
 description:
  - commvault.ansible.file_servers.manage_content can be used to update the content, filters and exceptions of a File System subclient. 
  - keys for 'update' are 'content', 'filter_content', 'exception_content' & will ALWAYS OVERWRITE existing values.
+ - Only the entries added to & removed from each property are sent to the server & returned in the result, in check mode the same delta is returned without updating the subclient.
 options:
  webserver_hostname:
   description:
@@ -61,6 +62,13 @@ options:
   choices: ['content', 'filter_content', 'exception_content']
   type: dict
   required: true 
+ entity_index_ttl:
+  description:
+  - Seconds the IDs of the client, agent, backupset & subclient resolved by a task are reused by later tasks, instead of listing the entity collections again.
+  - 0 always lists the entity collections & refreshes the stored IDs.
+  type: int
+  required: false
+  default: 3600
 author:
 - Commvault Systems Inc        
 '''
@@ -95,12 +103,29 @@ EXAMPLES = r'''
             - C:\ANSIBLE_PATH1\FILTER1
             - C:\ANSIBLE_PATH1\FILTER2                  
 '''
-RETURN = r'''#'''
+RETURN = r'''
+delta:
+    description: Entries added to & removed from each updated property
+    returned: When a property changes
+    type: dict
+    sample: {'content': {'added': ['/data/path3'], 'removed': ['/data/path2']}}
+'''
 
 from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
+from ansible_collections.commvault.ansible.plugins.module_utils.entity_index import (
+    ENTITY_INDEX_TTL,
+    EntityIndex
+)
 
 supported_properties = ['content', 'filter_content', 'exception_content']
 
+# Key of the entries of each property in the subclient content & the field holding the operation applied to them.
+content_keys = {
+    'content': ('path', 'fsContentOperationType'),
+    'filter_content': ('excludePath', 'fsExcludeFilterOperationType'),
+    'exception_content': ('includePath', 'fsIncludeFilterOperationType')
+}
+
 
 def main():
 
@@ -108,26 +133,65 @@ def main():
         client=dict(type=str, required=True),
         backupset=dict(type=str, required=False),
         subclient=dict(type=str, required=False),
-        update=dict(type=dict, required=True)
+        update=dict(type=dict, required=True),
+        entity_index_ttl=dict(type=int, required=False, default=ENTITY_INDEX_TTL)
     )
 
     module = CVAnsibleModule(argument_spec=module_args)
     module.result['changed'] = False
 
     try:
-        client = module.commcell.clients.get(module.params.get('client'))
-        agent = client.agents.get('File System')
-        backupset = agent.backupsets.get(agent.backupsets.default_backup_set if not module.params.get('backupset') else module.params.get('backupset'))
-        subclient = backupset.subclients.get(backupset.subclients.default_subclient if not module.params.get('subclient') else module.params.get('subclient'))
+        entity_index = EntityIndex(module.commcell, ttl=module.params.get('entity_index_ttl'))
+        subclient = entity_index.get_subclient(
+            module.params.get('client'),
+            'File System',
+            module.params.get('backupset'),
+            module.params.get('subclient')
+        )
         update = module.params.get('update')
 
         if not all([property if property in supported_properties else False for property in update.keys()]):
             raise ValueError("Unsupported key supplied in 'update'")
 
+        delta = {}
         for property, new_property_value in update.items():
-            if sorted(getattr(subclient, property)) != sorted(new_property_value):
-                setattr(subclient, property.lower(), new_property_value)
-                module.result['changed'] = True
+            if not isinstance(new_property_value, list):
+                raise ValueError(f"'{property}' should be a list")
+            if property == 'content' and not new_property_value:
+                raise ValueError("Subclient content can't be empty")
+
+            current = getattr(subclient, property)
+            current_set, new_set = set(current), set(new_property_value)
+            added = [entry for entry in dict.fromkeys(new_property_value) if entry not in current_set]
+            removed = [entry for entry in dict.fromkeys(current) if entry not in new_set]
+            if added or removed:
+                delta[property] = {'added': added, 'removed': removed}
+
+        if delta:
+            module.result['delta'] = delta
+            module.result['changed'] = True
+
+        if delta and not module.check_mode:
+            # The additions are sent before the removals so that the content is never left empty, the operation of a
+            # property without entries in a request leaves the property as is.
+            for operation, side in (('ADD', 'added'), ('DELETE', 'removed')):
+                entries = [
+                    {content_keys[property][0]: entry} for property, changes in delta.items() for entry in changes[side]
+                ]
+                if not entries:
+                    continue
+
+                request_json = {
+                    'subClientProperties': {
+                        'subClientEntity': subclient._subClientEntity,
+                        'content': entries,
+                        **{operation_field: operation for _, operation_field in content_keys.values()}
+                    }
+                }
+                flag, response = subclient._cvpysdk_object.make_request('POST', subclient._SUBCLIENT, request_json)
+                status, _, error_string = subclient._process_update_response(flag, response)
+                if not status:
+                    raise Exception(f"Failed to update the content of the subclient: {error_string}")
 
         module.exit_json(**module.result)
 
@@ -22,6 +22,7 @@ module: commvault.ansible.file_servers.manage_plan
 short_description: To change the plan associated to the client, backupset or subclient.
 description:
     - commvault.ansible.file_servers.manage_plan can be used to change the server plan associated at the client, backupset or subclient level.
+    - The plan is read once, the entities whose plan is already the plan, read from their properties, are skipped & the others are associated concurrently.
 options:
  webserver_hostname:
   description:
@@ -41,8 +42,27 @@ options:
  client:
   description:
   - The name of the client.
+  - Exactly one of client, clients or targets is required.
   type: str
-  required: true 
+  required: false
+ clients:
+  description:
+  - Names of the clients to associate, the backupset & subclient options apply to every client.
+  type: list
+  elements: str
+  required: false
+ targets:
+  description:
+  - Entities to associate, each target is a dict with the key client & the optional keys backupset & subclient, the options of the module are used for the keys not given.
+  type: list
+  elements: dict
+  required: false
+ parallelism:
+  description:
+  - Maximum number of associations made at the same time.
+  type: int
+  required: false
+  default: 10
  plan:
   description:
   - The name of the server plan which needs to be associated to the entity.
@@ -58,6 +78,13 @@ options:
   - The name of the subclient.  
   type: str
   required: false 
+ entity_index_ttl:
+  description:
+  - Seconds the IDs of the client, agent, backupset & subclient resolved by a task are reused by later tasks, instead of listing the entity collections again.
+  - 0 always lists the entity collections & refreshes the stored IDs.
+  type: int
+  required: false
+  default: 3600
 '''
 
 EXAMPLES = r'''
@@ -82,39 +109,133 @@ EXAMPLES = r'''
     backupset: "user_backupset"
     subclient: "user_subclient"
     plan: "server plan"
+
+- name: Associate the clients to plan 'server plan'.
+  commvault.ansible.file_servers.manage_plan:
+    clients: "{{ client_computers }}"
+    plan: "server plan"
+
+- name: Associate the given subclients to plan 'server plan'.
+  commvault.ansible.file_servers.manage_plan:
+    targets:
+      - client: "client_name1"
+      - client: "client_name2"
+        backupset: "user_backupset"
+        subclient: "user_subclient"
+    plan: "server plan"
 author:
 - Commvault Systems Inc 
 '''
 
-RETURN = r'''#'''
+RETURN = r'''
+associated:
+    description: Entities associated to the plan, keyed by client/backupset/subclient with the names given in the target
+    returned: always
+    type: list
+    sample: ['client_name1', 'client_name2/user_backupset/user_subclient']
+skipped:
+    description: Entities already associated to the plan
+    returned: always
+    type: list
+    sample: ['client_name3']
+errors:
+    description: Error of each entity which could not be associated
+    returned: When an association fails
+    type: dict
+    sample: {'client_name4': 'Plan is not eligible to be associated'}
+'''
+
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
+from ansible_collections.commvault.ansible.plugins.module_utils.entity_index import (
+    ENTITY_INDEX_TTL,
+    EntityIndex
+)
+
+
+PLAN_PARALLELISM = 10
 
 
 def main():
     """Main method for this module."""
 
     module_args = dict(
-        client=dict(type=str, required=True),
+        client=dict(type=str, required=False),
+        clients=dict(type=list, elements='str', required=False),
+        targets=dict(type='list', elements='dict', required=False, options=dict(
+            client=dict(type=str, required=True),
+            backupset=dict(type=str, required=False),
+            subclient=dict(type=str, required=False)
+        )),
         plan=dict(type=str, required=True),
         backupset=dict(type=str, required=False),
-        subclient=dict(type=str, required=False)
+        subclient=dict(type=str, required=False),
+        parallelism=dict(type=int, required=False, default=PLAN_PARALLELISM),
+        entity_index_ttl=dict(type=int, required=False, default=ENTITY_INDEX_TTL)
     )
 
-    module = CVAnsibleModule(argument_spec=module_args, required_by={'subclient': 'backupset'})
+    module = CVAnsibleModule(argument_spec=module_args, required_by={'subclient': 'backupset'},
+                             required_one_of=[('client', 'clients', 'targets')],
+                             mutually_exclusive=[('client', 'clients', 'targets')])
     module.result['changed'] = False
 
     try:
+        # The plan is read once, each entity is compared against the plan in its own properties.
         plan = module.commcell.plans.get(module.params.get('plan'))
-        client = module.commcell.clients.get(module.params.get('client'))
-        agent = client.agents.get('File System')
-        backupset = agent.backupsets.get(agent.backupsets.default_backup_set if not module.params.get('backupset') else module.params.get('backupset'))
-        if module.params.get('subclient'):
-            subclient = backupset.subclients.get(module.params.get('subclient'))
-            subclient.plan = plan
+        plan_name = str(plan.plan_name).lower()
+
+        entity_index = EntityIndex(module.commcell, ttl=module.params.get('entity_index_ttl'))
+
+        if module.params.get('client'):
+            targets = [{'client': module.params.get('client')}]
         else:
-            backupset.plan = plan
-        module.result['changed'] = True
+            targets = module.params.get('targets') or [{'client': client} for client in module.params.get('clients')]
+        targets = [{
+            'client': target['client'],
+            'backupset': target.get('backupset') or module.params.get('backupset'),
+            'subclient': target.get('subclient') or module.params.get('subclient')
+        } for target in targets]
+        keys = ['/'.join(target[name] for name in ('client', 'backupset', 'subclient') if target.get(name))
+                for target in targets]
+        associated, skipped, errors = set(), set(), {}
+
+        def associate(key, target):
+            try:
+                if target['subclient']:
+                    if not target['backupset']:
+                        raise ValueError("backupset is required with subclient")
+
+                    subclient = entity_index.get_subclient(
+                        target['client'], 'File System', target['backupset'], target['subclient']
+                    )
+                    if str(subclient.plan or '').lower() == plan_name:
+                        skipped.add(key)
+                        return
+                    subclient.plan = plan
+                else:
+                    backupset = entity_index.get_backupset(target['client'], 'File System', target['backupset'])
+                    # The plan name of the backupset properties, backupset.plan would read the plan again.
+                    if str(backupset._plan_name or '').lower() == plan_name:
+                        skipped.add(key)
+                        return
+                    backupset.plan = plan
+                associated.add(key)
+
+            except Exception as e:
+                errors[key] = str(e)
+
+        parallelism = max(1, min(module.params.get('parallelism') or PLAN_PARALLELISM, len(targets)))
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            list(executor.map(associate, keys, targets))
+
+        module.result['associated'] = [key for key in keys if key in associated]
+        module.result['skipped'] = [key for key in keys if key in skipped]
+        module.result['changed'] = bool(associated)
+        if errors:
+            module.result['errors'] = {key: errors[key] for key in keys if key in errors}
+            module.result['msg'] = f"Failed to associate {list(module.result['errors'])} to the plan"
+            module.fail_json(**module.result)
 
         module.exit_json(**module.result)
 
@@ -22,6 +22,7 @@ module: commvault.ansible.file_servers.restore
 short_description: To perform restore of a file server subclient.
 description:
     - commvault.ansible.file_servers.restore can be used to perform a file server restore operation.
+    - In check mode no restore is started, the estimated size, file count & duration of the restore of the subclient content is returned, from the last full backup & the throughput of the last restore of the subclient, read with a single request unless older pages are needed to find the last full backup.
 options:
  webserver_hostname:
   description:
@@ -62,9 +63,21 @@ options:
   required: false
  content:
   description:
-  - The path of the content that needs to be restored.
+  - The path of the content that needs to be restored, or a list of paths. The paths may hold the wildcards supported by the file system agent, e.g. C:\\data\\*.log.
+  - Exactly one of content or content_file is required.
+  type: raw
+  required: false
+ content_file:
+  description:
+  - Path of a file on the host running the module listing the paths to be restored, one per line. Empty lines & lines starting with # are skipped.
   type: str
-  required: true
+  required: false
+ split_jobs:
+  description:
+  - Number of restore jobs the paths are split into, the jobs are started one after the other & run concurrently. By default all the paths are restored by a single job.
+  type: int
+  required: false
+  default: 1
  in_place:
   description:
   - Whether the content needs to be restored in place i.e. restored back to the source location.
@@ -77,6 +90,13 @@ options:
   - Destination path in case the content needs to be restored to another location.
   type: str
   required: false
+ destinations:
+  description:
+  - Destinations the paths are split across, one restore job per destination, the jobs are started one after the other & run concurrently. Each destination is a dictionary with the path & optionally the client restored to, the client of the subclient by default.
+  - Mutually exclusive with destination_path, split_jobs is ignored.
+  type: list
+  elements: dict
+  required: false
  unconditional_overwrite:
   description:
   - Specifies whether data needs to be overwritten at the destination if the file already exists.
@@ -84,6 +104,40 @@ options:
   default: true
   type: bool
   required: false
+ streams:
+  description:
+  - Number of streams used by each restore job.
+  type: int
+  required: false
+  default: 1
+ copy_precedence:
+  description:
+  - Copy precedence of the storage policy copy the data is restored from. By default the data is restored from the copy chosen by the server.
+  type: int
+  required: false
+ media_agent:
+  description:
+  - Name of the media agent used to read the data. By default the media agent is chosen by the server.
+  type: str
+  required: false
+ wait:
+  description:
+  - Whether to wait for the restore jobs to finish & report the achieved throughput.
+  type: bool
+  required: false
+  default: false
+ wait_timeout:
+  description:
+  - Seconds to wait for the restore jobs to finish, by default there is no timeout.
+  type: int
+  required: false
+ entity_index_ttl:
+  description:
+  - Seconds the IDs of the client, agent, backupset & subclient resolved by a task are reused by later tasks, instead of listing the entity collections again.
+  - 0 always lists the entity collections & refreshes the stored IDs.
+  type: int
+  required: false
+  default: 3600
 author:
 - Commvault Systems Inc 
 '''
@@ -124,17 +178,128 @@ EXAMPLES = r'''
     content: "C:\path\of\content"
     in_place: "yes"
 
+- name: Restore several paths in a single job.
+  commvault.ansible.file_servers.restore:
+    client: "client_name"
+    content:
+      - "C:\path\of\content1"
+      - "C:\path\of\content2\*.log"
+    destination_path: "D:\restored"
+
+- name: Restore the paths listed in a file with 4 restore jobs.
+  commvault.ansible.file_servers.restore:
+    client: "client_name"
+    content_file: "/tmp/paths_to_restore.txt"
+    split_jobs: 4
+
+- name: Restore the paths listed in a file to two hosts with 4 streams each from the secondary copy, and report the throughput.
+  commvault.ansible.file_servers.restore:
+    client: "client_name"
+    content_file: "/tmp/paths_to_restore.txt"
+    destinations:
+      - client: "dr_host1"
+        path: "/restore"
+      - client: "dr_host2"
+        path: "/restore"
+    streams: 4
+    copy_precedence: 2
+    media_agent: "ma_name"
+    wait: true
+
 '''
 
 RETURN = r'''
 job_id:
-    description: Restore job ID
+    description: Restore job ID, the ID of the first job when the paths are split
     returned: On success
     type: str
     sample: '2017'
+job_ids:
+    description: Restore job IDs, one per split of the paths
+    returned: On success
+    type: list
+    sample: ['2017', '2018']
+jobs:
+    description: Status, bytes restored, duration in seconds & throughput in bytes/sec of each restore job
+    returned: When wait is true
+    type: dict
+    sample: {'2017': {'status': 'Completed', 'bytes': 1073741824, 'duration': 120, 'throughput': 8947848.53}}
+throughput:
+    description: Bytes restored by all the jobs, seconds from the start of the first job to the end of the last job & throughput in bytes/sec
+    returned: When wait is true
+    type: dict
+    sample: {'bytes': 2147483648, 'duration': 150, 'throughput': 14316557.65}
+estimate:
+    description: Estimated size in bytes, file count & duration in seconds of the restore of the subclient content, an upper bound for the restore of a part of the content, with the ID of the backup it is taken from
+    returned: In check mode
+    type: dict
+    sample: {'size': 1073741824, 'files': 5230, 'duration': 120, 'job_id': 2016}
 '''
 
+from ansible_collections.commvault.ansible.plugins.module_utils.backup_history import BackupHistory
 from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
+from ansible_collections.commvault.ansible.plugins.module_utils.entity_index import (
+    ENTITY_INDEX_TTL,
+    EntityIndex
+)
+from ansible_collections.commvault.ansible.plugins.module_utils.job_manager import JobManager
+
+
+def start_restores(subclient, splits, targets, in_place, overwrite=True, copy_precedence=None, fs_options=None):
+    """Starts a restore job per split of the paths, to the target of the split.
+
+        The jobs are started one after the other, CVPySDK builds the request of a restore in attributes of the
+        instance shared by the subclient objects, two requests built at the same time would mix their paths &
+        destinations. The jobs run concurrently once started.
+
+        Args:
+            subclient       (object)    --  Subclient object the paths are restored from.
+
+            splits          (list)      --  Paths restored by each job.
+
+            targets         (list)      --  (Client object, destination path) of each job, unused in place.
+
+            in_place        (bool)      --  Whether the paths are restored to their source location.
+
+            overwrite       (bool)      --  Whether the files existing at the destination are overwritten.
+                default :   True
+
+            copy_precedence (int)       --  Copy precedence of the storage policy copy restored from.
+                default :   None
+
+            fs_options      (dict)      --  File system options of the jobs, e.g. no_of_streams.
+                default :   None
+
+        Returns:
+            tuple - (list of the Job objects of the started jobs, list of the errors of the jobs which failed to start)
+
+    """
+    jobs, errors = [], []
+    for split, (client, destination_path) in zip(splits, targets):
+        try:
+            # CVPySDK adds the restore options to the given dictionary, every job gets its own.
+            if in_place:
+                job = subclient.restore_in_place(
+                    paths=split,
+                    overwrite=overwrite,
+                    copy_precedence=copy_precedence,
+                    fs_options=dict(fs_options or {})
+                )
+            else:
+                job = subclient.restore_out_of_place(
+                    client=client,
+                    destination_path=destination_path,
+                    paths=split,
+                    overwrite=overwrite,
+                    copy_precedence=copy_precedence,
+                    fs_options=dict(fs_options or {})
+                )
+            jobs.append(job)
+
+        except Exception as e:
+            errors.append(str(e))
+
+    return jobs, errors
 
 
 def main():
@@ -144,45 +309,124 @@ def main():
                        backupset=dict(type=str, required=False),
                        subclient=dict(type=str, required=False),
                        agent_type=dict(type=str, required=False),
-                       content=dict(type=str, required=True),
+                       content=dict(type='raw', required=False),
+                       content_file=dict(type=str, required=False),
+                       split_jobs=dict(type=int, required=False, default=1),
                        in_place=dict(type=bool, required=False, default=True),
                        destination_path=dict(type=str, required=False),
-                       unconditional_overwrite=dict(type=bool, required=False, default=True)
+                       destinations=dict(type='list', elements='dict', required=False, options=dict(
+                           client=dict(type=str, required=False),
+                           path=dict(type=str, required=True)
+                       )),
+                       unconditional_overwrite=dict(type=bool, required=False, default=True),
+                       streams=dict(type=int, required=False, default=1),
+                       copy_precedence=dict(type=int, required=False),
+                       media_agent=dict(type=str, required=False),
+                       wait=dict(type=bool, required=False, default=False),
+                       wait_timeout=dict(type=int, required=False),
+                       entity_index_ttl=dict(type=int, required=False, default=ENTITY_INDEX_TTL)
                        )
 
-    module = CVAnsibleModule(argument_spec=module_args)
+    module = CVAnsibleModule(argument_spec=module_args, required_one_of=[('content', 'content_file')],
+                             mutually_exclusive=[('content', 'content_file'), ('destination_path', 'destinations')])
     module.result['changed'] = False
 
     try:
-        client = module.commcell.clients.get(module.params.get('client'))
-        agent_type = module.params.get('agent_type', 'File System')
-        agent = client.agents.get(agent_type)
-        backupset = agent.backupsets.get(agent.backupsets.default_backup_set if not module.params.get('backupset') else module.params.get('backupset'))
-        subclient = backupset.subclients.get(backupset.subclients.default_subclient if not module.params.get('subclient') else module.params.get('subclient'))
+        entity_index = EntityIndex(module.commcell, ttl=module.params.get('entity_index_ttl'))
+        subclient = entity_index.get_subclient(
+            module.params.get('client'),
+            module.params.get('agent_type') or 'File System',
+            module.params.get('backupset'),
+            module.params.get('subclient')
+        )
+        client = subclient._client_object
         content = module.params.get('content')
-        destination_path = module.params.get('destination_path')
+        if module.params.get('content_file'):
+            with open(module.params.get('content_file')) as fh:
+                content = [line.strip() for line in fh if line.strip() and not line.lstrip().startswith('#')]
+
+        paths = list(dict.fromkeys(str(path) for path in (content if isinstance(content, list) else [content])))
+        if not paths:
+            raise Exception("No path to restore was given")
+
+        destinations = module.params.get('destinations')
+        if destinations:
+            if any(not destination.get('path') for destination in destinations):
+                raise Exception("Every destination needs a path")
+            if len(destinations) > len(paths):
+                raise Exception(f"{len(destinations)} destinations were given for {len(paths)} paths")
+
+            # The clients are resolved once, before the jobs are started.
+            clients = {}
+            for destination in destinations:
+                name = destination.get('client') or client.client_name
+                if name not in clients:
+                    clients[name] = module.commcell.clients.get(name)
+            targets = [(clients[destination.get('client') or client.client_name], destination['path'])
+                       for destination in destinations]
+        else:
+            split_jobs = max(1, min(module.params.get('split_jobs') or 1, len(paths)))
+            targets = [(client, module.params.get('destination_path'))] * split_jobs
+
+        # Contiguous splits of the sorted paths keep the files of a folder in the same job, their sizes differ by
+        # at most one so that every destination gets paths.
+        if len(targets) > 1:
+            paths.sort()
+        size, extra = divmod(len(paths), len(targets))
+        splits, start = [], 0
+        for index in range(len(targets)):
+            end = start + size + (1 if index < extra else 0)
+            splits.append(paths[start:end])
+            start = end
+        if any(not split for split in splits):
+            raise Exception(f"Failed to split {len(paths)} paths across {len(targets)} restore jobs")
         unconditional_overwrite = module.params.get('unconditional_overwrite')
-        in_place = module.params.get('in_place')
+        copy_precedence = module.params.get('copy_precedence')
+        in_place = module.params.get('in_place') and not destinations
 
-        if destination_path is not None:
+        if module.params.get('destination_path') is not None:
             in_place = False
 
-        if in_place:
-            restore = subclient.restore_in_place(
-                paths=[content],
-                overwrite=unconditional_overwrite
-            )
+        fs_options = {}
+        if module.params.get('streams') and module.params.get('streams') > 1:
+            fs_options['no_of_streams'] = module.params.get('streams')
+        if module.params.get('media_agent'):
+            fs_options['media_agent'] = module.params.get('media_agent')
 
-        else:
-            restore = subclient.restore_out_of_place(
-                client=client,
-                destination_path=destination_path,
-                paths=[content],
-                overwrite=unconditional_overwrite
+        if module.check_mode:
+            module.result['estimate'] = BackupHistory(JobManager(module.commcell), subclient).estimate_restore()
+            module.result['changed'] = True
+            module.exit_json(**module.result)
+
+        jobs, errors = start_restores(
+            subclient, splits, targets, in_place, unconditional_overwrite, copy_precedence, fs_options
+        )
+        module.result['job_ids'] = [str(job.job_id) for job in jobs]
+        if module.result['job_ids']:
+            module.result['job_id'] = module.result['job_ids'][0]
+            module.result['changed'] = True
+        if errors:
+            raise Exception(f"Failed to start {len(errors)} of {len(splits)} restore jobs: {errors[0]}")
+
+        if module.params.get('wait'):
+            job_manager = JobManager(module.commcell)
+            states, job_errors, timed_out = job_manager.wait(
+                module.result['job_ids'], timeout=module.params.get('wait_timeout')
             )
+            summaries, _ = job_manager.get_summaries(module.result['job_ids'])
+            module.result['jobs'] = {
+                str(job_id): dict(status=state['status'], **JobManager.get_throughput([summaries.get(job_id, {})]))
+                for job_id, state in states.items()
+            }
+            module.result['throughput'] = JobManager.get_throughput(summaries.values())
 
-        module.result['job_id'] = str(restore.job_id)
-        module.result['changed'] = True
+            failed_jobs = [job_id for job_id, state in states.items() if state['finished'] and not state['successful']]
+            if failed_jobs:
+                raise Exception(f"Restore jobs {failed_jobs} failed")
+            if job_errors:
+                raise Exception(f"Restore jobs {list(job_errors)} couldn't be queried")
+            if timed_out:
+                raise Exception(f"Restore jobs did not finish in {module.params.get('wait_timeout')} seconds")
 
         module.exit_json(**module.result)
 
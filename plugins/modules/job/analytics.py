@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+
+
+DOCUMENTATION = '''
+module: commvault.ansible.job.analytics
+short_description: Aggregates the duration, size and failures of the finished Jobs
+description: 
+    - This module reads the finished Jobs of the lookup time page by page and aggregates them in a single pass
+    - Returns the duration percentiles, total bytes, throughput and failure rate overall and per client, media agent, storage policy or job type, never the Jobs themselves
+    - commvault.ansible.job.analytics module can be used in playbooks for capacity planning and reporting
+
+options:
+    webserver_hostname:
+        description:
+            - Hostname of the Web Server. 
+        type: str
+        required: false
+
+    commcell_username:
+        description:
+            - Username 
+        type: str
+        required: false    
+
+    commcell_password:
+        description:
+            - Password 
+        type: str
+        required: false
+
+    clients:
+        description:
+            - Names of the clients of the jobs, all the clients if not given.
+        type: list
+        elements: str
+        required: false
+
+    job_types:
+        description:
+            - Job types of the jobs, e.g. Backup, Restore. All the job types if not given.
+        type: list
+        elements: str
+        required: false
+
+    lookup_time:
+        description:
+            - Hours the finished jobs are looked up for.
+        type: int
+        required: false
+        default: 24
+
+    group_by:
+        description:
+            - Groupings of the jobs, the jobs missing the field of a grouping are aggregated under 'unknown'.
+        type: list
+        elements: str
+        required: false
+        default: ["client", "media_agent"]
+        choices: ["client", "media_agent", "storage_policy", "job_type"]
+
+    page_size:
+        description:
+            - Number of jobs requested per page.
+        type: int
+        required: false
+        default: 500
+
+'''
+
+EXAMPLES = '''
+# Aggregates the backup jobs of the last week
+
+- name: "Backup analytics"
+  commvault.ansible.job.analytics:
+    job_types: ["Backup"]
+    lookup_time: 168
+  register: backup_analytics
+
+- name: "Clients with a failure rate above 5%"
+  debug:
+    msg: "{{ backup_analytics.aggregates.client | dict2items | selectattr('value.failure_rate', 'gt', 0.05) | map(attribute='key') | list }}"
+
+- name: "Throughput per storage policy"
+  commvault.ansible.job.analytics:
+    webserver_hostname: "demo-CS-Name"
+    commcell_username: "user"
+    commcell_password: "CS-Password"
+    group_by: ["storage_policy"]
+
+'''
+
+RETURN = r'''
+aggregates:
+    description: Metrics overall and per group of each grouping. Durations are in seconds and throughput in bytes per second.
+    returned: always
+    type: dict
+    sample: {'overall': {'jobs': 2, 'failed': 1, 'failure_rate': 0.5, 'duration_p50': 300, 'duration_p95': 900, 'duration_p99': 900, 'total_duration': 1200, 'total_bytes': 6000000, 'total_bytes_on_media': 2500000, 'throughput': 5000.0}, 'client': {'client01': {'jobs': 2, 'failed': 1}}}
+
+jobs_scanned:
+    description: Number of jobs aggregated
+    returned: always
+    type: int
+    sample: 2
+
+'''
+
+from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
+from ansible_collections.commvault.ansible.plugins.module_utils.job_analytics import (
+    GROUP_FIELDS,
+    JobAnalytics
+)
+from ansible_collections.commvault.ansible.plugins.module_utils.job_manager import JobManager
+
+
+def main():
+    try:
+        module_args = dict(clients=dict(type=list, elements='str', required=False),
+                           job_types=dict(type=list, elements='str', required=False),
+                           lookup_time=dict(type=int, required=False, default=24),
+                           group_by=dict(type=list, elements='str', required=False, default=['client', 'media_agent'],
+                                         choices=list(GROUP_FIELDS)),
+                           page_size=dict(type=int, required=False, default=500))
+
+        module = CVAnsibleModule(argument_spec=module_args)
+
+        analytics = JobAnalytics(module.params['group_by'])
+        summaries = JobManager(module.commcell).iter_jobs(
+            module.params['clients'], module.params['job_types'], category='FINISHED',
+            lookup_time=module.params['lookup_time'], page_size=max(1, module.params['page_size'])
+        )
+        for summary in summaries:
+            analytics.add(summary)
+
+        module.result['aggregates'] = analytics.report()
+        module.result['jobs_scanned'] = analytics.overall['jobs']
+
+        module.result['failed'] = False
+        module.result['changed'] = False
+        module.exit_json(**module.result)
+
+    except Exception as exp:
+        module.fail_json(msg=str(exp), changed=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+
+
+DOCUMENTATION = '''
+module: commvault.ansible.job.facts
+short_description: Lists the job history of the Commcell
+description: 
+    - This module lists the Jobs of the Commcell page by page, filtered on the server by client, job type, category and lookup time
+    - Only the given fields of each Job are kept, and the listing stops once the row limit is reached
+    - With dest, the Jobs are written to a JSON lines file instead of being returned in the task result
+    - commvault.ansible.job.facts module can be used in playbooks to report on or act upon the job history
+
+options:
+    webserver_hostname:
+        description:
+            - Hostname of the Web Server. 
+        type: str
+        required: false
+
+    commcell_username:
+        description:
+            - Username 
+        type: str
+        required: false    
+
+    commcell_password:
+        description:
+            - Password 
+        type: str
+        required: false
+
+    clients:
+        description:
+            - Names of the clients of the jobs.
+        type: list
+        elements: str
+        required: false
+
+    job_types:
+        description:
+            - Job types of the jobs, e.g. Backup, Restore, AUXCOPY, WORKFLOW.
+        type: list
+        elements: str
+        required: false
+
+    statuses:
+        description:
+            - Statuses of the jobs, e.g. Running, Completed, Failed.
+        type: list
+        elements: str
+        required: false
+
+    category:
+        description:
+            - Category of the jobs, filtered on the server before the statuses.
+        type: str
+        required: false
+        default: all
+        choices: ["all", "active", "finished"]
+
+    lookup_time:
+        description:
+            - Hours the finished jobs are looked up for.
+        type: int
+        required: false
+        default: 24
+
+    limit:
+        description:
+            - Maximum number of jobs returned, 0 for no limit.
+        type: int
+        required: false
+        default: 1000
+
+    fields:
+        description:
+            - Fields of the job summary kept for each job, a field of a nested object is given by its dotted path.
+        type: list
+        elements: str
+        required: false
+        default: ["jobId", "status", "jobType", "appTypeName", "backupLevelName", "subclient.clientName", "jobStartTime", "jobEndTime", "sizeOfApplication"]
+
+    page_size:
+        description:
+            - Number of jobs requested per page, at most limit unless statuses is given, as the statuses are filtered once the pages are received.
+        type: int
+        required: false
+        default: 500
+
+    dest:
+        description:
+            - Path of a file the jobs are written to, one JSON object per line, instead of being returned.
+        type: str
+        required: false
+
+'''
+
+EXAMPLES = '''
+# Lists the job history of the Commcell
+
+- name: "Failed backup Jobs of the last week"
+  commvault.ansible.job.facts:
+    job_types: ["Backup"]
+    statuses: ["Failed", "Killed"]
+    category: "finished"
+    lookup_time: 168
+    fields: ["jobId", "status", "subclient.clientName", "jobStartTime"]
+  register: failed_backups
+
+- name: "Active Jobs of the clients"
+  commvault.ansible.job.facts:
+    clients: ["client01", "client02"]
+    category: "active"
+    limit: 100
+
+- name: "Export the job history of the last 30 days"
+  commvault.ansible.job.facts:
+    webserver_hostname: "demo-CS-Name"
+    commcell_username: "user"
+    commcell_password: "CS-Password"
+    lookup_time: 720
+    limit: 0
+    dest: "/tmp/jobs.jsonl"
+
+'''
+
+RETURN = r'''
+jobs:
+    description: Fields of each job
+    returned: When dest is not provided
+    type: list
+    sample: [{'jobId': 2016, 'status': 'Completed', 'subclient.clientName': 'client01'}]
+
+count:
+    description: Number of jobs returned or written to dest
+    returned: always
+    type: int
+    sample: 1
+
+truncated:
+    description: Whether the listing was stopped at the row limit, more jobs may match
+    returned: always
+    type: bool
+    sample: False
+
+dest:
+    description: Path of the file the jobs were written to
+    returned: When dest is provided
+    type: str
+    sample: '/tmp/jobs.jsonl'
+
+'''
+
+import json
+import os
+from contextlib import nullcontext
+
+from ansible_collections.commvault.ansible.plugins.module_utils.atomic_file import atomic_write
+from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
+from ansible_collections.commvault.ansible.plugins.module_utils.job_manager import JobManager
+
+JOB_FACT_FIELDS = [
+    'jobId', 'status', 'jobType', 'appTypeName', 'backupLevelName', 'subclient.clientName', 'jobStartTime',
+    'jobEndTime', 'sizeOfApplication'
+]
+
+
+def main():
+    try:
+        module_args = dict(clients=dict(type=list, elements='str', required=False),
+                           job_types=dict(type=list, elements='str', required=False),
+                           statuses=dict(type=list, elements='str', required=False),
+                           category=dict(type=str, required=False, default='all',
+                                         choices=['all', 'active', 'finished']),
+                           lookup_time=dict(type=int, required=False, default=24),
+                           limit=dict(type=int, required=False, default=1000),
+                           fields=dict(type=list, elements='str', required=False, default=JOB_FACT_FIELDS),
+                           page_size=dict(type=int, required=False, default=500),
+                           dest=dict(type=str, required=False))
+
+        module = CVAnsibleModule(argument_spec=module_args)
+
+        limit = module.params['limit']
+        fields = module.params['fields']
+        dest = module.params['dest']
+        # The statuses are filtered on the pages received, a page of limit jobs may hold none of the jobs returned.
+        page_size = max(1, module.params['page_size'])
+        if limit > 0 and not module.params['statuses']:
+            page_size = min(page_size, limit)
+
+        job_manager = JobManager(module.commcell)
+        summaries = job_manager.iter_jobs(
+            module.params['clients'], module.params['job_types'], module.params['statuses'],
+            category=module.params['category'], lookup_time=module.params['lookup_time'], page_size=page_size
+        )
+
+        jobs, count, truncated = [], 0, False
+        if dest:
+            dest = os.path.abspath(os.path.expanduser(dest))
+
+        with atomic_write(dest) if dest else nullcontext() as fh:
+            for summary in summaries:
+                job = job_manager.project(summary, fields)
+                if fh:
+                    fh.write(json.dumps(job) + '\n')
+                else:
+                    jobs.append(job)
+                count += 1
+
+                # Stopped before the next page is requested.
+                if limit > 0 and count >= limit:
+                    truncated = True
+                    break
+
+        if dest:
+            module.result['dest'] = dest
+        else:
+            module.result['jobs'] = jobs
+        module.result['count'] = count
+        module.result['truncated'] = truncated
+
+        module.result['failed'] = False
+        module.result['changed'] = bool(dest)
+        module.exit_json(**module.result)
+
+    except Exception as exp:
+        module.fail_json(msg=str(exp), changed=False)
+
+
+if __name__ == "__main__":
+    main()
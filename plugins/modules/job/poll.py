@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+
+
+DOCUMENTATION = '''
+module: commvault.ansible.job.poll
+short_description: Polls a Job from its job handle
+description: 
+    - This module reads the job handle written by a module which started a Job, and returns the state of the Job
+    - The session is resumed from the session file named in the handle, no login is done and only the job summary is requested
+    - commvault.ansible.job.poll module can be used in playbooks with until/retries to wait for jobs started with async & poll 0
+
+options:
+    job_handle:
+        description:
+            - Path of the job handle file, as given to the module which started the job.
+        type: str
+        required: true
+
+'''
+
+EXAMPLES = '''
+# Starts a push install in the background & polls it without holding a fork
+
+- name: "Push install"
+  commvault.ansible.deployment.install_software:
+    os_type: "windows"
+    client_computers: ["client01.mydomain.com"]
+    windows_packages: ["FILE_SYSTEM"]
+    username: "admin"
+    password: "password"
+    wait_for_job_completion: False
+    job_handle: "/tmp/install_client01.job"
+  async: 600
+  poll: 0
+
+- name: "Wait for the install Job"
+  commvault.ansible.job.poll:
+    job_handle: "/tmp/install_client01.job"
+  register: install
+  until: install.finished
+  retries: 360
+  delay: 30
+
+'''
+
+RETURN = r'''
+job_id:
+    description: ID of the Job
+    returned: always
+    type: str
+    sample: '2016'
+
+operation:
+    description: Module which started the Job
+    returned: always
+    type: str
+    sample: 'deployment.install_software'
+
+status:
+    description: Status of the Job
+    returned: always
+    type: str
+    sample: 'Running'
+
+finished:
+    description: Whether the Job has finished
+    returned: always
+    type: bool
+    sample: False
+
+successful:
+    description: Whether the Job has finished successfully
+    returned: always
+    type: bool
+    sample: False
+
+duration:
+    description: Seconds elapsed since the Job started
+    returned: always
+    type: int
+    sample: 812
+
+delay_reason:
+    description: Reason of the delay of the Job, or of its failure
+    returned: always
+    type: str
+    sample: 'Waiting for the client to respond'
+
+'''
+
+from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
+from ansible_collections.commvault.ansible.plugins.module_utils.job_handle import JobHandle
+from ansible_collections.commvault.ansible.plugins.module_utils.job_manager import JobManager
+
+
+def main():
+    try:
+        module_args = dict(job_handle=dict(type=str, required=True))
+
+        # The login arguments are not needed, the session is resumed from the session file named in the job handle.
+        module = CVAnsibleModule(argument_spec=module_args, override=True)
+
+        # The token renewed by the poll is saved to the session file, a pooled login leases one of its tokens.
+        handle = JobHandle(module.params['job_handle']).load()
+        commcell = module.resume_session(handle['session_file'])
+
+        job_manager = JobManager(commcell)
+        state = job_manager.get_state(job_manager.get_summary(handle['job_id']))
+        if state['finished'] and not state['successful']:
+            state['delay_reason'] = job_manager.get_delay_reason(handle['job_id']) or state['delay_reason']
+
+        module.result['job_id'] = str(handle['job_id'])
+        module.result['operation'] = handle['operation']
+        module.result.update(state)
+        module.result['changed'] = False
+
+        if state['finished'] and not state['successful']:
+            module.fail_json(msg=str(state['delay_reason'] or f"Job {handle['job_id']} {state['status']}"),
+                             **module.result)
+
+        module.result['failed'] = False
+        module.exit_json(**module.result)
+
+    except Exception as exp:
+        module.fail_json(msg=str(exp), changed=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -46,12 +46,29 @@ options:
     job_id:
         description:
             - ID of the job
+            - Either job_id or job_ids is required.
         type: int
-        required: True
+        required: false
+
+    job_ids:
+        description:
+            - IDs of the jobs, their statuses are queried concurrently with a single request per job.
+            - Either job_id or job_ids is required.
+        type: list
+        elements: int
+        required: false
+
+    incomplete_only:
+        description:
+            - Only return the jobs of job_ids which have not finished yet (not Completed/Failed/Killed/Committed).
+        type: bool
+        required: false
+        default: false
 
     wait_for_job_completion:
         description:
             - wait till job status is changed to Completed/Failed
+            - Only supported with job_id.
         type: bool
         required: false
         default: false
@@ -82,6 +99,11 @@ EXAMPLES = '''
     commcell_password: "CS-Password"
     job_id: 23
 
+- name: "Status of the jobs started by the previous tasks, only the jobs still running are returned"
+  commvault.ansible.job.status:
+    job_ids: "{{ backup_jobs | map(attribute='job_id') | list }}"
+    incomplete_only: True
+
 '''
 
 RETURN = r'''
@@ -90,34 +112,56 @@ job_id:
     type: str 
     sample: 'Running/Completed'
 
+job_statuses:
+    description: Status of each job of job_ids, keyed by job ID
+    returned: When job_ids is provided
+    type: dict
+    sample: {'2016': 'Running', '2017': 'Completed'}
+
+job_errors:
+    description: Error message of each job of job_ids which couldn't be queried, keyed by job ID
+    returned: When job_ids is provided and any job couldn't be queried
+    type: dict
+    sample: {'2018': 'No job exists with ID 2018'}
+
 '''
 
 from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
-try:
-    from cvpysdk.job import Job
-    from cvpysdk.exception import SDKException
-except ModuleNotFoundError:
-    pass
+from ansible_collections.commvault.ansible.plugins.module_utils.job_manager import JobManager
 
 
 def main():
     try:
-        module_args = dict(job_id=dict(type=int, required=True),
+        module_args = dict(job_id=dict(type=int, required=False),
+                           job_ids=dict(type=list, elements='int', required=False),
+                           incomplete_only=dict(type=bool, required=False, default=False),
                            wait_for_job_completion=dict(type=bool, required=False, default=False))
                         
-        module = CVAnsibleModule(argument_spec=module_args)
+        module = CVAnsibleModule(argument_spec=module_args, required_one_of=[('job_id', 'job_ids')],
+                                 mutually_exclusive=[('job_id', 'job_ids')])
 
-        job_id = int(module.params['job_id'])
         wait_for_job_completion = module.params['wait_for_job_completion']
         commcell_obj = module.commcell
+        job_manager = JobManager(commcell_obj)
+
+        if module.params['job_ids'] is not None:
+            if wait_for_job_completion:
+                raise Exception("wait_for_job_completion is only supported with job_id")
+
+            statuses, errors = job_manager.get_statuses(module.params['job_ids'], module.params['incomplete_only'])
+            module.result["job_statuses"] = {str(job_id): status for job_id, status in statuses.items()}
+            if errors:
+                module.result["job_errors"] = {str(job_id): error for job_id, error in errors.items()}
 
-        job_instance = Job(commcell_object=commcell_obj, job_id=job_id)
+        elif wait_for_job_completion:
+            from cvpysdk.job import Job
 
-        if wait_for_job_completion:
+            job_instance = Job(commcell_object=commcell_obj, job_id=int(module.params['job_id']))
             job_instance.wait_for_completion()
+            module.result["job_status"] = job_instance.summary['status']
 
-        job_status=job_instance.summary['status']
-        module.result["job_status"]=job_status
+        else:
+            module.result["job_status"] = job_manager.get_summary(int(module.params['job_id']))['status']
 
         module.result['failed'] = False
         module.result['changed'] = False
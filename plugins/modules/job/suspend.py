@@ -46,12 +46,44 @@ options:
     job_id:
         description:
             - ID of the job
+            - Exactly one of job_id, job_ids or selector is required.
         type: int
-        required: True
+        required: false
+
+    job_ids:
+        description:
+            - IDs of the jobs to suspend, the jobs are suspended concurrently with a single request per job.
+        type: list
+        elements: int
+        required: false
+
+    selector:
+        description:
+            - Selects the active jobs to suspend, the jobs must match every given filter.
+            - At least one of clients, job_types or statuses is required.
+        type: dict
+        required: false
+        suboptions:
+            clients:
+                description:
+                    - Names of the clients of the jobs.
+                type: list
+                elements: str
+            job_types:
+                description:
+                    - Job types of the jobs, e.g. Backup, Restore.
+                type: list
+                elements: str
+            statuses:
+                description:
+                    - Statuses of the jobs, e.g. Running, Waiting, Pending, Suspended.
+                type: list
+                elements: str
 
     wait_for_job_to_suspend:
         description:
             - wait until job status is changed to Suspended
+            - With job_ids or selector, all the jobs are polled together for up to 6 minutes.
         type: bool
         required: false
         default: false
@@ -82,29 +114,72 @@ EXAMPLES = '''
     commcell_password: "CS-Password"
     job_id: 23
 
+- name: "Suspend the Jobs"
+  commvault.ansible.job.suspend:
+    job_ids: [2016, 2017, 2018]
+    wait_for_job_to_suspend: True
+
+- name: "Suspend the running backup Jobs of the clients"
+  commvault.ansible.job.suspend:
+    selector:
+      clients: ["client01", "client02"]
+      job_types: ["Backup"]
+      statuses: ["Running"]
+
 '''
 
-RETURN = r'''#'''
+RETURN = r'''
+job_results:
+    description: Outcome of each job of job_ids or selector, keyed by job ID. The status is only set when waiting, the error only when the job couldn't be suspended.
+    returned: When job_ids or selector is provided
+    type: dict
+    sample: {'2016': {'requested': True, 'status': 'Suspended'}}
+
+'''
 
 from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
-try:
-    from cvpysdk.job import Job
-    from cvpysdk.exception import SDKException
-except ModuleNotFoundError:
-    pass
+from ansible_collections.commvault.ansible.plugins.module_utils.job_manager import JobManager
 
 
 def main():
     try:
-        module_args = dict(job_id=dict(type=int, required=True),
+        module_args = dict(job_id=dict(type=int, required=False),
+                           job_ids=dict(type=list, elements='int', required=False),
+                           selector=dict(type='dict', required=False, options=dict(
+                               clients=dict(type=list, elements='str', required=False),
+                               job_types=dict(type=list, elements='str', required=False),
+                               statuses=dict(type=list, elements='str', required=False))),
                            wait_for_job_to_suspend=dict(type=bool, required=False, default=False))
                         
-        module = CVAnsibleModule(argument_spec=module_args)
+        module = CVAnsibleModule(argument_spec=module_args, required_one_of=[('job_id', 'job_ids', 'selector')],
+                                 mutually_exclusive=[('job_id', 'job_ids', 'selector')])
 
-        job_id = int(module.params['job_id'])
         wait_for_job_to_suspend = module.params['wait_for_job_to_suspend']
         commcell_obj = module.commcell
 
+        if module.params['job_id'] is None:
+            job_manager = JobManager(commcell_obj)
+            job_ids = module.params['job_ids']
+            if job_ids is None:
+                selector = module.params['selector']
+                job_ids = job_manager.select(
+                    selector.get('clients'), selector.get('job_types'), selector.get('statuses')
+                )
+
+            outcomes = job_manager.control_all(job_ids, 'suspend', wait=wait_for_job_to_suspend)
+            failed_jobs = [job_id for job_id, outcome in outcomes.items() if 'error' in outcome]
+
+            module.result['job_results'] = {str(job_id): outcome for job_id, outcome in outcomes.items()}
+            module.result['changed'] = any(outcome['requested'] for outcome in outcomes.values())
+            if failed_jobs:
+                module.fail_json(msg=f"Failed to suspend jobs {failed_jobs}", **module.result)
+
+            module.result['failed'] = False
+            module.exit_json(**module.result)
+
+        from cvpysdk.job import Job
+
+        job_id = int(module.params['job_id'])
         job_instance = Job(commcell_object=commcell_obj, job_id=job_id)
         job_instance.pause(wait_for_job_to_pause=wait_for_job_to_suspend)
 
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+
+
+DOCUMENTATION = '''
+module: commvault.ansible.job.wait
+short_description: Waits for many Jobs to finish
+description: 
+    - This module waits for the given Jobs to finish, polling the Jobs not yet finished concurrently
+    - The interval between polls grows while no Job changes its status, one task can wait for a whole wave of Jobs
+    - commvault.ansible.job.wait module can be used in playbooks to wait for the jobs started by previous tasks
+
+options:
+    webserver_hostname:
+        description:
+            - Hostname of the Web Server. 
+        type: str
+        required: false
+
+    commcell_username:
+        description:
+            - Username 
+        type: str
+        required: false    
+
+    commcell_password:
+        description:
+            - Password 
+        type: str
+        required: false
+    
+    job_ids:
+        description:
+            - IDs of the jobs to wait for.
+        type: list
+        elements: int
+        required: true
+
+    timeout:
+        description:
+            - Seconds after which the wait is given up, the task fails with the jobs still running. No limit if not set.
+        type: int
+        required: false
+
+    fail_fast:
+        description:
+            - Stop waiting as soon as a job fails, is killed or can't be queried in 3 polls in a row.
+        type: bool
+        required: false
+        default: false
+
+    poll_interval:
+        description:
+            - Seconds between the first polls, and after any job changes its status.
+        type: int
+        required: false
+        default: 10
+
+    max_poll_interval:
+        description:
+            - Maximum seconds between polls, the interval grows up to it while no job changes its status.
+        type: int
+        required: false
+        default: 120
+
+'''
+
+EXAMPLES = '''
+# Waits for the backup jobs started by the previous tasks
+
+- name: "Wait for the Jobs"
+  commvault.ansible.job.wait:
+    job_ids: "{{ backup_jobs | map(attribute='job_id') | list }}"
+
+- name: "Wait at most an hour, stop on the first failure"
+  commvault.ansible.job.wait:
+    job_ids: [2016, 2017, 2018]
+    timeout: 3600
+    fail_fast: True
+
+- name: "Wait for the Jobs, polling every 30 seconds up to every 5 minutes"
+  commvault.ansible.job.wait:
+    webserver_hostname: "demo-CS-Name"
+    commcell_username: "user"
+    commcell_password: "CS-Password"
+    job_ids: [2016, 2017]
+    poll_interval: 30
+    max_poll_interval: 300
+
+'''
+
+RETURN = r'''
+jobs:
+    description: Final state of each job, keyed by job ID. Duration is in seconds, the delay reason of a failed job has the reason of the failure.
+    returned: always
+    type: dict
+    sample: {'2016': {'status': 'Completed', 'finished': True, 'successful': True, 'duration': 812, 'delay_reason': None}}
+
+failed_jobs:
+    description: IDs of the jobs which failed or were killed
+    returned: always
+    type: list
+    sample: [2017]
+
+pending_jobs:
+    description: IDs of the jobs not finished when the wait stopped
+    returned: always
+    type: list
+    sample: [2018]
+
+job_errors:
+    description: Error message of each job which couldn't be queried on its last poll, keyed by job ID, its status is Unknown. A job is polled again after an error, until it fails 3 polls in a row
+    returned: When any job couldn't be queried
+    type: dict
+    sample: {'2019': 'No job exists with ID 2019'}
+
+timed_out:
+    description: Whether the wait was given up after timeout seconds
+    returned: always
+    type: bool
+    sample: False
+
+'''
+
+from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
+from ansible_collections.commvault.ansible.plugins.module_utils.job_manager import JobManager
+
+
+def main():
+    try:
+        module_args = dict(job_ids=dict(type=list, elements='int', required=True),
+                           timeout=dict(type=int, required=False),
+                           fail_fast=dict(type=bool, required=False, default=False),
+                           poll_interval=dict(type=int, required=False, default=10),
+                           max_poll_interval=dict(type=int, required=False, default=120))
+
+        module = CVAnsibleModule(argument_spec=module_args)
+
+        states, errors, timed_out = JobManager(module.commcell).wait(
+            module.params['job_ids'],
+            timeout=module.params['timeout'],
+            fail_fast=module.params['fail_fast'],
+            poll_interval=max(1, module.params['poll_interval']),
+            max_poll_interval=max(1, module.params['poll_interval'], module.params['max_poll_interval'])
+        )
+
+        failed_jobs = [job_id for job_id, state in states.items() if state['finished'] and not state['successful']]
+        pending_jobs = [job_id for job_id, state in states.items() if not state['finished']]
+        # The jobs given up after repeated query errors are reported as such, not as stopped.
+        stopped_jobs = [job_id for job_id in pending_jobs if job_id not in errors]
+
+        module.result['jobs'] = {str(job_id): state for job_id, state in states.items()}
+        module.result['failed_jobs'] = failed_jobs
+        module.result['pending_jobs'] = pending_jobs
+        module.result['timed_out'] = timed_out
+        if errors:
+            module.result['job_errors'] = {str(job_id): error for job_id, error in errors.items()}
+
+        module.result['changed'] = False
+        if failed_jobs or errors or timed_out:
+            messages = []
+            if failed_jobs:
+                messages.append(f"Jobs {failed_jobs} failed")
+            if errors:
+                messages.append(f"Jobs {list(errors)} couldn't be queried")
+            if timed_out:
+                messages.append(f"Jobs {pending_jobs} did not finish in {module.params['timeout']} seconds")
+            elif stopped_jobs:
+                messages.append(f"Stopped waiting for jobs {stopped_jobs}")
+            module.fail_json(msg=', '.join(messages), **module.result)
+
+        module.result['failed'] = False
+        module.exit_json(**module.result)
+
+    except Exception as exp:
+        module.fail_json(msg=str(exp), changed=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,8 @@ module: commvault.ansible.login
 short_description: Login in to the Commcell with provided credentials or auth token.
 description:
     - commvault.ansible.login can be used to login to Commcell using credentials or auth. token.
+    - The session file is stored in a session directory of the user, /tmp/CVANSIBLE_SESSIONS_<uid>, whose index records the expiry time of each session.
+    - The session file only records the Web Server hostname, the auth token and the TLS settings, later tasks rebuild the Commcell handle from it.
 options:
  webserver_hostname:
   description:
@@ -53,6 +55,41 @@ options:
   - path of the CA_BUNDLE or directory with certificates of trusted CAs (including trusted self-signed certificates)
   type: str
   required: false
+ persistent_connection:
+  description:
+  - Start a local session agent, listening on a Unix socket next to the session file, which keeps the connections to the Web Server open across tasks.
+  - Later tasks of the session forward their requests to the agent instead of opening new TLS connections.
+  type: bool
+  required: false
+  default: false
+ persistent_connection_timeout:
+  description:
+  - Seconds without any request after which the session agent exits.
+  type: int
+  required: false
+  default: 600
+ session_pool_size:
+  description:
+  - Number of auth tokens created by the login, each task of the session leases a free token of the pool.
+  - Spreads the requests of parallel forks over several tokens instead of queuing them on a single token.
+  - Requires the username & password, as each token of the pool is a separate login.
+  type: int
+  required: false
+  default: 1
+ renew_session:
+  description:
+  - Store a renewal credential with the session, later tasks log in again & replay the request when the auth token has expired.
+  - The username & Base64 encoded password are kept in the session file, readable by the owner only.
+  - Requires the username & password.
+  type: bool
+  required: false
+  default: false
+ session_ttl:
+  description:
+  - Seconds after which the session is evicted from the session directory by a later login or logout.
+  type: int
+  required: false
+  default: 86400
 author:
 - Commvault Systems Inc
 '''
@@ -63,6 +100,27 @@ EXAMPLES = r'''
     webserver_hostname: 'web_server_hostname' 
     commcell_username: 'user'
     commcell_password: 'password'
+
+- name: Log in to the Commcell and keep the connections to the Web Server open across tasks
+  commvault.ansible.login:
+    webserver_hostname: 'web_server_hostname'
+    commcell_username: 'user'
+    commcell_password: 'password'
+    persistent_connection: true
+
+- name: Log in to the Commcell with a token per fork for a run with 20 forks
+  commvault.ansible.login:
+    webserver_hostname: 'web_server_hostname'
+    commcell_username: 'user'
+    commcell_password: 'password'
+    session_pool_size: 20
+
+- name: Log in to the Commcell for a long play, renewing the auth token when it expires
+  commvault.ansible.login:
+    webserver_hostname: 'web_server_hostname'
+    commcell_username: 'user'
+    commcell_password: 'password'
+    renew_session: true
 '''
 
 RETURN = r'''
@@ -75,6 +133,12 @@ authtoken:
 
 from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
 from ansible_collections.commvault.ansible.plugins.module_utils.login.pre_login import PreLogin
+from ansible_collections.commvault.ansible.plugins.module_utils.login.session_agent import (
+    AGENT_IDLE_TIMEOUT,
+    SessionAgent
+)
+from ansible_collections.commvault.ansible.plugins.module_utils.login.session_registry import SESSION_TTL
+from ansible_collections.commvault.ansible.plugins.module_utils.login.token_renewal import TokenRenewal
 
 
 def main():
@@ -88,7 +152,12 @@ def main():
         webserver_password=dict(type=str, required=False, no_log=True),
         auth_token=dict(type=str, required=False),
         verify_ssl=dict(type=bool, required=False, default=True),
-        certificate_path=dict(type=str, required=False)
+        certificate_path=dict(type=str, required=False),
+        persistent_connection=dict(type=bool, required=False, default=False),
+        persistent_connection_timeout=dict(type=int, required=False, default=AGENT_IDLE_TIMEOUT),
+        session_pool_size=dict(type=int, required=False, default=1),
+        renew_session=dict(type=bool, required=False, default=False),
+        session_ttl=dict(type=int, required=False, default=SESSION_TTL)
     )
 
     # PERFORM PRE LOGIN STEPS
@@ -98,6 +167,27 @@ def main():
 
     try:
         module.result['authtoken'] = module.commcell.auth_token
+
+        if module.params.get('persistent_connection'):
+            agent_socket = f"{module.session_file_path}.sock"
+            if SessionAgent.start(agent_socket, module.params.get('persistent_connection_timeout')):
+                module.session['agent_socket'] = agent_socket
+
+        username = module.params.get('commcell_username') or module.params.get('webserver_username')
+        password = module.params.get('commcell_password') or module.params.get('webserver_password')
+
+        pool_size = module.params.get('session_pool_size')
+        if pool_size > 1:
+            if not password:
+                raise Exception("session_pool_size requires the username & password to log in for each token.")
+            module.session['pool'] = [module.commcell.auth_token] + [
+                module._login(**module.params).auth_token for _ in range(pool_size - 1)
+            ]
+
+        if module.params.get('renew_session'):
+            if not password:
+                raise Exception("renew_session requires the username & password to log in again.")
+            module.session['renewal'] = TokenRenewal.create_credential(username, password)
         module.result['changed'] = True
 
         module.exit_json(**module.result)
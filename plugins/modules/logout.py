@@ -22,6 +22,9 @@ module: commvault.ansible.logout
 short_description: Logs out of the Commcell.
 description:
     - commvault.ansible.logout can be used to logout of the Commcell stored in the session file.
+    - Every auth token of a login with session_pool_size is logged out.
+    - The session agent started by commvault.ansible.login with persistent_connection is stopped as well.
+    - The session file is removed from the session directory, along with any other session past its expiry time.
 options:
 author: 
 - Commvault Systems Inc     
@@ -36,6 +39,8 @@ RETURN = r'''#'''
 
 from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
 from ansible_collections.commvault.ansible.plugins.module_utils.login.pre_login import PreLogin
+from ansible_collections.commvault.ansible.plugins.module_utils.login.session_agent import SessionAgent
+from ansible_collections.commvault.ansible.plugins.module_utils.login.session_registry import SessionRegistry
 
 def main():
     """Main method for this module."""
@@ -44,9 +49,25 @@ def main():
     module.result['changed'] = False
 
     try:
+        auth_token = module.commcell.auth_token
         module.commcell.logout()
 
-        # Reusing the clean_up() method for pre login to delete session file.
+        # Logging out the other tokens of a pooled login, the token leased by the task was logged out above.
+        if module.session and module.session.get('pool'):
+            record = dict(module.session, renewal=None)
+            for index, token in enumerate(module.session['pool']):
+                if index != module.session_pool_index and token != auth_token:
+                    module._resume(**dict(record, auth_token=token)).logout()
+
+        # Stopping the session agent, if one was started at login.
+        if module.session and module.session.get('agent_socket'):
+            SessionAgent.stop(module.session['agent_socket'])
+
+        # Deleting the session file, the token is no longer valid. The session must not be saved again on exit.
+        SessionRegistry().remove(module.session_id)
+        module.session = None
+
+        # Reusing the clean_up() method for pre login to delete the expired session files.
         pre_login = PreLogin()
         pre_login.clean_up()
 
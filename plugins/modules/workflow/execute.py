@@ -62,6 +62,13 @@ options:
         required: false
         default: False
 
+    job_handle:
+        description:
+            - Path of a job handle file written once the job is started, for polling the job with commvault.ansible.job.poll.
+            - Use with wait_for_job_completion set to False & Ansible's async/poll 0, the task then returns right away.
+        type: str
+        required: false
+
     
 '''
 
@@ -106,10 +113,7 @@ job_id:
 '''
 
 from ansible_collections.commvault.ansible.plugins.module_utils.cv_ansible_module import CVAnsibleModule
-try:
-    from cvpysdk.job import Job
-except ModuleNotFoundError:
-    pass
+from ansible_collections.commvault.ansible.plugins.module_utils.job_handle import JobHandle
 
 def main():
 
@@ -117,11 +121,14 @@ def main():
         module_args =  dict(workflow_name=dict(type=str, required=True),
                             workflow_inputs=dict(type=dict, required=False, default=None),
                             hidden_workflow=dict(type=bool, required=False, default=False),
-                            wait_for_job_completion=dict(type=bool, required=False, default=True)
+                            wait_for_job_completion=dict(type=bool, required=False, default=True),
+                            job_handle=dict(type=str, required=False)
                             )
 
         module = CVAnsibleModule(argument_spec=module_args)
 
+        from cvpysdk.job import Job
+
         workflow_name = module.params['workflow_name']
         workflow_inputs = module.params['workflow_inputs']
         hidden_workflow =  module.params['hidden_workflow']
@@ -147,6 +154,8 @@ def main():
         if isinstance(workflow_job, Job):
             job_id = workflow_job.job_id
             module.result['job_id'] = str(job_id)
+            if module.params['job_handle']:
+                JobHandle(module.params['job_handle']).save(job_id, module.session_file_path, 'workflow.execute')
 
             if wait_for_job_completion:
                 if not workflow_job.wait_for_completion():
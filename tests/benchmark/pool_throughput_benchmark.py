@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Benchmark of the throughput of parallel tasks, for a single auth token & for a session pool.
+
+The local stand-in of the Web Server serves the requests of each token one at a time, each taking the given latency,
+like the CommServe queues the requests of a token. A session is logged in with each pool size & the job/status module
+is run as that many parallel tasks, like the forks of a play, the wall time of the tasks is measured:
+
+    single  --  session_pool_size 1, the tasks queue on the only token of the session.
+    pool    --  session_pool_size set to the number of tasks, each task leases its own token.
+
+Usage:
+    python tests/benchmark/pool_throughput_benchmark.py
+    python tests/benchmark/pool_throughput_benchmark.py --tasks 16 --latency 2 --min-speedup 4
+
+The start-up of the interpreters of the tasks is part of the wall time, the latency must dwarf it for the speedup to
+approach the number of tasks on a host with few CPUs. The exit status is 1 if the pool isn't at least --min-speedup
+times faster than the single token & 2 if a task failed.
+
+Functions:
+    parse_args()        --  Parses the command line.
+    run_parallel()      --  Logs in with a pool size & runs the tasks in parallel, returns their wall time.
+    main()              --  Runs the benchmark & compares the throughput of the pool with the single token.
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from stand_in_webserver import StandInWebServer
+from startup_benchmark import (
+    collection_path,
+    run_module
+)
+
+TASKS = 8
+LATENCY = 1.0
+MIN_SPEEDUP = 2.0
+
+
+def parse_args():
+    """Parses the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark of the throughput of parallel tasks with a session pool.")
+    parser.add_argument('--tasks', type=int, default=TASKS, help="Tasks run in parallel, the size of the pool.")
+    parser.add_argument('--latency', type=float, default=LATENCY,
+                        help="Seconds taken by each request, the requests of a token are served one at a time.")
+    parser.add_argument('--min-speedup', type=float, default=MIN_SPEEDUP,
+                        help="Speedup of the pool over the single token required to pass.")
+    return parser.parse_args()
+
+
+def run_parallel(server, env, pool_size, tasks):
+    """Logs in with a pool size & runs the tasks in parallel against the stand-in Web Server, returns their wall time.
+
+        Args:
+            server      (object)    --  Stand-in Web Server.
+
+            env         (dict)      --  Environment of the tasks.
+
+            pool_size   (int)       --  session_pool_size of the login.
+
+            tasks       (int)       --  Tasks run in parallel.
+
+        Returns:
+            float - seconds
+
+        Raises:
+            Exception if a task failed.
+
+    """
+    session_id = f"pool_throughput_benchmark_{os.getpid()}_{pool_size}"
+    run_module('login', {'webserver_hostname': server.hostname, 'session_id': session_id,
+                         'session_pool_size': pool_size, 'commcell_username': 'admin', 'commcell_password': 'password'},
+               env)
+
+    try:
+        started = perf_counter()
+        with ThreadPoolExecutor(max_workers=tasks) as executor:
+            list(executor.map(
+                lambda _: run_module('job/status', {'job_id': 1, 'session_id': session_id}, env), range(tasks)
+            ))
+        return perf_counter() - started
+    finally:
+        run_module('logout', {'session_id': session_id}, env)
+
+
+def main():
+    """Runs the benchmark & compares the throughput of the pool with the single token, returns the exit status."""
+    options = parse_args()
+    tasks = max(1, options.tasks)
+
+    server = StandInWebServer(token_latency=options.latency)
+    server.start()
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            collections = collection_path(tmp)
+            env = dict(os.environ, CV_ANSIBLE_PROFILE='1', PYTHONPATH=os.pathsep.join(
+                [collections] + [path for path in [os.environ.get('PYTHONPATH')] if path]
+            ))
+            results = {name: run_parallel(server, env, pool_size, tasks)
+                       for name, pool_size in [('single', 1), ('pool', tasks)]}
+    except Exception as e:
+        print(f"ERROR {e}", file=sys.stderr)
+        return 2
+    finally:
+        server.stop()
+
+    print(f"{'session':10} {'pool size':>10} {'seconds':>10} {'tasks/s':>10}")
+    for name, seconds in results.items():
+        print(f"{name:10} {1 if name == 'single' else tasks:10} {seconds:10.4f} {tasks / seconds:10.2f}")
+
+    speedup = results['single'] / results['pool']
+    print(f"The pool of {tasks} tokens runs {tasks} parallel tasks {speedup:.2f}x faster than a single token.")
+
+    if speedup < options.min_speedup:
+        print(f"REGRESSION the speedup of the pool is below {options.min_speedup:.2f}x.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
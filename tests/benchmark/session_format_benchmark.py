@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Benchmark of the session file, the token-only session record against the pickled Commcell object it replaced.
+
+A Commcell object is logged in to a local stand-in of the Web Server listing the given number of clients, its clients
+are loaded like a task using them would, & it is saved in both formats. The per-task start-up of each format is then
+timed in a new interpreter, like Ansible runs every task:
+
+    pickle  --  Loads the Commcell object from the session file & writes it back, as every task did on exit.
+    record  --  Loads the session record & rebuilds the Commcell handle from its token, without writing.
+
+Usage:
+    python tests/benchmark/session_format_benchmark.py
+    python tests/benchmark/session_format_benchmark.py --clients 5000 --runs 10
+
+The size of each session file & the median start-up of each format are printed, the exit status is 1 if the session
+record is not both smaller & faster to start from than the pickle.
+
+Functions:
+    parse_args()        --  Parses the command line.
+    save_sessions()     --  Logs in to the stand-in Web Server & saves the session in both formats.
+    run_task()          --  Runs the start-up of a task once for a format & returns its wall time.
+    benchmark()         --  Returns the session file size & the median start-up of each format.
+    main()              --  Runs the benchmark & compares the formats.
+
+"""
+
+import argparse
+import os
+import pickle
+import statistics
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+from stand_in_webserver import StandInWebServer
+from startup_benchmark import collection_path
+
+RUNS = 5
+CLIENTS = 1000
+RUN_TIMEOUT = 120
+
+# Start-up of a task for each format, run with the path of the session file as argument.
+TASKS = {
+    'pickle': (
+        "import pickle, sys\n"
+        "with open(sys.argv[1], 'rb') as fh:\n"
+        "    commcell = pickle.load(fh)\n"
+        "with open(sys.argv[1], 'wb') as fh:\n"
+        "    pickle.dump(commcell, fh)\n"
+    ),
+    'record': (
+        "import sys\n"
+        "from ansible_collections.commvault.ansible.plugins.module_utils.login.commcell_handle import CommcellHandle\n"
+        "from ansible_collections.commvault.ansible.plugins.module_utils.login.session import SessionFile\n"
+        "CommcellHandle(**SessionFile(sys.argv[1]).load())\n"
+    ),
+}
+
+
+def parse_args():
+    """Parses the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark of the session record against the pickled Commcell.")
+    parser.add_argument('--runs', type=int, default=RUNS, help="Runs of each format, the median is kept.")
+    parser.add_argument('--clients', type=int, default=CLIENTS,
+                        help="Clients listed by the stand-in Web Server & cached by the Commcell object.")
+    return parser.parse_args()
+
+
+def save_sessions(hostname, tmp):
+    """Logs in to the stand-in Web Server & saves the session in both formats.
+
+        Args:
+            hostname    (str)   --  Web Server hostname of the stand-in Web Server.
+
+            tmp         (str)   --  Directory the session files are saved to.
+
+        Returns:
+            dict - {format: path of the session file}
+
+    """
+    from cvpysdk.commcell import Commcell
+    from ansible_collections.commvault.ansible.plugins.module_utils.login.session import SessionFile
+
+    login_args = {'webserver_hostname': hostname, 'verify_ssl': False}
+    commcell = Commcell(hostname, 'admin', 'password', verify_ssl=False)
+    commcell.clients.all_clients
+
+    paths = {name: os.path.join(tmp, name) for name in TASKS}
+    with open(paths['pickle'], 'wb') as fh:
+        pickle.dump(commcell, fh)
+    SessionFile(paths['record']).save(
+        SessionFile.create_record(login_args, commcell.auth_token, commcell._web_service)
+    )
+    return paths
+
+
+def run_task(name, path, env):
+    """Runs the start-up of a task once for a format in a new interpreter & returns its wall time.
+
+        Args:
+            name    (str)   --  Format of the session file, pickle or record.
+
+            path    (str)   --  Path of the session file.
+
+            env     (dict)  --  Environment of the process.
+
+        Returns:
+            float - seconds
+
+        Raises:
+            Exception if the start-up of the task failed.
+
+    """
+    started = perf_counter()
+    process = subprocess.run(
+        [sys.executable, '-c', TASKS[name], path], env=env, capture_output=True, text=True, timeout=RUN_TIMEOUT
+    )
+    wall = perf_counter() - started
+
+    if process.returncode:
+        raise Exception(f"The {name} task failed: {process.stderr.strip()[-500:]}")
+
+    return wall
+
+
+def benchmark(clients, runs):
+    """Returns the session file size & the median start-up of each format, against the stand-in Web Server.
+
+        Args:
+            clients (int)   --  Clients listed by the stand-in Web Server.
+
+            runs    (int)   --  Runs of each format.
+
+        Returns:
+            dict - {format: {'bytes': size of the session file, 'seconds': median start-up}}
+
+    """
+    server = StandInWebServer(clients=clients)
+    server.start()
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            collections = collection_path(tmp)
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+                [collections] + [path for path in [os.environ.get('PYTHONPATH')] if path]
+            ))
+            sys.path.insert(0, collections)
+
+            paths = save_sessions(server.hostname, tmp)
+            return {
+                name: {
+                    'bytes': os.path.getsize(path),
+                    'seconds': round(statistics.median(run_task(name, path, env) for _ in range(runs)), 6)
+                }
+                for name, path in paths.items()
+            }
+    finally:
+        server.stop()
+
+
+def main():
+    """Runs the benchmark & compares the formats, returns the exit status."""
+    options = parse_args()
+    results = benchmark(max(0, options.clients), max(1, options.runs))
+
+    print(f"{'format':10} {'bytes':>12} {'seconds':>10}")
+    for name, result in results.items():
+        print(f"{name:10} {result['bytes']:12} {result['seconds']:10.4f}")
+
+    pickled, record = results['pickle'], results['record']
+    print(f"The session record is {pickled['bytes'] / record['bytes']:.1f}x smaller & starts "
+          f"{pickled['seconds'] / record['seconds']:.2f}x faster than the pickle.")
+
+    if record['bytes'] >= pickled['bytes'] or record['seconds'] >= pickled['seconds']:
+        print("REGRESSION the session record is not smaller & faster than the pickle.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
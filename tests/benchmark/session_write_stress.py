@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Stress test of the session file, written & read by many concurrent processes.
+
+The session file is read in a loop by a reader thread during both phases of the test, every read must return a valid
+session record:
+
+    tasks   --  Runs the job/status module as many concurrent tasks against a local stand-in of the Web Server, the
+                tasks only read the session, none of them may rewrite the session file. Every task rewrote the
+                pickled session file on exit before the session record.
+
+    updates --  Runs concurrent processes merging changes into the session record, each process renews its own token
+                of a session pool several times, like forks renewing their pool token. No update may be lost.
+
+Usage:
+    python tests/benchmark/session_write_stress.py
+    python tests/benchmark/session_write_stress.py --processes 32 --tasks 128 --updates 50
+
+The exit status is 1 if a read failed, a task rewrote the session file or an update was lost.
+
+Functions:
+    parse_args()        --  Parses the command line.
+    read_loop()         --  Reads the session file until stopped & counts the failed reads.
+    run_tasks()         --  Runs the read-only tasks concurrently & returns the writes of the session file.
+    renew_tokens()      --  Renews the token of a pool slot several times, run in its own process.
+    run_updates()       --  Runs the concurrent updates & returns the slots whose last update was lost.
+    main()              --  Runs the stress test & checks the session file.
+
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from stand_in_webserver import StandInWebServer
+from startup_benchmark import (
+    collection_path,
+    run_module
+)
+
+PROCESSES = 16
+TASKS = 64
+UPDATES = 20
+
+
+def parse_args():
+    """Parses the command line."""
+    parser = argparse.ArgumentParser(description="Stress test of the session file with concurrent processes.")
+    parser.add_argument('--processes', type=int, default=PROCESSES, help="Processes run at the same time.")
+    parser.add_argument('--tasks', type=int, default=TASKS, help="Tasks run in the tasks phase.")
+    parser.add_argument('--updates', type=int, default=UPDATES,
+                        help="Updates made by each process of the updates phase.")
+    return parser.parse_args()
+
+
+def read_loop(path, stop, reads):
+    """Reads the session file until stopped & counts the reads & the failed reads.
+
+        Args:
+            path    (str)               --  Path of the session file.
+
+            stop    (threading.Event)   --  Set to stop reading.
+
+            reads   (dict)              --  {'reads': count, 'failed': count, 'errors': [str]}, updated in place.
+
+    """
+    from ansible_collections.commvault.ansible.plugins.module_utils.login.session import SessionFile
+
+    while not stop.is_set():
+        try:
+            SessionFile(path).load()
+        except (OSError, ValueError) as e:
+            reads['failed'] += 1
+            reads['errors'].append(str(e))
+        reads['reads'] += 1
+
+
+def run_tasks(server, env, tasks, processes):
+    """Runs the read-only tasks concurrently against the stand-in Web Server & returns the writes of the session file.
+
+        Args:
+            server      (object)    --  Stand-in Web Server.
+
+            env         (dict)      --  Environment of the tasks.
+
+            tasks       (int)       --  Tasks run.
+
+            processes   (int)       --  Tasks run at the same time.
+
+        Returns:
+            tuple - (writes of the session file, failed reads, {task: error})
+
+    """
+    from ansible_collections.commvault.ansible.plugins.module_utils.login.pre_login import FILE_PATH
+
+    session_id = f"session_write_stress_{os.getpid()}"
+    path = FILE_PATH.format(SESSION_ID=session_id)
+    run_module('login', {'webserver_hostname': server.hostname, 'session_id': session_id,
+                         'commcell_username': 'admin', 'commcell_password': 'password'}, env)
+
+    def version():
+        stat = os.stat(path)
+        return stat.st_ino, stat.st_mtime_ns
+
+    versions, errors = {version()}, {}
+    stop, reads = threading.Event(), {'reads': 0, 'failed': 0, 'errors': []}
+    reader = threading.Thread(target=read_loop, args=(path, stop, reads), daemon=True)
+    reader.start()
+
+    def task(index):
+        try:
+            run_module('job/status', {'job_id': 1, 'session_id': session_id}, env)
+        except Exception as e:
+            errors[index] = str(e)
+        versions.add(version())
+
+    try:
+        with ThreadPoolExecutor(max_workers=processes) as executor:
+            list(executor.map(task, range(tasks)))
+    finally:
+        stop.set()
+        reader.join()
+        run_module('logout', {'session_id': session_id}, env)
+
+    print(f"tasks      {tasks} tasks, {reads['reads']} reads, {reads['failed']} failed reads, "
+          f"{len(versions) - 1} writes of the session file, {tasks} with the pickle")
+    errors.update({f"read {index}": error for index, error in enumerate(reads['errors'][:5])})
+    return len(versions) - 1, reads['failed'], errors
+
+
+def renew_tokens(path, slot, updates):
+    """Renews the token of a pool slot several times, merging each token into the latest session record on disk.
+
+        Args:
+            path    (str)   --  Path of the session file.
+
+            slot    (int)   --  Slot of the session pool renewed by the process.
+
+            updates (int)   --  Renewals made.
+
+    """
+    from ansible_collections.commvault.ansible.plugins.module_utils.login.session import SessionFile
+
+    for update in range(updates):
+        token = f"QSDK standin-{slot}-{update}"
+        SessionFile(path).update(lambda record: record['pool'].__setitem__(slot, token))
+
+
+def run_updates(tmp, processes, updates):
+    """Runs the concurrent updates of the session record & returns the slots whose last update was lost.
+
+        Args:
+            tmp         (str)   --  Temporary directory of the test.
+
+            processes   (int)   --  Processes updating the session record, one per slot of the pool.
+
+            updates     (int)   --  Updates made by each process.
+
+        Returns:
+            tuple - ([slot whose last update was lost], failed reads, {read: error})
+
+    """
+    from ansible_collections.commvault.ansible.plugins.module_utils.login.session import SessionFile
+
+    path = os.path.join(tmp, 'session')
+    record = SessionFile.create_record({'webserver_hostname': 'standin'}, 'QSDK standin', 'http://standin/')
+    record['pool'] = ['QSDK standin'] * processes
+    SessionFile(path).save(record)
+
+    stop, reads = threading.Event(), {'reads': 0, 'failed': 0, 'errors': []}
+    reader = threading.Thread(target=read_loop, args=(path, stop, reads), daemon=True)
+    reader.start()
+
+    context = multiprocessing.get_context('fork')
+    workers = [context.Process(target=renew_tokens, args=(path, slot, updates)) for slot in range(processes)]
+    try:
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    finally:
+        stop.set()
+        reader.join()
+
+    pool = SessionFile(path).load()['pool']
+    lost = [slot for slot in range(processes) if pool[slot] != f"QSDK standin-{slot}-{updates - 1}"]
+    failed = [worker.pid for worker in workers if worker.exitcode]
+
+    print(f"updates    {processes * updates} updates, {reads['reads']} reads, {reads['failed']} failed reads, "
+          f"{len(lost)} lost updates, {len(failed)} failed processes")
+    errors = {f"process {pid}": "exited with an error" for pid in failed}
+    errors.update({f"read {index}": error for index, error in enumerate(reads['errors'][:5])})
+    return lost, reads['failed'], errors
+
+
+def main():
+    """Runs the stress test & checks the session file, returns the exit status."""
+    options = parse_args()
+    processes = max(1, options.processes)
+
+    server = StandInWebServer()
+    server.start()
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            collections = collection_path(tmp)
+            env = dict(os.environ, CV_ANSIBLE_PROFILE='1', PYTHONPATH=os.pathsep.join(
+                [collections] + [path for path in [os.environ.get('PYTHONPATH')] if path]
+            ))
+            sys.path.insert(0, collections)
+
+            writes, tasks_failed, tasks_errors = run_tasks(server, env, max(1, options.tasks), processes)
+            lost, updates_failed, updates_errors = run_updates(tmp, processes, max(1, options.updates))
+    finally:
+        server.stop()
+
+    for name, error in {**tasks_errors, **updates_errors}.items():
+        print(f"ERROR {name}: {error}", file=sys.stderr)
+    if writes:
+        print(f"FAILURE the read-only tasks rewrote the session file {writes} times.", file=sys.stderr)
+    if lost:
+        print(f"FAILURE the last update of the slots {lost} was lost.", file=sys.stderr)
+
+    return 1 if tasks_errors or updates_errors or tasks_failed or updates_failed or writes or lost else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for class StandInWebServer, class for a local stand-in of the Commvault Web Server.
+
+StandInWebServer is the only class defined in this file.
+
+StandInWebServer: Represents a local HTTP server answering the requests made by the modules during their start-up,
+the login, the details of the CommServ, the clients & the jobs, so that the start-up of the modules can be timed
+without a Commcell. Every other authenticated request gets an empty reply, the modules may fail after their first
+API call.
+
+Like the CommServe, the server may serve the requests of each token one at a time, each taking the given latency.
+
+StandInWebServer:
+    __init__()  --  Initializes the server on a free port of the loopback interface.
+    start()     --  Serves the requests on a daemon thread.
+    stop()      --  Stops the server.
+    hostname    --  Web Server hostname of the server, given as webserver_hostname to the modules.
+
+"""
+
+import itertools
+import json
+import re
+import threading
+from contextlib import nullcontext
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer
+)
+from time import sleep
+
+API_PREFIX = '/commandcenter/api/'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler of the stand-in Web Server."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        """Requests are not logged."""
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PUT(self):
+        self._handle('PUT')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+    def _handle(self, method):
+        """Replies to a request, the path is relative to the API of the Web Server."""
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+
+        path = self.path.split(API_PREFIX, 1)[-1].split('?')[0]
+        tokens = self.server.tokens
+
+        if path == '':
+            return self._send({})
+        if path == 'Login':
+            token = f"QSDK standin{next(self.server.counter)}"
+            tokens.add(token)
+            return self._send({'userName': 'admin', 'token': token})
+        if path == 'RenewLoginToken':
+            return self._send({'error': {'errLogMessage': 'Renewal is not supported'}})
+        if self.headers.get('Authtoken') not in tokens:
+            return self._send({}, 401)
+        with self._token_lock(self.headers.get('Authtoken')):
+            sleep(self.server.token_latency)
+            self._reply(path)
+
+    def _reply(self, path):
+        """Replies to an authenticated request."""
+        tokens = self.server.tokens
+
+        if path == 'Logout':
+            tokens.discard(self.headers.get('Authtoken'))
+            return self._send({})
+        if path.startswith('WhoAmI'):
+            return self._send({'user': {'userName': 'admin'}})
+        if path == 'CommServ':
+            return self._send({
+                'commcell': {'csGUID': 'standin', 'commCellName': 'standin', 'commCellId': 2},
+                'hostName': 'standin', 'csTimeZone': {'TimeZoneName': 'UTC'}, 'currentSPVersion': 36,
+                'csVersionInfo': '11.36.0', 'timeZone': '(UTC) Coordinated Universal Time'
+            })
+
+        if path == 'Client':
+            return self._send({'clientProperties': [self._client(index) for index in range(self.server.clients)]})
+
+        match = re.match(r'Job/(\d+)$', path)
+        if match:
+            summary = self._job(int(match.group(1)))
+            return self._send({'totalRecordsWithoutPaging': 1, 'jobs': [{'jobSummary': summary}]})
+        if path == 'Jobs':
+            return self._send({'totalRecordsWithoutPaging': 1, 'jobs': [{'jobSummary': self._job(1)}]})
+        if path == 'JobDetails':
+            return self._send({'job': {'jobDetail': {'generalInfo': {}, 'progressInfo': {}, 'detailInfo': {}}}})
+
+        return self._send({})
+
+    def _token_lock(self, token):
+        """Returns the lock serializing the requests of the token, or a no-op context without token latency."""
+        if not self.server.token_latency:
+            return nullcontext()
+        with self.server.token_locks_lock:
+            return self.server.token_locks.setdefault(token, threading.Lock())
+
+    @staticmethod
+    def _client(index):
+        """Returns the properties of a client, named standin<index>."""
+        name = f"standin{index}"
+        return {'client': {'clientEntity': {'clientName': name, 'clientId': index + 1, 'hostName': f"{name}.standin",
+                                            'displayName': name}}}
+
+    @staticmethod
+    def _job(job_id):
+        """Returns the summary of a completed backup job."""
+        return {
+            'jobId': job_id, 'status': 'Completed', 'isVisible': True, 'jobType': 'Backup',
+            'localizedOperationName': 'Backup', 'appTypeName': 'File System', 'backupLevelName': 'Incremental',
+            'percentComplete': 100, 'jobStartTime': 1700000000, 'jobEndTime': 1700000060, 'jobElapsedTime': 60,
+            'lastUpdateTime': 1700000060, 'sizeOfApplication': 1024, 'totalNumOfFiles': 1, 'pendingReason': '',
+            'subclient': {'clientName': 'standin', 'clientId': 1, 'subclientId': 1}
+        }
+
+    def _send(self, reply, code=200):
+        body = json.dumps(reply).encode()
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StandInWebServer:
+    """Class representing a local stand-in of the Commvault Web Server."""
+
+    def __init__(self, clients=0, token_latency=0):
+        """Initializes the server on a free port of the loopback interface.
+
+            Args:
+                clients         (int)   --  Number of clients listed by the server.
+                    default :   0
+
+                token_latency   (float) --  Seconds taken by each authenticated request, the requests of a token are
+                served one at a time when set.
+                    default :   0
+
+        """
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.server.daemon_threads = True
+        self.server.clients = clients
+        self.server.token_latency = token_latency
+        self.server.token_locks = {}
+        self.server.token_locks_lock = threading.Lock()
+        self.server.tokens = set()
+        self.server.counter = itertools.count(1)
+        self.thread = None
+
+    @property
+    def hostname(self):
+        """Returns the Web Server hostname of the server, given as webserver_hostname to the modules."""
+        return f"127.0.0.1:{self.server.server_address[1]}"
+
+    def start(self):
+        """Serves the requests on a daemon thread."""
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stops the server."""
+        self.server.shutdown()
+        self.server.server_close()
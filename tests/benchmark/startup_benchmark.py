@@ -0,0 +1,320 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Benchmark of the cold start of every module of the collection, against a local stand-in of the Web Server.
+
+Each module under plugins/modules is run in a new interpreter, like Ansible runs it, with the CV_ANSIBLE_PROFILE
+environment variable set. The start-up phases reported in its startup_profile (interpreter, imports,
+argument_parsing, session_load, login or resume & first_request) & the wall time of the process are measured over
+several runs, the medians are compared with the stored baseline.
+
+Usage:
+    python tests/benchmark/startup_benchmark.py                     --  Fails if a phase regressed past the baseline.
+    python tests/benchmark/startup_benchmark.py --update-baseline   --  Stores the measured medians as the baseline.
+
+A phase regresses when its median exceeds the baseline by more than the tolerance, as a fraction of the baseline,
+plus the slack in seconds, so that the noise of the short phases doesn't fail the benchmark. The exit status is 1 on
+a regression & 2 if a module couldn't be benchmarked.
+
+Functions:
+    parse_args()        --  Parses the command line.
+    module_names()      --  Returns the names of the modules under plugins/modules.
+    collection_path()   --  Creates the ansible_collections tree the modules are imported from.
+    run_module()        --  Runs a module once & returns its start-up phases with the wall time.
+    benchmark()         --  Returns the median start-up phases of every module.
+    compare()           --  Returns the phases regressed past the baseline.
+    main()              --  Runs the benchmark & checks or updates the baseline.
+
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+from stand_in_webserver import StandInWebServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MODULES_DIR = os.path.join(REPO_ROOT, 'plugins', 'modules')
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'startup_baseline.json')
+BASELINE_VERSION = 1
+
+RUNS = 5
+TOLERANCE = 0.5
+SLACK = 0.05
+RUN_TIMEOUT = 120
+
+# Arguments of each module, the login arguments & session_id are added by the benchmark. Every module needs a case,
+# the arguments only have to take the module past its first API call.
+MODULE_ARGS = {
+    'login': {'commcell_username': 'admin', 'commcell_password': 'password'},
+    'request': {'method': 'GET', 'url': 'CommServ'},
+    'deployment/download_software': {'wait_for_job_completion': False},
+    'deployment/install_software': {'os_type': 'unix', 'client_computers': ['standin'],
+                                    'wait_for_job_completion': False},
+    'deployment/push_updates': {'client_names': ['standin'], 'wait_for_job_completion': False},
+    'file_servers/backup': {'client': 'standin'},
+    'file_servers/browse': {'client': 'standin', 'dest': '{tmp}/browse.jsonl'},
+    'file_servers/manage_content': {'client': 'standin', 'update': {'content': ['/data']}},
+    'file_servers/manage_plan': {'client': 'standin', 'plan': 'standin'},
+    'file_servers/restore': {'client': 'standin', 'content': ['/data']},
+    'job/analytics': {},
+    'job/facts': {'limit': 10},
+    'job/kill': {'job_id': 1},
+    'job/poll': {'job_handle': '{tmp}/job_handle.json'},
+    'job/resume': {'job_id': 1},
+    'job/status': {'job_id': 1},
+    'job/suspend': {'job_id': 1},
+    'job/wait': {'job_ids': [1]},
+    'plans/add': {'name': 'standin', 'storage_pool_name': 'standin'},
+    'plans/delete': {'name': 'standin'},
+    'storage/disk/add': {'name': 'standin', 'media_agent': 'standin', 'mount_path': '/standin',
+                         'deduplication_db_path': '/standin'},
+    'storage/disk/detail': {'name': 'standin'},
+    'workflow/deploy': {'workflow_name': 'standin', 'workflow_engine': 'standin',
+                        'workflow_xml_path': '{tmp}/workflow.xml'},
+    'workflow/execute': {'workflow_name': 'standin', 'wait_for_job_completion': False},
+    'workflow/export': {'workflow_name': 'standin', 'export_location': '{tmp}'},
+    'workflow/import': {'workflow_xml_path': '{tmp}/workflow.xml'},
+    'logout': {},
+}
+
+
+def parse_args():
+    """Parses the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark of the cold start of the modules of the collection.")
+    parser.add_argument('--runs', type=int, default=RUNS, help="Runs of each module, the median is kept.")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help="Regression allowed, as a fraction of the baseline of the phase.")
+    parser.add_argument('--slack', type=float, default=SLACK,
+                        help="Regression allowed in seconds, on top of the tolerance.")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="Path of the baseline file.")
+    parser.add_argument('--update-baseline', action='store_true', help="Store the medians as the baseline.")
+    parser.add_argument('--module', action='append', dest='modules',
+                        help="Benchmark only the given module, e.g. job/status. Can be repeated.")
+    return parser.parse_args()
+
+
+def module_names():
+    """Returns the names of the modules under plugins/modules, e.g. job/status, login first & logout last."""
+    names = []
+    for directory, _, files in os.walk(MODULES_DIR):
+        for name in files:
+            if name.endswith('.py') and name != '__init__.py':
+                path = os.path.relpath(os.path.join(directory, name), MODULES_DIR)
+                names.append(path[:-3].replace(os.sep, '/'))
+
+    return sorted(names, key=lambda name: (name != 'login', name == 'logout', name))
+
+
+def collection_path(tmp):
+    """Creates the ansible_collections tree the modules are imported from, linking the repository as
+    commvault.ansible, & returns the path to add to PYTHONPATH."""
+    namespace = os.path.join(tmp, 'collections', 'ansible_collections', 'commvault')
+    os.makedirs(namespace)
+    os.symlink(REPO_ROOT, os.path.join(namespace, 'ansible'))
+    return os.path.join(tmp, 'collections')
+
+
+def run_module(name, args, env):
+    """Runs a module once in a new interpreter & returns its start-up phases with the wall time of the process.
+
+        Args:
+            name    (str)   --  Name of the module, e.g. job/status.
+
+            args    (dict)  --  Arguments of the module.
+
+            env     (dict)  --  Environment of the process.
+
+        Returns:
+            dict - {phase: seconds}
+
+        Raises:
+            Exception if the module didn't report its start-up profile.
+
+    """
+    stdin = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    started = perf_counter()
+    process = subprocess.run(
+        [sys.executable, os.path.join(MODULES_DIR, f"{name}.py")], input=stdin, env=env,
+        capture_output=True, text=True, timeout=RUN_TIMEOUT
+    )
+    wall = perf_counter() - started
+
+    try:
+        result = json.loads(process.stdout.strip().splitlines()[-1])
+    except (ValueError, IndexError):
+        raise Exception(f"{name} returned no result: {(process.stderr or process.stdout).strip()[-500:]}")
+
+    if 'startup_profile' not in result:
+        raise Exception(f"{name} returned no startup_profile: {result.get('msg')}")
+
+    phases = dict(result['startup_profile'])
+    phases['wall'] = wall
+    return phases
+
+
+def benchmark(names, runs):
+    """Returns the median start-up phases of every module, the modules are run against the stand-in Web Server.
+
+        Args:
+            names   (list)  --  Names of the modules.
+
+            runs    (int)   --  Runs of each module.
+
+        Returns:
+            tuple - ({module: {phase: seconds}}, {module: error})
+
+    """
+    server = StandInWebServer()
+    server.start()
+    results, errors = {}, {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        collections = collection_path(tmp)
+        env = dict(os.environ, CV_ANSIBLE_PROFILE='1', PYTHONPATH=os.pathsep.join(
+            [collections] + [path for path in [os.environ.get('PYTHONPATH')] if path]
+        ))
+
+        sys.path.insert(0, collections)
+        from ansible_collections.commvault.ansible.plugins.module_utils.job_handle import JobHandle
+        from ansible_collections.commvault.ansible.plugins.module_utils.login.pre_login import FILE_PATH
+
+        session_id = f"startup_benchmark_{os.getpid()}"
+        login_args = {'webserver_hostname': server.hostname, 'session_id': session_id}
+        with open(os.path.join(tmp, 'workflow.xml'), 'w') as fh:
+            fh.write('<Workflow_WorkflowDefinition name="standin"/>')
+
+        # Every module but login resumes the session saved by the login.
+        run_module('login', dict(login_args, **MODULE_ARGS['login']), env)
+        JobHandle(os.path.join(tmp, 'job_handle.json')).save(1, FILE_PATH.format(SESSION_ID=session_id), 'backup')
+
+        try:
+            for name in names:
+                if name not in MODULE_ARGS:
+                    errors[name] = "No arguments in MODULE_ARGS"
+                    continue
+
+                args = json.loads(json.dumps(MODULE_ARGS[name]).replace('{tmp}', tmp))
+                if name == 'login':
+                    args.update(login_args)
+                elif name != 'job/poll':
+                    # job.poll resumes the session named in the job handle.
+                    args['session_id'] = session_id
+                try:
+                    samples = [run_module(name, args, env) for _ in range(runs)]
+                except Exception as e:
+                    errors[name] = str(e)
+                    continue
+
+                phases = set().union(*samples)
+                results[name] = {
+                    phase: round(statistics.median(sample.get(phase, 0) for sample in samples), 6)
+                    for phase in sorted(phases)
+                }
+        finally:
+            if 'logout' not in names:
+                run_module('logout', {'session_id': session_id}, env)
+            server.stop()
+
+    return results, errors
+
+
+def compare(results, baseline, tolerance, slack):
+    """Returns the phases regressed past the baseline.
+
+        Args:
+            results     (dict)  --  {module: {phase: seconds}} measured.
+
+            baseline    (dict)  --  {module: {phase: seconds}} stored.
+
+            tolerance   (float) --  Regression allowed, as a fraction of the baseline of the phase.
+
+            slack       (float) --  Regression allowed in seconds, on top of the tolerance.
+
+        Returns:
+            list - (module, phase, baseline seconds, measured seconds) of each regressed phase.
+
+    """
+    regressions = []
+    for name, phases in results.items():
+        for phase, seconds in phases.items():
+            if phase == 'interpreter' or phase not in baseline.get(name, {}):
+                # The age of the process at the first import also counts the time spent before exec, not guarded.
+                continue
+            limit = baseline[name][phase] * (1 + tolerance) + slack
+            if seconds > limit:
+                regressions.append((name, phase, baseline[name][phase], seconds))
+
+    return regressions
+
+
+def main():
+    """Runs the benchmark & checks or updates the baseline, returns the exit status."""
+    options = parse_args()
+
+    names = module_names()
+    if options.modules:
+        names = [name for name in names if name in options.modules]
+
+    results, errors = benchmark(names, max(1, options.runs))
+
+    print(f"{'module':32} {'phase':18} {'seconds':>10}")
+    for name, phases in results.items():
+        for phase, seconds in phases.items():
+            print(f"{name:32} {phase:18} {seconds:10.4f}")
+    for name, error in errors.items():
+        print(f"ERROR {name}: {error}", file=sys.stderr)
+
+    if options.update_baseline:
+        if errors:
+            print("The baseline was not updated, every module must be benchmarked.", file=sys.stderr)
+            return 2
+        with open(options.baseline, 'w') as fh:
+            json.dump({'version': BASELINE_VERSION, 'python': sys.version.split()[0], 'runs': options.runs,
+                       'modules': results}, fh, indent=2, sort_keys=True)
+            fh.write('\n')
+        print(f"Baseline saved to {options.baseline}")
+        return 0
+
+    with open(options.baseline) as fh:
+        baseline = json.load(fh)
+    if baseline.get('version') != BASELINE_VERSION:
+        print(f"{options.baseline} is not a baseline of version {BASELINE_VERSION}", file=sys.stderr)
+        return 2
+
+    missing = [name for name in results if name not in baseline['modules']]
+    for name in missing:
+        print(f"ERROR {name}: no baseline, run with --update-baseline", file=sys.stderr)
+
+    regressions = compare(results, baseline['modules'], options.tolerance, options.slack)
+    for name, phase, expected, seconds in regressions:
+        print(f"REGRESSION {name} {phase}: {seconds:.4f}s, baseline {expected:.4f}s", file=sys.stderr)
+
+    if errors or missing:
+        return 2
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Checks that SessionAgentClient only falls back to a direct request when the daemon can't be connected to."""
+
+import os
+import socket
+import threading
+
+import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from ansible_collections.commvault.ansible.plugins.module_utils.login.session_agent import SessionAgentClient
+
+
+class FakeCVPySDK:
+    """CVPySDK object counting the direct requests."""
+
+    _verify_ssl = True
+    _certificate_path = None
+
+    def __init__(self):
+        self.direct_requests = []
+
+    def _request(self, **kwargs):
+        self.direct_requests.append(kwargs)
+        return 'direct'
+
+
+def hang_up_daemon(socket_path, received):
+    """Daemon reading a single request & closing the connection without a reply."""
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(1)
+
+    def serve():
+        connection, _ = server.accept()
+        with connection, connection.makefile('rb') as fh:
+            received.append(fh.readline())
+        server.close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    return thread
+
+
+REQUEST = {'method': 'POST', 'url': 'https://webserver/commandcenter/api/CreateTask', 'headers': {}, 'json': {}}
+
+
+def test_no_reply_is_not_replayed(tmp_path):
+    """A request sent to the daemon which doesn't reply raises, it is not sent again directly."""
+    socket_path = str(tmp_path / 'agent.sock')
+    received = []
+    thread = hang_up_daemon(socket_path, received)
+    cvpysdk_object = FakeCVPySDK()
+
+    with pytest.raises(RequestsConnectionError):
+        SessionAgentClient(socket_path, cvpysdk_object).request(**REQUEST)
+
+    thread.join(timeout=5)
+    assert len(received) == 1
+    assert not cvpysdk_object.direct_requests
+
+
+def test_unreachable_daemon_falls_back(tmp_path):
+    """A daemon which can't be connected to falls back to a direct request."""
+    socket_path = str(tmp_path / 'agent.sock')
+    with open(socket_path, 'w'):
+        pass
+    cvpysdk_object = FakeCVPySDK()
+
+    assert SessionAgentClient(socket_path, cvpysdk_object).request(**REQUEST) == 'direct'
+    assert len(cvpysdk_object.direct_requests) == 1
+    os.remove(socket_path)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Checks that a 401 on the renewal or login request of TokenRenewal fails instead of deadlocking."""
+
+import threading
+
+import pytest
+from cvpysdk.exception import SDKException
+
+from ansible_collections.commvault.ansible.plugins.module_utils.login.token_renewal import TokenRenewal
+
+
+class FakeCVPySDK:
+    """CVPySDK object whose renewal & login requests get a 401, which calls the installed renewal again."""
+
+    def __init__(self, commcell, login_refused):
+        self.commcell = commcell
+        self.login_refused = login_refused
+
+    def _request_401(self):
+        # make_request() of CVPySDK renews the token on a 401 before replaying the request.
+        self._renew_login_token()
+        raise AssertionError("The request is not replayed")
+
+    def _renew_login_token(self):
+        return self._request_401()
+
+    def _login(self):
+        if self.login_refused:
+            return self._request_401()
+        self.commcell._headers['Authtoken'] = 'QSDK renewed'
+        return 'QSDK renewed'
+
+
+class FakeCommcell:
+
+    def __init__(self, login_refused=False):
+        self._headers = {'Authtoken': 'QSDK expired'}
+        self._user = self._password = None
+        self._cvpysdk_object = FakeCVPySDK(self, login_refused)
+
+
+def renew(commcell):
+    """Renews the token on a daemon thread, a deadlock fails the test instead of hanging it."""
+    renewal = TokenRenewal(commcell, 'admin', 'cGFzc3dvcmQ=').install()
+    outcome = {}
+
+    def run():
+        try:
+            outcome['token'] = renewal.renew()
+        except Exception as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive(), "renew() deadlocked"
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['token']
+
+
+def test_refused_renewal_falls_back_to_login():
+    """A 401 on the renewal request fails that renewal, the token is then renewed by a login."""
+    commcell = FakeCommcell()
+
+    assert renew(commcell) == 'QSDK renewed'
+    assert commcell._user is None and commcell._password is None
+
+
+def test_refused_login_is_raised():
+    """A 401 on the login request of the renewal is raised."""
+    with pytest.raises(SDKException):
+        renew(FakeCommcell(login_refused=True))
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Checks the choice tables of module_utils/constants.py against the enums of the installed CVPySDK they replace."""
+
+import pytest
+from cvpysdk.deployment import deploymentconstants
+
+from ansible_collections.commvault.ansible.plugins.module_utils import constants
+
+
+@pytest.mark.parametrize('table, enum', [
+    ('DOWNLOAD_OPTIONS', 'DownloadOptions'),
+    ('DOWNLOAD_PACKAGES', 'DownloadPackages'),
+    ('WINDOWS_DOWNLOAD_FEATURES', 'WindowsDownloadFeatures'),
+    ('UNIX_DOWNLOAD_FEATURES', 'UnixDownloadFeatures'),
+])
+def test_table_matches_cvpysdk(table, enum):
+    """The table lists the names of the members of the enum, in the order of the enum."""
+    assert getattr(constants, table) == [member.name for member in getattr(deploymentconstants, enum)]
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Checks that JobManager.wait() keeps polling the jobs whose query failed."""
+
+from ansible_collections.commvault.ansible.plugins.module_utils.job_manager import (
+    UNKNOWN_STATUS,
+    JobManager
+)
+
+
+class ScriptedJobManager(JobManager):
+    """JobManager answering each poll of a job with the next entry of its script, an exception is raised."""
+
+    def __init__(self, scripts):
+        super().__init__(commcell=None)
+        self.scripts = {job_id: list(script) for job_id, script in scripts.items()}
+        self.polls = {job_id: 0 for job_id in scripts}
+
+    def get_summary(self, job_id, attempts=3):
+        self.polls[job_id] += 1
+        script = self.scripts[job_id]
+        answer = script.pop(0) if len(script) > 1 else script[0]
+        if isinstance(answer, Exception):
+            raise answer
+        return {'jobId': job_id, 'status': answer}
+
+
+def wait(manager, job_ids, **kwargs):
+    return manager.wait(job_ids, poll_interval=0, max_poll_interval=0, **kwargs)
+
+
+def test_transient_error_is_retried():
+    """A job whose query fails once is polled again & its final state is reported."""
+    manager = ScriptedJobManager({1: ['Running', Exception('Read timed out'), 'Running', 'Completed']})
+
+    states, errors, timed_out = wait(manager, [1])
+
+    assert states[1]['status'] == 'Completed' and states[1]['successful']
+    assert not errors and not timed_out
+    assert manager.polls[1] == 4
+
+
+def test_repeated_errors_give_up_as_unknown():
+    """A job failing max_errors polls in a row is no longer waited for & is reported unknown."""
+    manager = ScriptedJobManager({
+        1: ['Running', Exception('Bad gateway')],
+        2: ['Running', 'Running', 'Running', 'Completed']
+    })
+
+    states, errors, timed_out = wait(manager, [1, 2], max_errors=3)
+
+    assert manager.polls[1] == 4
+    assert errors == {1: 'Bad gateway'}
+    assert states[1]['status'] == UNKNOWN_STATUS and not states[1]['finished']
+    assert states[2]['status'] == 'Completed'
+    assert not timed_out
+
+
+def test_successful_poll_resets_error_budget():
+    """The error budget counts the failed polls in a row, a successful poll resets it."""
+    error = Exception('Connection reset')
+    manager = ScriptedJobManager({1: [error, error, 'Running', error, error, 'Completed']})
+
+    states, errors, _ = wait(manager, [1], max_errors=3)
+
+    assert states[1]['status'] == 'Completed' and not errors
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""Checks that each restore job started by the restore module carries its own paths & destination."""
+
+import itertools
+import time
+
+import pytest
+
+from ansible_collections.commvault.ansible.plugins.modules.file_servers.restore import start_restores
+
+
+class FakeJob:
+    """Job started by the fake subclient."""
+
+    def __init__(self, job_id):
+        self.job_id = job_id
+
+
+class FakeSubclient:
+    """Subclient building its restore requests like CVPySDK, in attributes shared by the subclient objects.
+
+    The attributes are read back after a delay, so that requests built at the same time mix their content.
+    """
+
+    def __init__(self):
+        self.job_ids = itertools.count(1)
+        self.requests = []
+        self._paths = None
+        self._destination = None
+
+    def _post(self, paths, destination):
+        self._paths, self._destination = paths, destination
+        time.sleep(0.01)
+        self.requests.append({'paths': self._paths, 'destination': self._destination})
+        return FakeJob(next(self.job_ids))
+
+    def restore_in_place(self, paths, overwrite, copy_precedence, fs_options):
+        return self._post(paths, None)
+
+    def restore_out_of_place(self, client, destination_path, paths, overwrite, copy_precedence, fs_options):
+        return self._post(paths, (client, destination_path))
+
+
+@pytest.mark.parametrize('count', [2, 4, 8])
+def test_each_destination_gets_its_own_request(count):
+    """Every job request carries the paths of its split & its own destination."""
+    subclient = FakeSubclient()
+    splits = [[f"/data/{index}"] for index in range(count)]
+    targets = [(f"client{index % 2}", f"/restore/{index}") for index in range(count)]
+
+    jobs, errors = start_restores(subclient, splits, targets, in_place=False)
+
+    assert not errors
+    assert [job.job_id for job in jobs] == list(range(1, count + 1))
+    assert subclient.requests == [
+        {'paths': split, 'destination': target} for split, target in zip(splits, targets)
+    ]
+
+
+def test_split_in_place():
+    """The splits restored in place keep their own paths."""
+    subclient = FakeSubclient()
+    splits = [['/a', '/b'], ['/c'], ['/d']]
+
+    jobs, errors = start_restores(subclient, splits, [(None, None)] * len(splits), in_place=True)
+
+    assert not errors and len(jobs) == len(splits)
+    assert [request['paths'] for request in subclient.requests] == splits
+
+
+def test_failed_start_is_reported():
+    """A job failing to start is reported, the other jobs are still started."""
+    subclient = FakeSubclient()
+    post = subclient._post
+
+    def failing_post(paths, destination):
+        if paths == ['/b']:
+            raise Exception('Restore job failed')
+        return post(paths, destination)
+
+    subclient._post = failing_post
+    jobs, errors = start_restores(subclient, [['/a'], ['/b'], ['/c']], [(None, '/r')] * 3, in_place=False)
+
+    assert len(jobs) == 2 and errors == ['Restore job failed']